@@ -3,6 +3,7 @@
 import copy
 import os
 import sys
+import json
 import time
 import inspect
 import logging
@@ -17,7 +18,7 @@ import appdirs
 import ayon_api
 
 from ayon_core import AYON_CORE_ROOT
-from ayon_core.lib import Logger, is_dev_mode_enabled
+from ayon_core.lib import Logger, is_dev_mode_enabled, env_value_to_bool
 from ayon_core.settings import get_studio_settings
 
 from .interfaces import (
@@ -118,6 +119,8 @@ class _ModuleClass(object):
 class _LoadCache:
     addons_lock = threading.Lock()
     addons_loaded = False
+    # Time spent on loading of addons by addon class name
+    report = {}
 
 
 def load_addons(force=False):
@@ -147,6 +150,141 @@ def load_addons(force=False):
             time.sleep(0.1)
 
 
+class _AddonsManifest:
+    """Cached information about discovered addons of a bundle.
+
+    Manifest stores which module of addon directory contains the addon and
+    which addon classes it provides. With the information addon modules
+    don't have to be discovered by importing all content of addon
+    directory, only the addon module is imported.
+
+    Manifest is stored per bundle and is invalidated when versions of addons
+    in the bundle or addons directory change.
+
+    Args:
+        bundle_name (str): Bundle name.
+        addons_dir (str): Directory where addons are stored.
+        addons_versions (dict[str, str]): Versions of addons in bundle.
+    """
+
+    def __init__(self, bundle_name, addons_dir, addons_versions):
+        self._bundle_name = bundle_name
+        self._addons_dir = addons_dir
+        self._addons_versions = addons_versions
+        self._data = None
+        self._addons = None
+        self._changed = False
+
+    @staticmethod
+    def get_filepath():
+        return os.path.join(
+            appdirs.user_data_dir("AYON", "Ynput"),
+            "addons_manifest.json"
+        )
+
+    def _load(self):
+        if self._data is not None:
+            return
+        self._data = {}
+        self._addons = {}
+        filepath = self.get_filepath()
+        if not self._bundle_name or not os.path.exists(filepath):
+            return
+
+        try:
+            with open(filepath, "r") as stream:
+                data = json.load(stream)
+        except Exception:
+            return
+
+        self._data = data
+        bundle_data = data.get(self._bundle_name)
+        if (
+            bundle_data
+            and bundle_data.get("addons_dir") == self._addons_dir
+            and bundle_data.get("versions") == self._addons_versions
+        ):
+            self._addons = bundle_data.get("addons") or {}
+
+    def get(self, addon_name):
+        """Cached information about addon.
+
+        Args:
+            addon_name (str): Addon name.
+
+        Returns:
+            Union[dict[str, Any], None]: Addon information with 'addon_dir',
+                'module', 'alias' and 'classes' keys.
+        """
+
+        self._load()
+        return self._addons.get(addon_name)
+
+    def set(self, addon_name, addon_dir, module_name, alias, class_names):
+        self._load()
+        self._addons[addon_name] = {
+            "addon_dir": addon_dir,
+            "module": module_name,
+            "alias": alias,
+            "classes": list(class_names),
+        }
+        self._changed = True
+
+    def save(self):
+        if not self._changed or not self._bundle_name:
+            return
+
+        self._data[self._bundle_name] = {
+            "addons_dir": self._addons_dir,
+            "versions": self._addons_versions,
+            "addons": self._addons,
+        }
+        filepath = self.get_filepath()
+        tmp_path = "{}.{}".format(filepath, uuid4().hex)
+        try:
+            dirpath = os.path.dirname(filepath)
+            if not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+            with open(tmp_path, "w") as stream:
+                json.dump(self._data, stream, indent=4)
+            os.replace(tmp_path, filepath)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._changed = False
+
+
+def _import_addon_module(module_name, dirpath):
+    """Import addon module stored in addons manifest.
+
+    Args:
+        module_name (str): Name of module.
+        dirpath (str): Directory where module is located.
+
+    Returns:
+        Union[types.ModuleType, None]: Module or None if module was not
+            found.
+    """
+
+    for name in (module_name, "{}.py".format(module_name)):
+        if os.path.exists(os.path.join(dirpath, name)):
+            break
+    else:
+        return None
+
+    return __import__(module_name, fromlist=("",))
+
+
+def _get_addon_classes_from_module(module):
+    return [
+        attr_name
+        for attr_name, attr in inspect.getmembers(module, inspect.isclass)
+        if issubclass(attr, AYONAddon)
+        and attr not in (AYONAddon, OpenPypeModule, OpenPypeAddOn)
+    ]
+
+
 def _get_ayon_bundle_data():
     bundles = ayon_api.get_bundles()["bundles"]
 
@@ -231,6 +369,15 @@ def _load_ayon_addons(openpype_modules, modules_key, log):
         # Get dev addons info only when dev mode is enabled
         dev_addons_info = bundle_info.get("addonDevelopment", dev_addons_info)
 
+    manifest = _AddonsManifest(
+        bundle_info["name"],
+        addons_dir,
+        {
+            addon_info["name"]: addon_info["version"]
+            for addon_info in addons_info
+        }
+    )
+
     addons_dir_exists = os.path.exists(addons_dir)
     if not addons_dir_exists:
         log.warning("Addons directory does not exists. Path \"{}\"".format(
@@ -269,8 +416,42 @@ def _load_ayon_addons(openpype_modules, modules_key, log):
         if not addon_dir:
             continue
 
+        time_start = time.time()
         sys.path.insert(0, addon_dir)
+
+        # Use cached information about addon content and import only the
+        #   addon module
+        # - dev addons are always discovered as their content can change
+        addon_manifest = None
+        if not use_dev_path:
+            addon_manifest = manifest.get(addon_name)
+
+        if addon_manifest and addon_manifest["addon_dir"] == addon_dir:
+            mod = None
+            try:
+                mod = _import_addon_module(
+                    addon_manifest["module"], addon_dir
+                )
+            except BaseException:
+                log.warning(
+                    "Failed to import \"{}\"".format(
+                        addon_manifest["module"]
+                    ),
+                    exc_info=True
+                )
+
+            if mod is not None:
+                addon_alias = addon_manifest["alias"]
+                addons_to_skip_in_core.append(addon_alias)
+                new_import_str = "{}.{}".format(modules_key, addon_alias)
+                sys.modules[new_import_str] = mod
+                setattr(openpype_modules, addon_alias, mod)
+                for class_name in addon_manifest["classes"]:
+                    _LoadCache.report[class_name] = time.time() - time_start
+                continue
+
         imported_modules = []
+        addon_class_names = []
         for name in os.listdir(addon_dir):
             # Ignore of files is implemented to be able to run code from code
             #   where usually is more files than just the addon
@@ -291,14 +472,10 @@ def _load_ayon_addons(openpype_modules, modules_key, log):
 
             try:
                 mod = __import__(basename, fromlist=("",))
-                for attr_name in dir(mod):
-                    attr = getattr(mod, attr_name)
-                    if (
-                        inspect.isclass(attr)
-                        and issubclass(attr, AYONAddon)
-                    ):
-                        imported_modules.append(mod)
-                        break
+                class_names = _get_addon_classes_from_module(mod)
+                if class_names:
+                    imported_modules.append(mod)
+                    addon_class_names = class_names
 
             except BaseException:
                 log.warning(
@@ -333,6 +510,23 @@ def _load_ayon_addons(openpype_modules, modules_key, log):
         sys.modules[new_import_str] = mod
         setattr(openpype_modules, addon_alias, mod)
 
+        for class_name in addon_class_names:
+            _LoadCache.report[class_name] = time.time() - time_start
+
+        if not use_dev_path:
+            manifest.set(
+                addon_name,
+                addon_dir,
+                mod.__name__,
+                addon_alias,
+                addon_class_names
+            )
+
+    try:
+        manifest.save()
+    except Exception:
+        log.warning("Failed to store addons manifest.", exc_info=True)
+
     return addons_to_skip_in_core
 
 
@@ -709,6 +903,8 @@ class AddonsManager:
         if initialize:
             self.initialize_addons()
             self.connect_addons()
+            if env_value_to_bool("AYON_ADDONS_STARTUP_REPORT"):
+                self.print_report()
 
     def __getitem__(self, addon_name):
         return self._addons_by_name[addon_name]
@@ -887,6 +1083,12 @@ class AddonsManager:
             )
 
         if self._report is not None:
+            if _LoadCache.report:
+                load_report = dict(_LoadCache.report)
+                load_report[self._report_total_key] = sum(
+                    load_report.values()
+                )
+                self._report["Load"] = load_report
             report[self._report_total_key] = time.time() - time_start
             self._report["Initialization"] = report
 
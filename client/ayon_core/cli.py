@@ -113,13 +113,27 @@ def extractenvironments(output_json_path, project, asset, task, app, envgroup):
               multiple=True)
 @click.option("-g", "--gui", is_flag=True,
               help="Show Publish UI", default=False)
-def publish(path, targets, gui):
+@click.option("--trace-output", default=None,
+              envvar="AYON_PUBLISH_TRACE_OUTPUT",
+              help="Store timing of plugins in Chrome trace format")
+def publish(path, targets, gui, trace_output):
     """Start CLI publishing.
 
     Publish collects json from path provided as an argument.
 S
     """
-    Commands.publish(path, targets, gui)
+    Commands.publish(path, targets, gui, trace_output)
+
+
+@main_cli.command()
+@click.argument("report_path", required=True)
+@click.argument("output_path", required=True)
+def publish_report_trace(report_path, output_path):
+    """Store timing profile of publish report in Chrome trace format.
+
+    Output can be opened in 'chrome://tracing' or Perfetto UI.
+    """
+    Commands.publish_report_trace(report_path, output_path)
 
 
 @main_cli.command(context_settings={"ignore_unknown_options": True})
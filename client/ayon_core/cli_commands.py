@@ -41,7 +41,12 @@ class Commands:
         return click_func
 
     @staticmethod
-    def publish(path: str, targets: list=None, gui:bool=False) -> None:
+    def publish(
+        path: str,
+        targets: list=None,
+        gui:bool=False,
+        trace_output: str=None,
+    ) -> None:
         """Start headless publishing.
 
         Publish use json from passed path argument.
@@ -50,6 +55,8 @@ class Commands:
             path (str): Path to JSON.
             targets (list of str): List of pyblish targets.
             gui (bool): Show publish UI.
+            trace_output (str): Path where timing profile of publish
+                plugins is stored in Chrome trace format.
 
         Raises:
             RuntimeError: When there is no path to process.
@@ -63,6 +70,11 @@ class Commands:
             install_ayon_plugins,
             get_global_context,
         )
+        from ayon_core.pipeline.publish import (
+            publish_iter,
+            get_result_profile_item,
+            write_chrome_trace,
+        )
 
         # Register target and host
         import pyblish.util
@@ -134,14 +146,48 @@ class Commands:
             error_format = ("Failed {plugin.__name__}: "
                             "{error} -- {error.traceback}")
 
-            for result in pyblish.util.publish_iter():
+            profile_items = []
+            for result in publish_iter():
+                profile_item = get_result_profile_item(result)
+                if profile_item is not None:
+                    profile_items.append(profile_item)
+
                 if result["error"]:
                     log.error(error_format.format(**result))
+                    if trace_output:
+                        write_chrome_trace(profile_items, trace_output)
                     # uninstall()
                     sys.exit(1)
 
+            if trace_output:
+                write_chrome_trace(profile_items, trace_output)
+                log.info("Publish trace stored to {}".format(trace_output))
+
         log.info("Publish finished.")
 
+    @staticmethod
+    def publish_report_trace(report_path, output_path):
+        """Store timing profile from publish report in Chrome trace format.
+
+        Args:
+            report_path (str): Path to publish report JSON.
+            output_path (str): Path to output JSON file.
+        """
+        import json
+
+        from ayon_core.pipeline.publish import (
+            get_report_profile_items,
+            write_chrome_trace,
+        )
+
+        with open(report_path, "r") as stream:
+            report_data = json.load(stream)
+
+        profile_items = get_report_profile_items(report_data)
+        if not profile_items:
+            print("Publish report does not contain timing profile.")
+        write_chrome_trace(profile_items, output_path)
+
     @staticmethod
     def extractenvironments(
         output_json_path, project, asset, task, app, env_group
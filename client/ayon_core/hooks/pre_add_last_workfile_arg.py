@@ -1,6 +1,5 @@
-import os
-
 from ayon_applications import PreLaunchHook, LaunchTypes
+from ayon_core.pipeline.workfile import workdir_file_exists
 
 
 class AddLastWorkfileToLaunchArgs(PreLaunchHook):
@@ -42,7 +41,8 @@ class AddLastWorkfileToLaunchArgs(PreLaunchHook):
             self.log.warning("Last workfile was not collected.")
             return
 
-        if not os.path.exists(last_workfile):
+        # Listing of workdir is cached from last workfile resolving
+        if not workdir_file_exists(last_workfile):
             self.log.info("Current context does not have any workfile yet.")
             return
 
@@ -206,11 +206,11 @@ def ls():
         print("Not connected yet, ignoring")
         return
 
-    layers_meta = stub.get_metadata()
+    metadata_session = stub.metadata_session()
     for item in stub.get_items(comps=True,
                                folders=True,
                                footages=True):
-        data = stub.read(item, layers_meta)
+        data = metadata_session.read(item)
         # Skip non-tagged layers.
         if not data:
             continue
@@ -9,6 +9,9 @@ import attr
 
 from wsrpc_aiohttp import WebSocketAsync
 from ayon_core.tools.adobe_webserver.app import WebServerTool
+from ayon_core.tools.adobe_webserver.metadata_session import (
+    BaseMetadataSession
+)
 
 
 class ConnectionNotEstablishedYet(Exception):
@@ -42,6 +45,38 @@ class AEItem(object):
     containing_comps = attr.ib(factory=list)
 
 
+class AEMetadataSession(BaseMetadataSession):
+    """Metadata of active document stored in Label of the document.
+
+    Args:
+        stub (AfterEffectsServerStub): Stub used to read and store
+            metadata.
+        items_meta (Optional[list[dict]]): Already loaded metadata, loaded
+            from document if not passed.
+        all_items (Optional[list[AEItem]]): Items of document used to
+            remove metadata of non-existing items on commit. Loaded on
+            commit if not passed.
+    """
+
+    def _load_items_meta(self):
+        return self._stub.get_metadata()
+
+    def _load_all_items(self):
+        # loaders create FootageItem now
+        return self._stub.get_items(comps=True, folders=True, footages=True)
+
+    def _store_items(self, items):
+        payload = json.dumps(items, indent=4)
+        res = self._stub.websocketserver.call(
+            self._stub.client.call('AfterEffects.imprint', payload=payload)
+        )
+        return self._stub._handle_return(res)
+
+    def _is_readable(self, item_meta):
+        # Only containers are read by items
+        return "container" in (item_meta.get("id") or "")
+
+
 class AfterEffectsServerStub():
     """
         Stub for calling function on client (Photoshop js) side.
@@ -136,49 +171,29 @@ class AfterEffectsServerStub():
                            loop - value should be same)
         Returns: None
         """
-        if not items_meta:
-            items_meta = self.get_metadata()
-
-        result_meta = []
-        # fix existing
-        is_new = True
-
-        for item_meta in items_meta:
-            if ((item_meta.get('members') and
-                    str(item_id) == str(item_meta.get('members')[0])) or
-                    item_meta.get("instance_id") == item_id):
-                is_new = False
-                if data:
-                    item_meta.update(data)
-                    result_meta.append(item_meta)
-            else:
-                result_meta.append(item_meta)
-
-        if is_new:
-            result_meta.append(data)
-
-        # Ensure only valid ids are stored.
-        if not all_items:
-            # loaders create FootageItem now
-            all_items = self.get_items(comps=True,
-                                       folders=True,
-                                       footages=True)
-        item_ids = [int(item.id) for item in all_items]
-        cleaned_data = []
-        for meta in result_meta:
-            # do not added instance with nonexistend item id
-            if meta.get("members"):
-                if int(meta["members"][0]) not in item_ids:
-                    continue
-
-            cleaned_data.append(meta)
-
-        payload = json.dumps(cleaned_data, indent=4)
+        session = self.metadata_session(items_meta or None, all_items)
+        session.imprint(item_id, data)
+        return session.commit()
 
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.imprint',
-                                         payload=payload))
-        return self._handle_return(res)
+    def metadata_session(self, items_meta=None, all_items=None):
+        """Session to read and change metadata of active document.
+
+        Metadata are loaded only once and all changes are stored with
+        single call on commit. Use it to change metadata of many items.
+
+        Example:
+            with stub.metadata_session() as session:
+                for instance_id, data in data_by_instance_id.items():
+                    session.imprint(instance_id, data)
+
+        Args:
+            items_meta (Optional[list[dict]]): Already loaded metadata.
+            all_items (Optional[list[AEItem]]): Already loaded items.
+
+        Returns:
+            AEMetadataSession: Metadata session.
+        """
+        return AEMetadataSession(self, items_meta, all_items)
 
     def get_active_document_full_name(self):
         """
@@ -356,22 +371,9 @@ class AfterEffectsServerStub():
             Args:
                 instance_id(string): instance id
         """
-        cleaned_data = []
-
-        if metadata is None:
-            metadata = self.get_metadata()
-
-        for instance in metadata:
-            inst_id = instance.get("instance_id") or instance.get("uuid")
-            if inst_id != instance_id:
-                cleaned_data.append(instance)
-
-        payload = json.dumps(cleaned_data, indent=4)
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.imprint',
-                                         payload=payload))
-
-        return self._handle_return(res)
+        session = self.metadata_session(metadata)
+        session.remove_instance(instance_id)
+        return session.commit()
 
     def is_saved(self):
         # TODO
@@ -196,9 +196,10 @@ def ls():
     if not stub.get_active_document_name():
         return
 
-    layers_meta = stub.get_layers_metadata()  # minimalize calls to PS
+    # minimalize calls to PS
+    metadata_session = stub.metadata_session()
     for layer in stub.get_layers():
-        data = stub.read(layer, layers_meta)
+        data = metadata_session.read(layer)
 
         # Skip non-tagged layers.
         if not data:
@@ -3,10 +3,14 @@
     Used anywhere solution is calling client methods.
 """
 import json
+
 import attr
 from wsrpc_aiohttp import WebSocketAsync
 
 from ayon_core.tools.adobe_webserver.app import WebServerTool
+from ayon_core.tools.adobe_webserver.metadata_session import (
+    BaseMetadataSession
+)
 
 
 @attr.s
@@ -40,6 +44,42 @@ class PSItem(object):
                          .replace(PhotoshopServerStub.LOADED_ICON, ''))
 
 
+class PSMetadataSession(BaseMetadataSession):
+    """Metadata of active document stored in Headline of the document.
+
+    Args:
+        stub (PhotoshopServerStub): Stub used to read and store metadata.
+        items_meta (Optional[list[dict]]): Already loaded metadata, loaded
+            from document if not passed.
+        all_items (Optional[list[PSItem]]): Layers of document used to
+            remove metadata of non-existing layers on commit. Loaded on
+            commit if not passed.
+    """
+
+    def _load_items_meta(self):
+        return self._stub.get_layers_metadata()
+
+    def _load_all_items(self):
+        return self._stub.get_layers()
+
+    def _store_items(self, items):
+        payload = json.dumps(items, indent=4)
+        self._stub.websocketserver.call(
+            self._stub.client.call('Photoshop.imprint', payload=payload)
+        )
+
+    @staticmethod
+    def _get_member_id(item_meta):
+        # 'uuid' is legacy
+        members = item_meta.get("members")
+        if members:
+            return str(members[0])
+        layer_id = item_meta.get("uuid")
+        if layer_id is not None:
+            return str(layer_id)
+        return None
+
+
 class PhotoshopServerStub:
     """
         Stub for calling function on client (Photoshop js) side.
@@ -147,45 +187,28 @@ class PhotoshopServerStub:
                            loop - value should be same)
         Returns: None
         """
-        if not items_meta:
-            items_meta = self.get_layers_metadata()
-
-        # json.dumps writes integer values in a dictionary to string, so
-        # anticipating it here.
-        item_id = str(item_id)
-        is_new = True
-        result_meta = []
-        for item_meta in items_meta:
-            if ((item_meta.get('members') and
-                 item_id == str(item_meta.get('members')[0])) or
-                    item_meta.get("instance_id") == item_id):
-                is_new = False
-                if data:
-                    item_meta.update(data)
-                    result_meta.append(item_meta)
-            else:
-                result_meta.append(item_meta)
-
-        if is_new:
-            result_meta.append(data)
-
-        # Ensure only valid ids are stored.
-        if not all_layers:
-            all_layers = self.get_layers()
-        layer_ids = [layer.id for layer in all_layers]
-        cleaned_data = []
-
-        for item in result_meta:
-            if item.get("members"):
-                if int(item["members"][0]) not in layer_ids:
-                    continue
-
-            cleaned_data.append(item)
-
-        payload = json.dumps(cleaned_data, indent=4)
-        self.websocketserver.call(
-            self.client.call('Photoshop.imprint', payload=payload)
-        )
+        with self.metadata_session(items_meta or None, all_layers) as session:
+            session.imprint(item_id, data)
+
+    def metadata_session(self, items_meta=None, all_layers=None):
+        """Session to read and change metadata of active document.
+
+        Metadata are loaded only once and all changes are stored with
+        single call on commit. Use it to change metadata of many items.
+
+        Example:
+            with stub.metadata_session() as session:
+                for instance_id, data in data_by_instance_id.items():
+                    session.imprint(instance_id, data)
+
+        Args:
+            items_meta (Optional[list[dict]]): Already loaded metadata.
+            all_layers (Optional[list[PSItem]]): Already loaded layers.
+
+        Returns:
+            PSMetadataSession: Metadata session.
+        """
+        return PSMetadataSession(self, items_meta, all_layers)
 
     def get_layers(self):
         """Returns JSON document with all(?) layers in active document.
@@ -508,18 +531,8 @@ class PhotoshopServerStub:
         )
 
     def remove_instance(self, instance_id):
-        cleaned_data = []
-
-        for item in self.get_layers_metadata():
-            inst_id = item.get("instance_id") or item.get("uuid")
-            if inst_id != instance_id:
-                cleaned_data.append(item)
-
-        payload = json.dumps(cleaned_data, indent=4)
-
-        self.websocketserver.call(
-            self.client.call('Photoshop.imprint', payload=payload)
-        )
+        with self.metadata_session() as session:
+            session.remove_instance(instance_id)
 
     def get_extension_version(self):
         """Returns version number of installed extension."""
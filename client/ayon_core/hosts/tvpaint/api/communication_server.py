@@ -11,6 +11,7 @@ import filecmp
 import tempfile
 import threading
 import shutil
+import concurrent.futures
 
 from contextlib import closing
 
@@ -61,6 +62,13 @@ class CommunicationWrapper:
             return
         return cls.communicator.execute_george(george_script)
 
+    @classmethod
+    def execute_george_many(cls, george_scripts):
+        """Execute passed goerge scripts in TVPaint at once."""
+        if not cls.communicator:
+            return
+        return cls.communicator.execute_george_many(george_scripts)
+
 
 class WebSocketServer:
     def __init__(self):
@@ -198,11 +206,16 @@ class WebsocketServerThread(threading.Thread):
 
 
 class BaseTVPaintRpc(JsonRpc):
+    # How often is checked if client is still connected when waiting
+    #   for response
+    connection_check_interval = 0.5
+
     def __init__(self, communication_obj, route_name="", **kwargs):
         super().__init__(**kwargs)
         self.requests_ids = collections.defaultdict(lambda: 0)
-        self.waiting_requests = collections.defaultdict(list)
-        self.responses = collections.defaultdict(list)
+        # Futures waiting for response by client host and request id
+        self.waiting_requests = collections.defaultdict(dict)
+        self._requests_lock = threading.Lock()
 
         self.route_name = route_name
         self.communication_obj = communication_obj
@@ -211,7 +224,7 @@ class BaseTVPaintRpc(JsonRpc):
         # This is duplicated code from super but there is no way how to do it
         # to be able handle server->client requests
         host = http_request.host
-        if host in self.waiting_requests:
+        if self.waiting_requests.get(host):
             try:
                 _raw_message = raw_msg.data
                 msg = decode_msg(_raw_message)
@@ -222,8 +235,12 @@ class BaseTVPaintRpc(JsonRpc):
 
             if msg.type in (JsonRpcMsgTyp.RESULT, JsonRpcMsgTyp.ERROR):
                 msg_data = json.loads(_raw_message)
-                if msg_data.get("id") in self.waiting_requests[host]:
-                    self.responses[host].append(msg_data)
+                with self._requests_lock:
+                    future = self.waiting_requests[host].pop(
+                        msg_data.get("id"), None
+                    )
+                if future is not None:
+                    future.set_result(msg_data)
                     return
 
         return await super()._handle_rpc_msg(http_request, raw_msg)
@@ -243,57 +260,102 @@ class BaseTVPaintRpc(JsonRpc):
         )
 
     def send_request(self, client, method, params=None, timeout=0):
-        if params is None:
-            params = []
+        return self.send_requests(client, [(method, params)], timeout)[0]
 
-        client_host = client.host
+    def send_requests(self, client, requests, timeout=0):
+        """Send multiple requests to client and wait for their responses.
 
-        request_id = self.requests_ids[client_host]
-        self.requests_ids[client_host] += 1
+        All requests are sent at once and client can process them without
+        waiting for each response to be received.
 
-        self.waiting_requests[client_host].append(request_id)
+        Args:
+            client (JsonRpcClient): Client to which are requests sent.
+            requests (Iterable[tuple[str, Union[list, None]]]): Method and
+                params of each request.
+            timeout (Optional[float]): Timeout in seconds for all requests.
+                No timeout is used if is '0'.
 
-        log.debug("Sending request to client {} ({}, {}) id: {}".format(
-            client_host, method, params, request_id
-        ))
-        future = asyncio.run_coroutine_threadsafe(
-            client.ws.send_str(encode_request(method, request_id, params)),
-            loop=self.loop
-        )
-        result = future.result()
+        Returns:
+            list[Any]: Results of requests in the same order. Result is
+                'None' if client was disconnected.
+        """
 
-        not_found = object()
-        response = not_found
-        start = time.time()
-        while True:
-            if client.ws.closed:
-                return None
+        client_host = client.host
+        messages = []
+        futures = []
+        with self._requests_lock:
+            for method, params in requests:
+                if params is None:
+                    params = []
+
+                request_id = self.requests_ids[client_host]
+                self.requests_ids[client_host] += 1
+
+                future = concurrent.futures.Future()
+                self.waiting_requests[client_host][request_id] = future
+                futures.append((request_id, future))
+
+                log.debug(
+                    "Sending request to client {} ({}, {}) id: {}".format(
+                        client_host, method, params, request_id
+                    )
+                )
+                messages.append(encode_request(method, request_id, params))
 
-            for _response in self.responses[client_host]:
-                _id = _response.get("id")
-                if _id == request_id:
-                    response = _response
-                    break
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self._send_messages(client, messages),
+                loop=self.loop
+            ).result()
+
+            start = time.time()
+            responses = []
+            for _, future in futures:
+                responses.append(
+                    self._wait_for_response(client, future, start, timeout)
+                )
 
-            if response is not not_found:
-                break
+        finally:
+            with self._requests_lock:
+                for request_id, _ in futures:
+                    self.waiting_requests[client_host].pop(request_id, None)
+
+        results = []
+        for response in responses:
+            if response is None:
+                results.append(None)
+                continue
+
+            error = response.get("error")
+            if error:
+                raise Exception("Error happened: {}".format(error))
+            results.append(response.get("result"))
+        return results
 
-            if timeout > 0 and (time.time() - start) > timeout:
-                raise Exception("Timeout passed")
-                return
+    @staticmethod
+    async def _send_messages(client, messages):
+        for message in messages:
+            await client.ws.send_str(message)
 
-            time.sleep(0.1)
+    def _wait_for_response(self, client, future, start, timeout):
+        while True:
+            if future.done():
+                return future.result()
 
-        if response is not_found:
-            raise Exception("Connection closed")
+            if client.ws.closed:
+                return None
 
-        self.responses[client_host].remove(response)
+            wait_time = self.connection_check_interval
+            if timeout > 0:
+                remaining = timeout - (time.time() - start)
+                if remaining <= 0:
+                    raise Exception("Timeout passed")
+                wait_time = min(wait_time, remaining)
 
-        error = response.get("error")
-        result = response.get("result")
-        if error:
-            raise Exception("Error happened: {}".format(error))
-        return result
+            try:
+                return future.result(wait_time)
+            except concurrent.futures.TimeoutError:
+                pass
 
 
 class QtTVPaintRpc(BaseTVPaintRpc):
@@ -796,6 +858,23 @@ class BaseCommunicator:
             client, method, params
         )
 
+    def send_requests(self, requests):
+        """Send multiple requests at once.
+
+        Args:
+            requests (Iterable[tuple[str, Union[list, None]]]): Method and
+                params of each request.
+
+        Returns:
+            Union[list[Any], None]: Results of requests or None if client is
+                not connected.
+        """
+        client = self.client()
+        if not client:
+            return
+
+        return self.websocket_rpc.send_requests(client, requests)
+
     def send_notification(self, method, params=None):
         client = self.client()
         if not client:
@@ -811,6 +890,23 @@ class BaseCommunicator:
             "execute_george", [george_script]
         )
 
+    def execute_george_many(self, george_scripts):
+        """Execute multiple george scripts in TVPaint.
+
+        Scripts are sent at once so there is no need to wait for result
+        of each script before sending next one.
+
+        Args:
+            george_scripts (Iterable[str]): George scripts to execute.
+
+        Returns:
+            Union[list[str], None]: Results of scripts in the same order.
+        """
+        return self.send_requests(
+            ("execute_george", [george_script])
+            for george_script in george_scripts
+        )
+
     def execute_george_through_file(self, george_script):
         """Execute george script with temp file.
 
@@ -103,7 +103,9 @@ from .python_module_tools import (
 
 from .profiles_filtering import (
     compile_list_of_regexes,
-    filter_profiles
+    filter_profiles,
+    ProfileMatcher,
+    get_profile_matcher,
 )
 
 from .transcoding import (
@@ -113,6 +115,8 @@ from .transcoding import (
     convert_input_paths_for_ffmpeg,
     get_ffprobe_data,
     get_ffprobe_streams,
+    get_metadata_cache_stats,
+    clear_metadata_cache,
     get_ffmpeg_codec_args,
     get_ffmpeg_format_args,
     convert_ffprobe_fps_value,
@@ -123,6 +127,7 @@ from .transcoding import (
 from .plugin_tools import (
     prepare_template_data,
     source_hash,
+    source_hash_from_stat,
 )
 
 from .path_tools import (
@@ -209,6 +214,8 @@ __all__ = [
     "convert_input_paths_for_ffmpeg",
     "get_ffprobe_data",
     "get_ffprobe_streams",
+    "get_metadata_cache_stats",
+    "clear_metadata_cache",
     "get_ffmpeg_codec_args",
     "get_ffmpeg_format_args",
     "convert_ffprobe_fps_value",
@@ -218,9 +225,12 @@ __all__ = [
     "compile_list_of_regexes",
 
     "filter_profiles",
+    "ProfileMatcher",
+    "get_profile_matcher",
 
     "prepare_template_data",
     "source_hash",
+    "source_hash_from_stat",
 
     "format_file_size",
     "collect_frames",
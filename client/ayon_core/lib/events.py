@@ -172,6 +172,8 @@ class EventCallback(object):
         self._topic = topic
         self._order = order
         self._enabled = True
+        # Callback triggered when order changes (used by 'EventSystem')
+        self._order_change_callback = None
         # Replace '*' with any character regex and escape rest of text
         #   - when callback is registered for '*' topic it will receive all
         #       events
@@ -227,6 +229,16 @@ class EventCallback(object):
             self._log = logging.getLogger(self.__class__.__name__)
         return self._log
 
+    @property
+    def topic(self):
+        """Topic which is callback listening to.
+
+        Returns:
+            str: Topic, may contain '*'.
+        """
+
+        return self._topic
+
     @property
     def is_ref_valid(self):
         """
@@ -293,6 +305,8 @@ class EventCallback(object):
 
         self._validate_order(order)
         self._order = order
+        if self._order_change_callback is not None:
+            self._order_change_callback(self)
 
     order = property(get_order, set_order)
 
@@ -315,6 +329,16 @@ class EventCallback(object):
             event(Event): Event that was triggered.
         """
 
+        if self.topic_matches(event.topic):
+            self._process_matching_event(event)
+
+    def _process_matching_event(self, event):
+        """Process event which topic already matches callback's topic.
+
+        Args:
+            event(Event): Event that was triggered.
+        """
+
         # Skip if callback is not enabled
         if not self._enabled:
             return
@@ -324,9 +348,6 @@ class EventCallback(object):
         if callback is None:
             return
 
-        if not self.topic_matches(event.topic):
-            return
-
         # Try to execute callback
         try:
             if self._expect_args:
@@ -498,12 +519,27 @@ class EventSystem(object):
     Callbacks are stored by order of their registration, but it is possible to
     manually define order of callbacks using 'order' argument within
     'add_callback'.
+
+    Callbacks are indexed by topic. Callbacks with exact topic are stored
+    by the topic and only callbacks with wildcard in topic have to be
+    matched against event topic. Sorted callbacks matching a topic are
+    cached until registered callbacks change.
     """
 
     default_order = 100
+    # Max number of topics with cached callbacks
+    _topics_cache_size = 1024
 
     def __init__(self):
         self._registered_callbacks = []
+        # Index of registration used to keep order of callbacks with
+        #   same order
+        self._callbacks_index = {}
+        self._next_callback_index = 0
+        self._callbacks_by_topic = collections.defaultdict(list)
+        self._wildcard_callbacks = []
+        # Sorted callbacks matching topic
+        self._callbacks_by_topic_cache = {}
 
     def add_callback(self, topic, callback, order=None):
         """Register callback in event system.
@@ -524,7 +560,15 @@ class EventSystem(object):
             order = self.default_order
 
         callback = EventCallback(topic, callback, order)
+        callback._order_change_callback = self._on_callback_order_change
+        self._callbacks_index[callback] = self._next_callback_index
+        self._next_callback_index += 1
         self._registered_callbacks.append(callback)
+        if "*" in topic:
+            self._wildcard_callbacks.append(callback)
+        else:
+            self._callbacks_by_topic[topic].append(callback)
+        self._callbacks_by_topic_cache.clear()
         return callback
 
     def create_event(self, topic, data, source):
@@ -575,13 +619,93 @@ class EventSystem(object):
             event (Event): Prepared event with topic and data.
         """
 
-        callbacks = tuple(sorted(
-            self._registered_callbacks, key=lambda x: x.order
-        ))
-        for callback in callbacks:
-            callback.process_event(event)
+        invalid_callbacks = []
+        for callback in self._get_topic_callbacks(event.topic):
+            callback._process_matching_event(event)
             if not callback.is_ref_valid:
-                self._registered_callbacks.remove(callback)
+                invalid_callbacks.append(callback)
+
+        if invalid_callbacks:
+            self._remove_callbacks(invalid_callbacks)
+
+    def _get_topic_callbacks(self, topic):
+        """Callbacks matching topic sorted by order.
+
+        Args:
+            topic (str): Event topic.
+
+        Returns:
+            tuple[EventCallback, ...]: Sorted callbacks matching topic.
+        """
+
+        callbacks = self._callbacks_by_topic_cache.get(topic)
+        if callbacks is not None:
+            return callbacks
+
+        callbacks = list(self._callbacks_by_topic.get(topic, []))
+        callbacks.extend(
+            callback
+            for callback in self._wildcard_callbacks
+            if callback.topic_matches(topic)
+        )
+        callbacks.sort(
+            key=lambda c: (c.order, self._callbacks_index[c])
+        )
+        callbacks = tuple(callbacks)
+
+        if len(self._callbacks_by_topic_cache) >= self._topics_cache_size:
+            self._callbacks_by_topic_cache.clear()
+        self._callbacks_by_topic_cache[topic] = callbacks
+        return callbacks
+
+    def _remove_callbacks(self, callbacks):
+        """Remove callbacks from the system.
+
+        Args:
+            callbacks (Iterable[EventCallback]): Callbacks to remove.
+        """
+
+        callbacks = {
+            callback
+            for callback in callbacks
+            if callback in self._callbacks_index
+        }
+        if not callbacks:
+            return
+
+        topics = set()
+        for callback in callbacks:
+            self._callbacks_index.pop(callback)
+            callback._order_change_callback = None
+            topics.add(callback.topic)
+
+        self._registered_callbacks = [
+            callback
+            for callback in self._registered_callbacks
+            if callback not in callbacks
+        ]
+        for topic in topics:
+            if "*" in topic:
+                self._wildcard_callbacks = [
+                    callback
+                    for callback in self._wildcard_callbacks
+                    if callback not in callbacks
+                ]
+                continue
+
+            topic_callbacks = [
+                callback
+                for callback in self._callbacks_by_topic[topic]
+                if callback not in callbacks
+            ]
+            if topic_callbacks:
+                self._callbacks_by_topic[topic] = topic_callbacks
+            else:
+                self._callbacks_by_topic.pop(topic)
+        self._callbacks_by_topic_cache.clear()
+
+    def _on_callback_order_change(self, callback):
+        self._callbacks_by_topic_cache.clear()
 
 
 class QueuedEventSystem(EventSystem):
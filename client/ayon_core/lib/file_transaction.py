@@ -2,6 +2,9 @@ import os
 import logging
 import sys
 import errno
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+
 import six
 
 from ayon_core.lib import create_hard_link
@@ -49,12 +52,34 @@ class FileTransaction(object):
 
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Transfers can be processed concurrently by passing 'max_workers' higher
+    than 1. Backup and transfer of each file is then done in a bounded
+    thread pool which helps mostly on network storages where each file
+    operation has high latency. Rollback behavior is the same in both modes.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for output.
+        allow_queue_replacements (Optional[bool]): Allow to replace source
+            of destination which is already in queue.
+        max_workers (Optional[int]): Maximum number of threads used for
+            file operations. Value lower than 2 means serial processing.
+        progress_callback (Optional[Callable[[int, int, int, int], None]]):
+            Callback called after each transferred file with arguments
+            'transferred_files', 'total_files', 'transferred_bytes' and
+            'total_bytes'.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
 
-    def __init__(self, log=None, allow_queue_replacements=False):
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=None,
+        progress_callback=None,
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
@@ -72,6 +97,20 @@ class FileTransaction(object):
 
         self._allow_queue_replacements = allow_queue_replacements
 
+        self._max_workers = max_workers or 1
+        self._progress_callback = progress_callback
+
+        # Cache of 'os.stat' results shared by all phases of the transaction
+        #   - value is 'None' if path does not exist
+        self._stat_cache = {}
+        self._lock = threading.Lock()
+        self._progress = {
+            "files": 0,
+            "files_total": 0,
+            "bytes": 0,
+            "bytes_total": 0,
+        }
+
     def add(self, src, dst, mode=MODE_COPY):
         """Add a new file to transfer queue.
 
@@ -110,41 +149,121 @@ class FileTransaction(object):
         self._transfers[dst] = (src, opts)
 
     def process(self):
-        # Backup any existing files
-        for dst, (src, _) in self._transfers.items():
-            self.log.debug("Checking file ... {} -> {}".format(src, dst))
-            path_same = self._same_paths(src, dst)
-            if path_same or not os.path.exists(dst):
-                continue
-
-            # Backup original file
-            # todo: add timestamp or uuid to ensure unique
-            backup = dst + ".bak"
-            self._backup_to_original[backup] = dst
-            self.log.debug(
-                "Backup existing file: {} -> {}".format(dst, backup))
-            os.rename(dst, backup)
-
-        # Copy the files to transfer
+        # Resolve which transfers are between different paths
+        #   - each path is checked on disk only once
+        transfers = []
         for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
+            self.log.debug("Checking file ... {} -> {}".format(src, dst))
+            if self._same_paths(src, dst):
                 self.log.debug(
                     "Source and destination are same files {} -> {}".format(
                         src, dst))
                 continue
+            transfers.append((src, dst, opts))
 
-            self._create_folder_for_file(dst)
-
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
+        # Backup any existing files
+        self._run_tasks(
+            self._backup_file,
+            [
+                dst
+                for _, dst, _ in transfers
+                if self._get_stat(dst) is not None
+            ]
+        )
+
+        # Create all destination folders before the transfer
+        self._create_folders(dst for _, dst, _ in transfers)
+
+        total_bytes = 0
+        for src, _, _ in transfers:
+            src_stat = self._get_stat(src)
+            if src_stat is not None:
+                total_bytes += src_stat.st_size
+
+        self._progress.update({
+            "files": 0,
+            "files_total": len(transfers),
+            "bytes": 0,
+            "bytes_total": total_bytes,
+        })
 
+        # Copy the files to transfer
+        self._run_tasks(self._transfer_file, transfers)
+
+    def _backup_file(self, dst):
+        # todo: add timestamp or uuid to ensure unique
+        backup = dst + ".bak"
+        self.log.debug(
+            "Backup existing file: {} -> {}".format(dst, backup))
+        os.rename(dst, backup)
+        with self._lock:
+            self._backup_to_original[backup] = dst
+            self._stat_cache[dst] = None
+            self._stat_cache.pop(backup, None)
+
+    def _transfer_file(self, src, dst, opts):
+        if opts["mode"] == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            copyfile(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
+
+        src_stat = self._get_stat(src)
+        with self._lock:
             self._transferred.append(dst)
+            self._stat_cache.pop(dst, None)
+            self._progress["files"] += 1
+            if src_stat is not None:
+                self._progress["bytes"] += src_stat.st_size
+            progress = dict(self._progress)
+
+        if self._progress_callback is not None:
+            self._progress_callback(
+                progress["files"],
+                progress["files_total"],
+                progress["bytes"],
+                progress["bytes_total"],
+            )
+
+    def _run_tasks(self, func, items):
+        """Run function for each item, serially or in a thread pool.
+
+        When any of the calls fails, the pending calls are cancelled and
+        the calls which already started are waited for, so the transaction
+        knows about every file that was touched before error is re-raised.
+
+        Args:
+            func (Callable): Function to call.
+            items (Iterable[Any]): Arguments for function. Tuple items are
+                unpacked as positional arguments.
+        """
+
+        items = [
+            item if isinstance(item, tuple) else (item, )
+            for item in items
+        ]
+        if self._max_workers < 2 or len(items) < 2:
+            for args in items:
+                func(*args)
+            return
+
+        max_workers = min(self._max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(func, *args) for args in items]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+            # Wait for the already running tasks
+            wait(not_done)
+
+        for future in futures:
+            if future.cancelled():
+                continue
+            exc = future.exception()
+            if exc is not None:
+                raise exc
 
     def finalize(self):
         # Delete any backed up files
@@ -162,6 +281,7 @@ class FileTransaction(object):
         for path in self._transferred:
             try:
                 os.remove(path)
+                self._stat_cache.pop(path, None)
             except OSError:
                 errors += 1
                 self.log.error(
@@ -172,6 +292,8 @@ class FileTransaction(object):
         for backup, original in self._backup_to_original.items():
             try:
                 os.rename(backup, original)
+                self._stat_cache.pop(backup, None)
+                self._stat_cache.pop(original, None)
             except OSError:
                 errors += 1
                 self.log.error(
@@ -195,8 +317,20 @@ class FileTransaction(object):
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
-    def _create_folder_for_file(self, path):
-        dirname = os.path.dirname(path)
+    def _create_folders(self, paths):
+        """Create parent folders of passed file paths.
+
+        Each unique folder is created only once.
+
+        Args:
+            paths (Iterable[str]): File paths.
+        """
+
+        dirnames = {os.path.dirname(path) for path in paths}
+        for dirname in sorted(dirnames):
+            self._create_folder(dirname)
+
+    def _create_folder(self, dirname):
         try:
             os.makedirs(dirname)
         except OSError as e:
@@ -206,9 +340,30 @@ class FileTransaction(object):
                 self.log.critical("An unexpected error occurred.")
                 six.reraise(*sys.exc_info())
 
+    def _get_stat(self, path):
+        """Cached 'os.stat' of a path.
+
+        Args:
+            path (str): Path to file.
+
+        Returns:
+            Union[os.stat_result, None]: Stat result or None if path does
+                not exist.
+        """
+
+        if path not in self._stat_cache:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stat = None
+            self._stat_cache[path] = stat
+        return self._stat_cache[path]
+
     def _same_paths(self, src, dst):
         # handles same paths but with C:/project vs c:/project
-        if os.path.exists(src) and os.path.exists(dst):
-            return os.stat(src) == os.stat(dst)
+        src_stat = self._get_stat(src)
+        dst_stat = self._get_stat(dst)
+        if src_stat is not None and dst_stat is not None:
+            return src_stat == dst_stat
 
         return src == dst
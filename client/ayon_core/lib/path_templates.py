@@ -1,6 +1,8 @@
 import os
 import re
 import numbers
+import threading
+import collections
 
 import six
 
@@ -40,8 +42,46 @@ class TemplateUnsolved(Exception):
         )
 
 
+class _ParsedTemplatesCache:
+    """Process-wide cache of parsed template parts by template string.
+
+    Parsed parts are not modified during formatting so they can be shared
+    by all 'StringTemplate' objects with the same template.
+    """
+
+    max_items = 4096
+
+    def __init__(self):
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, template):
+        with self._lock:
+            parts = self._items.get(template)
+            if parts is not None:
+                self._items.move_to_end(template)
+            return parts
+
+    def set(self, template, parts):
+        with self._lock:
+            self._items[template] = parts
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_parsed_templates_cache = _ParsedTemplatesCache()
+
+
 class StringTemplate(object):
-    """String that can be formatted."""
+    """String that can be formatted.
+
+    Parsed parts of template are cached per template string so creation of
+    object with the same template is cheap.
+    """
     def __init__(self, template):
         if not isinstance(template, six.string_types):
             raise TypeError("<{}> argument must be a string, not {}.".format(
@@ -49,6 +89,14 @@ class StringTemplate(object):
             ))
 
         self._template = template
+        parts = _parsed_templates_cache.get(template)
+        if parts is None:
+            parts = self._parse_template(template)
+            _parsed_templates_cache.set(template, parts)
+        self._parts = parts
+
+    @classmethod
+    def _parse_template(cls, template):
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -79,7 +127,7 @@ class StringTemplate(object):
             if substr:
                 new_parts.append(substr)
 
-        self._parts = self.find_optional_parts(new_parts)
+        return cls.find_optional_parts(new_parts)
 
     def __str__(self):
         return self.template
@@ -142,6 +190,40 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def format_many(self, data_list):
+        """Format template with each data in list.
+
+        Convenience method to fill the same template for each frame of
+        a sequence. Each data are formatted with 'format', template parts
+        are parsed once per template string for all calls.
+
+        Args:
+            data_list (Iterable[dict]): Data to fill template with.
+
+        Returns:
+            list[TemplateResult]: Result for each data in the same order.
+        """
+
+        return [self.format(data) for data in data_list]
+
+    def format_strict_many(self, data_list):
+        """Format template with each data in list and validate results.
+
+        Args:
+            data_list (Iterable[dict]): Data to fill template with.
+
+        Returns:
+            list[TemplateResult]: Result for each data in the same order.
+
+        Raises:
+            TemplateUnsolved: When any of results is not solved.
+        """
+
+        output = self.format_many(data_list)
+        for result in output:
+            result.validate()
+        return output
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -366,17 +448,29 @@ class TemplatePartResult:
     def used_values(self):
         return self._used_values
 
-    @staticmethod
-    def split_keys_to_subdicts(values):
+    # Cache of keys split to subdict keys
+    _key_subdicts_cache = {}
+
+    @classmethod
+    def _get_key_subdicts(cls, key):
+        key_subdict = cls._key_subdicts_cache.get(key)
+        if key_subdict is None:
+            existence_check = key
+            key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+            if key_padding:
+                existence_check = key_padding[0]
+            key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+            cls._key_subdicts_cache[key] = key_subdict
+        return key_subdict
+
+    @classmethod
+    def split_keys_to_subdicts(cls, values):
         output = {}
         for key, value in values.items():
-            key_padding = list(KEY_PADDING_PATTERN.findall(key))
-            if key_padding:
-                key = key_padding[0]
-            key_subdict = list(SUB_DICT_PATTERN.findall(key))
+            key_subdict = cls._get_key_subdicts(key)
             data = output
-            last_key = key_subdict.pop(-1)
-            for subkey in key_subdict:
+            last_key = key_subdict[-1]
+            for subkey in key_subdict[:-1]:
                 if subkey not in data:
                     data[subkey] = {}
                 data = data[subkey]
@@ -437,9 +531,22 @@ class FormattingPart:
     Args:
         template(str): String containing the formatting key.
     """
+    # Cache of value types which can be used for formatting
+    _valid_types_cache = {}
+
     def __init__(self, template):
         self._template = template
 
+        # Resolve key parts only once per template
+        key = template[1:-1]
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+
     @property
     def template(self):
         return self._template
@@ -450,16 +557,18 @@ class FormattingPart:
     def __str__(self):
         return self._template
 
-    @staticmethod
-    def validate_value_type(value):
+    @classmethod
+    def validate_value_type(cls, value):
         """Check if value can be used for formatting of single key."""
-        if isinstance(value, (numbers.Number, FormatObject)):
-            return True
-
-        for inh_class in type(value).mro():
-            if inh_class in six.string_types:
-                return True
-        return False
+        value_type = type(value)
+        is_valid = cls._valid_types_cache.get(value_type)
+        if is_valid is None:
+            is_valid = issubclass(
+                value_type,
+                (numbers.Number, FormatObject) + tuple(six.string_types)
+            )
+            cls._valid_types_cache[value_type] = is_valid
+        return is_valid
 
     def format(self, data, result):
         """Format the formattings string.
@@ -468,17 +577,14 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
         # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -142,8 +142,25 @@ def source_hash(filepath, *args):
     You can specify additional arguments in the function
     to allow for specific 'processing' values to be included.
     """
+    return source_hash_from_stat(filepath, os.stat(filepath), *args)
+
+
+def source_hash_from_stat(filepath, stat, *args):
+    """Generate source file identifier from already available stat.
+
+    Same as 'source_hash' but file is not accessed again, useful when stat
+    of many files was collected at once e.g. with 'os.scandir'.
+
+    Args:
+        filepath (str): The source file path.
+        stat (os.stat_result): Stat result of the file.
+        *args (str): Additional 'processing' values.
+
+    Returns:
+        str: Source file identifier.
+    """
     # We replace dots with comma because . cannot be a key in a pymongo dict.
     file_name = os.path.basename(filepath)
-    time = str(os.path.getmtime(filepath))
-    size = str(os.path.getsize(filepath))
+    time = str(stat.st_mtime)
+    size = str(stat.st_size)
     return "|".join([file_name, time, size] + list(args)).replace(".", ",")
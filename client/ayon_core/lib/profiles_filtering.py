@@ -1,5 +1,7 @@
 import re
 import logging
+import threading
+import collections
 
 log = logging.getLogger(__name__)
 
@@ -116,6 +118,275 @@ def validate_value_by_regexes(value, in_list):
     return -1
 
 
+class ProfileMatcher(object):
+    """Profiles with precompiled filters used to find most matching profile.
+
+    Regexes of profile filter values are compiled once per process and
+    cached by the filter values, so profiles are always matched by their
+    current content, also when they were modified in place. Matcher can
+    filter many key values in one call.
+
+    Args:
+        profiles_data (list[dict[str, Any]]): Profile definitions as
+            dictionaries.
+    """
+
+    _filters_cache_size = 1024
+    _filters_cache = collections.OrderedDict()
+    _filters_cache_lock = threading.Lock()
+
+    def __init__(self, profiles_data):
+        self._profiles = profiles_data or []
+
+    @classmethod
+    def get_matcher(cls, profiles_data):
+        """Get matcher for profiles.
+
+        Args:
+            profiles_data (list[dict[str, Any]]): Profile definitions.
+
+        Returns:
+            ProfileMatcher: Matcher for profiles.
+        """
+
+        return cls(profiles_data)
+
+    @property
+    def profiles_count(self):
+        return len(self._profiles)
+
+    @classmethod
+    def _get_compiled_filter(cls, in_list):
+        """Compiled filter of profile value from process cache.
+
+        Returns:
+            Union[tuple[set[str], list[re.Pattern]], None]: Compiled filter
+                or None if profile accepts any value.
+        """
+
+        if not in_list:
+            return None
+
+        if isinstance(in_list, (list, tuple, set)):
+            cache_key = tuple(in_list)
+        else:
+            cache_key = (in_list, )
+
+        try:
+            return cls._filters_cache[cache_key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Values are not hashable
+            return cls._compile_filter(in_list)
+
+        compiled_filter = cls._compile_filter(in_list)
+        with cls._filters_cache_lock:
+            cls._filters_cache[cache_key] = compiled_filter
+            while len(cls._filters_cache) > cls._filters_cache_size:
+                cls._filters_cache.popitem(last=False)
+        return compiled_filter
+
+    @staticmethod
+    def _compile_filter(in_list):
+        """Compile profile value to filter.
+
+        Values without regex special characters are compared as strings,
+        other values are compiled to regexes.
+
+        Returns:
+            Union[tuple[set[str], list[re.Pattern]], None]: Literal values
+                and compiled regexes, or None if profile accepts any value.
+        """
+
+        if not in_list:
+            return None
+
+        if not isinstance(in_list, (list, tuple, set)):
+            in_list = [in_list]
+
+        if "*" in in_list:
+            return None
+
+        literals = set()
+        patterns = []
+        for item in in_list:
+            if isinstance(item, str) and item and re.escape(item) == item:
+                literals.add(item)
+            else:
+                patterns.append(item)
+        return literals, compile_list_of_regexes(patterns)
+
+    @staticmethod
+    def _validate_value(value, compiled_filter):
+        """Same logic as 'validate_value_by_regexes' with compiled filter."""
+
+        if compiled_filter is None:
+            return 0
+
+        if not value:
+            return -1
+
+        literals, regexes = compiled_filter
+        if isinstance(value, str) and value in literals:
+            return 1
+
+        for regex in regexes:
+            if regex.fullmatch(value):
+                return 1
+        return -1
+
+    def filter(self, key_values, keys_order=None, logger=None):
+        """Find most matching profile for key values.
+
+        Args:
+            key_values (dict): Mapping of Key <-> Value.
+            keys_order (Optional[Iterable[str]]): Order of keys from
+                `key_values` which matters only when multiple profiles
+                have same score.
+            logger (Optional[logging.Logger]): Logger used for logging.
+
+        Returns:
+            Union[dict, None]: Most matching profile or None.
+        """
+
+        if not self._profiles:
+            return None
+
+        if not logger:
+            logger = log
+
+        keys_order = self._get_keys_order(key_values, keys_order)
+
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        log_parts = None
+        if debug_enabled:
+            log_parts = " | ".join([
+                "{}: \"{}\"".format(*item)
+                for item in key_values.items()
+            ])
+            logger.debug(
+                "Looking for matching profile for: {}".format(log_parts)
+            )
+
+        return self._find_profile(
+            key_values, keys_order, logger, debug_enabled, log_parts
+        )
+
+    def filter_many(self, key_values_list, keys_order=None, logger=None):
+        """Find most matching profile for each passed key values.
+
+        Args:
+            key_values_list (Iterable[dict]): Key values to find profile for.
+            keys_order (Optional[Iterable[str]]): Order of keys which
+                matters only when multiple profiles have same score.
+            logger (Optional[logging.Logger]): Logger used for logging.
+
+        Returns:
+            list[Union[dict, None]]: Most matching profile for each item.
+        """
+
+        return [
+            self.filter(key_values, keys_order, logger)
+            for key_values in key_values_list
+        ]
+
+    @staticmethod
+    def _get_keys_order(key_values, keys_order):
+        if not keys_order:
+            return tuple(key_values.keys())
+
+        _keys_order = list(keys_order)
+        # Make all keys from `key_values` are passed
+        for key in key_values.keys():
+            if key not in _keys_order:
+                _keys_order.append(key)
+        return tuple(_keys_order)
+
+    def _find_profile(
+        self, key_values, keys_order, logger, debug_enabled, log_parts
+    ):
+        values_by_key = [
+            (key, key_values[key])
+            for key in keys_order
+        ]
+        get_compiled_filter = self._get_compiled_filter
+        validate_value = self._validate_value
+
+        matching_profiles = None
+        highest_profile_points = -1
+        # Each profile get 1 point for each matching filter. Profile with most
+        # points is returned. For cases when more than one profile will match
+        # are also stored ordered lists of matching values.
+        for profile in self._profiles:
+            profile_points = 0
+            profile_scores = []
+
+            for key, value in values_by_key:
+                match = validate_value(
+                    value, get_compiled_filter(profile.get(key))
+                )
+                if match == -1:
+                    if debug_enabled:
+                        profile_value = profile.get(key) or []
+                        logger.debug(
+                            "\"{}\" not found in \"{}\": {}".format(
+                                value, key, profile_value
+                            )
+                        )
+                    profile_points = -1
+                    break
+
+                profile_points += match
+                profile_scores.append(bool(match))
+
+            if (
+                profile_points < 0
+                or profile_points < highest_profile_points
+            ):
+                continue
+
+            if profile_points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = profile_points
+
+            if profile_points == highest_profile_points:
+                matching_profiles.append((profile, profile_scores))
+
+        if not matching_profiles:
+            if debug_enabled:
+                logger.debug(
+                    "None of profiles match your setup. {}".format(log_parts)
+                )
+            return None
+
+        if len(matching_profiles) > 1 and debug_enabled:
+            logger.debug(
+                "More than one profile match your setup. {}".format(log_parts)
+            )
+
+        profile = _profile_exclusion(matching_profiles, logger)
+        if profile and debug_enabled:
+            logger.debug(
+                "Profile selected: {}".format(profile)
+            )
+        return profile
+
+
+def get_profile_matcher(profiles_data):
+    """Get matcher for profiles.
+
+    Args:
+        profiles_data (list[dict[str, Any]]): Profile definitions as
+            dictionaries.
+
+    Returns:
+        ProfileMatcher: Matcher for profiles.
+    """
+
+    return ProfileMatcher.get_matcher(profiles_data)
+
+
 def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     """ Filter profiles by entered key -> values.
 
@@ -149,79 +420,6 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     if not profiles_data:
         return None
 
-    if not logger:
-        logger = log
-
-    if not keys_order:
-        keys_order = tuple(key_values.keys())
-    else:
-        _keys_order = list(keys_order)
-        # Make all keys from `key_values` are passed
-        for key in key_values.keys():
-            if key not in _keys_order:
-                _keys_order.append(key)
-        keys_order = tuple(_keys_order)
-
-    log_parts = " | ".join([
-        "{}: \"{}\"".format(*item)
-        for item in key_values.items()
-    ])
-
-    logger.debug(
-        "Looking for matching profile for: {}".format(log_parts)
+    return get_profile_matcher(profiles_data).filter(
+        key_values, keys_order, logger
     )
-
-    matching_profiles = None
-    highest_profile_points = -1
-    # Each profile get 1 point for each matching filter. Profile with most
-    # points is returned. For cases when more than one profile will match
-    # are also stored ordered lists of matching values.
-    for profile in profiles_data:
-        profile_points = 0
-        profile_scores = []
-
-        for key in keys_order:
-            value = key_values[key]
-            match = validate_value_by_regexes(value, profile.get(key))
-            if match == -1:
-                profile_value = profile.get(key) or []
-                logger.debug(
-                    "\"{}\" not found in \"{}\": {}".format(value, key,
-                                                            profile_value)
-                )
-                profile_points = -1
-                break
-
-            profile_points += match
-            profile_scores.append(bool(match))
-
-        if (
-            profile_points < 0
-            or profile_points < highest_profile_points
-        ):
-            continue
-
-        if profile_points > highest_profile_points:
-            matching_profiles = []
-            highest_profile_points = profile_points
-
-        if profile_points == highest_profile_points:
-            matching_profiles.append((profile, profile_scores))
-
-    if not matching_profiles:
-        logger.debug(
-            "None of profiles match your setup. {}".format(log_parts)
-        )
-        return None
-
-    if len(matching_profiles) > 1:
-        logger.debug(
-            "More than one profile match your setup. {}".format(log_parts)
-        )
-
-    profile = _profile_exclusion(matching_profiles, logger)
-    if profile:
-        logger.debug(
-            "Profile selected: {}".format(profile)
-        )
-    return profile
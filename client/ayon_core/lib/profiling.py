@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
-"""Provide profiling decorator."""
+"""Provide profiling decorator and measurement of used resources."""
 import os
+import sys
+import time
 import cProfile
+import threading
 
 
 def do_profile(fn, to_file=None):
@@ -27,3 +30,126 @@ def do_profile(fn, to_file=None):
                 profiler.dump_stats(to_file)
             else:
                 profiler.print_stats()
+
+    return profiled
+
+
+def get_peak_rss():
+    """Peak resident set size of current process.
+
+    Returns:
+        Union[int, None]: Peak RSS in bytes or None if can't be received.
+    """
+
+    try:
+        import resource
+
+    except ImportError:
+        resource = None
+
+    if resource is not None:
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Value is in bytes on macOS and in kilobytes on linux
+        if sys.platform == "darwin":
+            return peak_rss
+        return peak_rss * 1024
+
+    try:
+        import psutil
+
+    except ImportError:
+        return None
+
+    memory_info = psutil.Process(os.getpid()).memory_info()
+    return getattr(memory_info, "peak_wset", memory_info.rss)
+
+
+def get_subprocess_cpu_time():
+    """CPU time used by finished subprocesses of current process.
+
+    Returns:
+        float: Time in seconds. Always '0.0' on Windows.
+    """
+
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+class ProcessTimer(object):
+    """Measure time and memory used by processing of a code block.
+
+    Measures wall time, CPU time, CPU time of subprocesses and peak RSS of
+    the process. Times are in milliseconds and memory is in bytes.
+
+    Example:
+        with ProcessTimer() as timer:
+            process()
+        print(timer.to_data()["wall_time"])
+
+    Args:
+        thread_cpu (Optional[bool]): Measure CPU time of current thread
+            only. Should be used when multiple code blocks are measured
+            at once in threads.
+    """
+
+    def __init__(self, thread_cpu=False):
+        self._thread_cpu = thread_cpu
+        self._thread_id = None
+        self._start = None
+        self._start_counter = None
+        self._start_cpu = None
+        self._start_subprocess = None
+        self._start_rss = None
+        self._data = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+
+    def _get_cpu_time(self):
+        if self._thread_cpu:
+            return time.thread_time()
+        return time.process_time()
+
+    def start(self):
+        self._data = None
+        self._thread_id = threading.get_ident()
+        self._start_rss = get_peak_rss()
+        self._start_subprocess = get_subprocess_cpu_time()
+        self._start_cpu = self._get_cpu_time()
+        self._start = time.time()
+        self._start_counter = time.perf_counter()
+
+    def stop(self):
+        wall_time = time.perf_counter() - self._start_counter
+        cpu_time = self._get_cpu_time() - self._start_cpu
+        subprocess_time = get_subprocess_cpu_time() - self._start_subprocess
+        peak_rss = get_peak_rss()
+        peak_rss_increase = None
+        if peak_rss is not None and self._start_rss is not None:
+            peak_rss_increase = peak_rss - self._start_rss
+
+        self._data = {
+            "start": self._start,
+            "wall_time": wall_time * 1000,
+            "cpu_time": cpu_time * 1000,
+            "subprocess_time": subprocess_time * 1000,
+            "peak_rss": peak_rss,
+            "peak_rss_increase": peak_rss_increase,
+            "thread_id": self._thread_id,
+        }
+
+    def to_data(self):
+        """Measured data.
+
+        Returns:
+            Union[dict[str, Any], None]: Measured data or None if timer
+                was not stopped.
+        """
+
+        if self._data is None:
+            return None
+        return dict(self._data)
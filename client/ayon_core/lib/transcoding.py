@@ -1,14 +1,21 @@
 import os
 import re
 import logging
+import copy
 import json
 import collections
 import tempfile
 import subprocess
 import platform
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import xml.etree.ElementTree
 
+import clique
+
+from .env_tools import env_value_to_bool
 from .execute import run_subprocess
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
@@ -66,6 +73,246 @@ VIDEO_EXTENSIONS = {
 }
 
 
+class _MetadataCache:
+    """Cache of file metadata loaded with oiiotool or ffprobe.
+
+    Metadata are keyed by filepath, file modification time and size so
+    a changed file is probed again. In-process cache has limited size and
+    drops least recently used items. Optional on-disk layer stores metadata
+    as json files under temp directory so they can be shared across
+    processes, it is enabled with 'AYON_TRANSCODING_METADATA_DISK_CACHE'
+    environment variable. Number of files in on-disk cache is limited,
+    least recently used files are removed.
+    """
+
+    max_items = 1024
+    disk_max_items = 4096
+    # Check size of on-disk cache on first write and then after each
+    #   n-th write of the process
+    disk_prune_interval = 100
+
+    def __init__(self):
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._disk_writes = 0
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self):
+        """Cache statistics.
+
+        Returns:
+            dict[str, int]: Hits, misses and number of cached items.
+        """
+
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "items": len(self._items),
+            }
+
+    def get_or_create(
+        self, category, filepath, variant, load_func, parse_func, logger
+    ):
+        """Get cached metadata or create them using passed functions.
+
+        Raw output of 'load_func' is stored to on-disk cache, parsed output
+        is stored in memory.
+
+        Args:
+            category (str): Category of metadata e.g. 'oiio' or 'ffprobe'.
+            filepath (str): Path to file.
+            variant (Any): Hashable value which changes output of
+                'load_func'.
+            load_func (Callable[[], str]): Function which loads raw
+                metadata output.
+            parse_func (Callable[[str], Any]): Function which parses raw
+                metadata output.
+            logger (logging.Logger): Logger used for logging.
+
+        Returns:
+            Any: Copy of metadata.
+        """
+
+        key = self._get_key(category, filepath, variant)
+        if key is None:
+            return parse_func(load_func())
+
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+
+        if value is None:
+            raw_value = self._read_from_disk(key)
+            if raw_value is not None:
+                value = parse_func(raw_value)
+                self._set_value(key, value)
+
+        if value is not None:
+            with self._lock:
+                self._hits += 1
+                hits, misses = self._hits, self._misses
+            logger.debug((
+                "Metadata cache hit for \"{}\" (hits: {}, misses: {})"
+            ).format(filepath, hits, misses))
+            return copy.deepcopy(value)
+
+        with self._lock:
+            self._misses += 1
+            hits, misses = self._hits, self._misses
+        logger.debug((
+            "Metadata cache miss for \"{}\" (hits: {}, misses: {})"
+        ).format(filepath, hits, misses))
+        raw_value = load_func()
+        value = parse_func(raw_value)
+        self._set_value(key, value)
+        self._write_to_disk(key, raw_value)
+        return copy.deepcopy(value)
+
+    def _set_value(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def _get_key(self, category, filepath, variant):
+        try:
+            stat = os.stat(filepath)
+        except (OSError, TypeError, ValueError):
+            return None
+        return (
+            category,
+            os.path.normpath(os.path.abspath(filepath)),
+            stat.st_mtime_ns,
+            stat.st_size,
+            variant,
+        )
+
+    def _get_disk_filepath(self, key):
+        if not env_value_to_bool(
+            "AYON_TRANSCODING_METADATA_DISK_CACHE", default=False
+        ):
+            return None
+        key_hash = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(
+            self._get_disk_dirpath(), "{}.txt".format(key_hash)
+        )
+
+    @staticmethod
+    def _get_disk_dirpath():
+        return os.path.join(tempfile.gettempdir(), "op_transcoding_metadata")
+
+    def _read_from_disk(self, key):
+        filepath = self._get_disk_filepath(key)
+        if not filepath or not os.path.exists(filepath):
+            return None
+        try:
+            with open(filepath, "r", encoding="utf-8") as stream:
+                value = stream.read()
+        except (OSError, ValueError):
+            return None
+
+        # Mark file as recently used for pruning
+        try:
+            os.utime(filepath, None)
+        except OSError:
+            pass
+        return value
+
+    def _write_to_disk(self, key, value):
+        filepath = self._get_disk_filepath(key)
+        if not filepath:
+            return
+        dirpath = os.path.dirname(filepath)
+        tmp_path = "{}.{}.tmp".format(filepath, os.getpid())
+        try:
+            os.makedirs(dirpath, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as stream:
+                stream.write(value)
+            os.replace(tmp_path, filepath)
+        except (OSError, ValueError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._lock:
+            should_prune = (
+                self._disk_writes % self.disk_prune_interval == 0
+            )
+            self._disk_writes += 1
+
+        if should_prune:
+            self._prune_disk_cache(dirpath)
+
+    def _prune_disk_cache(self, dirpath):
+        """Remove least recently used files over limit of on-disk cache.
+
+        Args:
+            dirpath (str): Directory of on-disk cache.
+        """
+
+        cache_files = []
+        try:
+            with os.scandir(dirpath) as scan_iter:
+                for entry in scan_iter:
+                    if not entry.name.endswith(".txt"):
+                        continue
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    cache_files.append((mtime, entry.path))
+        except OSError:
+            return
+
+        remove_count = len(cache_files) - self.disk_max_items
+        if remove_count <= 0:
+            return
+
+        cache_files.sort()
+        for _, path in cache_files[:remove_count]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_metadata_cache = _MetadataCache()
+
+
+def get_metadata_cache_stats():
+    """Statistics of metadata cache used by oiiotool and ffprobe queries.
+
+    Returns:
+        dict[str, int]: Hits, misses and number of cached items.
+    """
+
+    return _metadata_cache.get_stats()
+
+
+def clear_metadata_cache():
+    """Clear in-process metadata cache of oiiotool and ffprobe queries."""
+
+    _metadata_cache.clear()
+
+
 def get_transcode_temp_directory():
     """Creates temporary folder for transcoding.
 
@@ -82,7 +329,25 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     """Call oiiotool to get information about input and return stdout.
 
     Stdout should contain xml format string.
+
+    Output is cached per file modification time and size.
     """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    return _metadata_cache.get_or_create(
+        "oiio",
+        filepath,
+        bool(subimages),
+        lambda: _run_oiio_info_for_input(filepath, logger, subimages),
+        lambda output: _parse_oiio_info_output(
+            output, filepath, logger, subimages
+        ),
+        logger
+    )
+
+
+def _run_oiio_info_for_input(filepath, logger, subimages):
     args = get_oiio_tool_args(
         "oiiotool",
         "--info",
@@ -93,7 +358,10 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
 
     args.extend(["-i:infoformat=xml", filepath])
 
-    output = run_subprocess(args, logger=logger)
+    return run_subprocess(args, logger=logger)
+
+
+def _parse_oiio_info_output(output, filepath, logger, subimages):
     output = output.replace("\r\n", "\n")
 
     xml_started = False
@@ -656,10 +924,123 @@ def convert_for_ffmpeg(
     run_subprocess(oiio_cmd, logger=logger)
 
 
+def _get_oiio_erase_attribs_args(input_info, logger):
+    """Arguments erasing attributes which are not supported by ffmpeg.
+
+    Args:
+        input_info (dict[str, Any]): Information about input from oiiotool.
+        logger (logging.Logger): Logger used for logging.
+
+    Returns:
+        list[str]: Arguments for oiiotool.
+    """
+
+    output = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing prohibited symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            output.extend(["--eraseattrib", attr_name])
+    return output
+
+
+def _split_input_paths_to_frame_runs(input_paths):
+    """Split input paths to runs of contiguous frames.
+
+    Each run is represented by tuple '(input_path, frames)' where
+    'input_path' is path with printf-style frame padding (e.g. '%04d') and
+    'frames' is a frame range string for oiiotool '--frames' argument. Paths
+    that are not part of any sequence, or runs with single frame, have
+    'frames' set to 'None' and 'input_path' is the original path.
+
+    Args:
+        input_paths (Iterable[str]): Input file paths.
+
+    Returns:
+        list[tuple[str, Union[str, None]]]: Runs of input paths.
+    """
+
+    paths_by_dir = collections.defaultdict(list)
+    for input_path in input_paths:
+        dirpath, filename = os.path.split(input_path)
+        paths_by_dir[dirpath].append(filename)
+
+    output = []
+    for dirpath, filenames in paths_by_dir.items():
+        collections_, remainders = clique.assemble(
+            filenames,
+            patterns=[clique.PATTERNS["frames"]],
+            minimum_items=1,
+        )
+        for filename in remainders:
+            output.append((os.path.join(dirpath, filename), None))
+
+        for collection in collections_:
+            # Collection items are iterated in order of sorted indexes
+            filename_by_idx = dict(zip(sorted(collection.indexes), collection))
+            # Percent symbol would break printf-style padding
+            if "%" in collection.head or "%" in collection.tail:
+                for filename in filename_by_idx.values():
+                    output.append((os.path.join(dirpath, filename), None))
+                continue
+
+            runs = []
+            for idx in sorted(filename_by_idx):
+                if runs and runs[-1][-1] + 1 == idx:
+                    runs[-1].append(idx)
+                else:
+                    runs.append([idx])
+
+            template = os.path.join(
+                dirpath, collection.format("{head}{padding}{tail}")
+            )
+            for run in runs:
+                if len(run) == 1:
+                    output.append((
+                        os.path.join(dirpath, filename_by_idx[run[0]]),
+                        None
+                    ))
+                    continue
+                output.append(
+                    (template, "{}-{}".format(run[0], run[-1]))
+                )
+    return output
+
+
+# Default maximum of oiiotool processes converting frame runs at once
+MAX_TRANSCODE_WORKERS = 4
+
+
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    batch_frames=True,
+    max_workers=None,
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -672,12 +1053,23 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Contiguous frames of a sequence are converted with single oiiotool
+    process using '--frames' argument when 'batch_frames' is enabled. Gaps
+    in sequence split the input to multiple runs which are converted
+    independently and can be processed concurrently.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of same type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        batch_frames (Optional[bool]): Convert contiguous frames with single
+            oiiotool process.
+        max_workers (Optional[int]): Maximum number of oiiotool processes
+            running at the same time. Number of CPUs, but at most
+            'MAX_TRANSCODE_WORKERS', is used if not passed. Runs are
+            converted one by one if set to '1'.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
@@ -706,7 +1098,16 @@ def convert_input_paths_for_ffmpeg(
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
-    for input_path in input_paths:
+    # Attributes to erase are same for all inputs
+    erase_args = _get_oiio_erase_attribs_args(input_info, logger)
+
+    if batch_frames:
+        runs = _split_input_paths_to_frame_runs(input_paths)
+    else:
+        runs = [(input_path, None) for input_path in input_paths]
+
+    oiio_cmds = []
+    for input_path, frames in runs:
         # Prepare subprocess arguments
         oiio_cmd = get_oiio_tool_args(
             "oiiotool",
@@ -717,6 +1118,9 @@ def convert_input_paths_for_ffmpeg(
         if compression:
             oiio_cmd.extend(["--compression", compression])
 
+        if frames:
+            oiio_cmd.extend(["--frames", frames])
+
         oiio_cmd.extend([
             input_arg, input_path,
             # Tell oiiotool which channels should be put to top stack
@@ -725,36 +1129,7 @@ def convert_input_paths_for_ffmpeg(
             # Use first subimage
             "--subimage", "0"
         ])
-
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
-
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing prohibited symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+        oiio_cmd.extend(erase_args)
 
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
@@ -762,21 +1137,55 @@ def convert_input_paths_for_ffmpeg(
         oiio_cmd.extend([
             "-o", output_path
         ])
+        oiio_cmds.append(oiio_cmd)
 
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, MAX_TRANSCODE_WORKERS)
+
+    def _convert(oiio_cmd):
         logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
         run_subprocess(oiio_cmd, logger=logger)
 
+    if not max_workers or max_workers < 2 or len(oiio_cmds) < 2:
+        for oiio_cmd in oiio_cmds:
+            _convert(oiio_cmd)
+        return
+
+    # Subprocesses are running in parallel, threads are only waiting for them
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(oiio_cmds))
+    ) as executor:
+        for future in [
+            executor.submit(_convert, oiio_cmd)
+            for oiio_cmd in oiio_cmds
+        ]:
+            future.result()
+
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
 
+    Output is cached per file modification time and size.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
     """
     if not logger:
         logger = logging.getLogger(__name__)
+
+    return _metadata_cache.get_or_create(
+        "ffprobe",
+        path_to_file,
+        None,
+        lambda: _run_ffprobe(path_to_file, logger),
+        json.loads,
+        logger
+    )
+
+
+def _run_ffprobe(path_to_file, logger):
     logger.debug(
         "Getting information about input \"{}\".".format(path_to_file)
     )
@@ -811,17 +1220,16 @@ def get_ffprobe_data(path_to_file, logger=None):
     popen = subprocess.Popen(args, **kwargs)
 
     popen_stdout, popen_stderr = popen.communicate()
+    popen_stdout = popen_stdout.decode("utf-8")
     if popen_stdout:
-        logger.debug("FFprobe stdout:\n{}".format(
-            popen_stdout.decode("utf-8")
-        ))
+        logger.debug("FFprobe stdout:\n{}".format(popen_stdout))
 
     if popen_stderr:
         logger.warning("FFprobe stderr:\n{}".format(
             popen_stderr.decode("utf-8")
         ))
 
-    return json.loads(popen_stdout)
+    return popen_stdout
 
 
 def get_ffprobe_streams(path_to_file, logger=None):
@@ -9,12 +9,21 @@ import os
 from abc import abstractmethod
 import platform
 import getpass
+import threading
 from functools import partial
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import six
 import attr
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from urllib.parse import urlsplit
+except ImportError:
+    from urlparse import urlsplit
 
 import pyblish.api
 from ayon_core.pipeline.publish import (
@@ -28,6 +37,54 @@ from ayon_core.pipeline.publish.lib import (
 
 JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
 
+# Pooled sessions by Deadline webservice server
+_sessions_by_server = {}
+_sessions_lock = threading.Lock()
+
+
+def get_deadline_session(url):
+    """Get pooled session for Deadline webservice server of the url.
+
+    Session keeps connections alive so multiple requests to the same server
+    don't pay connection and TLS handshake for each request. Connection
+    errors are retried with backoff, failed responses are retried only for
+    idempotent methods so jobs are never submitted twice.
+
+    Args:
+        url (str): Url of any endpoint on the server.
+
+    Returns:
+        requests.Session: Session shared for the server.
+    """
+
+    url_parts = urlsplit(url)
+    server_key = (url_parts.scheme, url_parts.netloc)
+    with _sessions_lock:
+        session = _sessions_by_server.get(server_key)
+        if session is None:
+            retries = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=16,
+                max_retries=retries,
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions_by_server[server_key] = session
+    return session
+
+
+def _get_request_url(args, kwargs):
+    if args:
+        return args[0]
+    return kwargs["url"]
+
 
 # TODO both 'requests_post' and 'requests_get' should not set 'verify' based
 #   on environment variable. This should be done in a more controlled way,
@@ -51,7 +108,8 @@ def requests_post(*args, **kwargs):
                                               True) else True  # noqa
     # add 10sec timeout before bailing out
     kwargs['timeout'] = 10
-    return requests.post(*args, **kwargs)
+    session = get_deadline_session(_get_request_url(args, kwargs))
+    return session.post(*args, **kwargs)
 
 
 def requests_get(*args, **kwargs):
@@ -72,7 +130,183 @@ def requests_get(*args, **kwargs):
                                               True) else True  # noqa
     # add 10sec timeout before bailing out
     kwargs['timeout'] = 10
-    return requests.get(*args, **kwargs)
+    session = get_deadline_session(_get_request_url(args, kwargs))
+    return session.get(*args, **kwargs)
+
+
+def submit_deadline_payload(deadline_url, payload, log):
+    """Submit payload to Deadline API end-point.
+
+    Args:
+        deadline_url (str): Deadline webservice url.
+        payload (dict): dict to become json in deadline submission.
+        log (logging.Logger): Logger used for logging.
+
+    Returns:
+        dict: Deadline job data.
+
+    Throws:
+        KnownPublishError: if submission fails.
+
+    """
+    url = "{}/api/jobs".format(deadline_url)
+    response = requests_post(url, json=payload)
+    if not response.ok:
+        log.error("Submission failed!")
+        log.error(response.status_code)
+        log.error(response.content)
+        log.debug(payload)
+        raise KnownPublishError(response.text)
+
+    try:
+        return response.json()
+    except JSONDecodeError:
+        msg = "Broken response {}. ".format(response)
+        msg += "Try restarting the Deadline Webservice."
+        log.warning(msg, exc_info=True)
+        raise KnownPublishError("Broken response from DL")
+
+
+class DeadlineBatchSubmission(object):
+    """Deadline payloads of a publish context submitted in one pass.
+
+    Payloads are collected during processing of instances and submitted at
+    once by 'SubmitDeadlineBatch' plugin. Payloads without dependencies are
+    submitted concurrently over pooled session, payloads depending on other
+    payloads of the batch are submitted when ids of their dependencies are
+    known.
+
+    Use 'get_from_context' to get batch of a publish context.
+    """
+
+    context_key = "deadlineBatchSubmission"
+    max_workers = 8
+
+    def __init__(self):
+        self._items = []
+
+    @classmethod
+    def get_from_context(cls, context):
+        """Get batch stored on context, batch is created if not there yet.
+
+        Args:
+            context (pyblish.api.Context): Publish context.
+
+        Returns:
+            DeadlineBatchSubmission: Batch of the context.
+        """
+
+        batch = context.data.get(cls.context_key)
+        if batch is None:
+            batch = cls()
+            context.data[cls.context_key] = batch
+        return batch
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, deadline_url, payload, instance=None, dependencies=None):
+        """Add payload to batch.
+
+        Args:
+            deadline_url (str): Deadline webservice url.
+            payload (dict): Deadline payload.
+            instance (Optional[pyblish.api.Instance]): Instance to which is
+                stored response of submission to 'deadlineSubmissionJob'.
+            dependencies (Optional[Iterable[int]]): Indexes of payloads in
+                batch which must be submitted first, their job ids are added
+                to job dependencies of the payload.
+
+        Returns:
+            int: Index of payload in batch.
+        """
+
+        self._items.append({
+            "deadline_url": deadline_url,
+            "payload": payload,
+            "instance": instance,
+            "dependencies": list(dependencies or []),
+            "result": None,
+        })
+        return len(self._items) - 1
+
+    def submit(self, log):
+        """Submit all payloads in batch.
+
+        Args:
+            log (logging.Logger): Logger used for logging.
+
+        Returns:
+            list[dict]: Deadline job data of each payload in batch.
+        """
+
+        pending = [
+            item
+            for item in self._items
+            if item["result"] is None
+        ]
+        while pending:
+            ready = []
+            for item in pending:
+                if all(
+                    self._items[idx]["result"] is not None
+                    for idx in item["dependencies"]
+                ):
+                    ready.append(item)
+
+            if not ready:
+                raise KnownPublishError(
+                    "Deadline batch contains circular job dependencies."
+                )
+
+            for item in ready:
+                self._fill_dependencies(item)
+
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(ready))
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        submit_deadline_payload,
+                        item["deadline_url"],
+                        item["payload"],
+                        log
+                    )
+                    for item in ready
+                ]
+                # Make sure all submissions finished before raising error
+                results = [future.exception() for future in futures]
+
+            for item, future in zip(ready, futures):
+                if future.exception() is None:
+                    item["result"] = future.result()
+
+            for exc in results:
+                if exc is not None:
+                    raise exc
+
+            pending = [item for item in pending if item["result"] is None]
+
+        # Store results in order of submission so the last job of instance
+        #   is stored
+        for item in self._items:
+            instance = item["instance"]
+            if instance is not None:
+                instance.data["deadlineSubmissionJob"] = item["result"]
+        return [item["result"] for item in self._items]
+
+    def _fill_dependencies(self, item):
+        if not item["dependencies"]:
+            return
+        job_info = item["payload"]["JobInfo"]
+        job_ids = [
+            self._items[idx]["result"]["_id"]
+            for idx in item["dependencies"]
+        ]
+        current = job_info.get("JobDependencies")
+        if current:
+            job_ids.insert(0, current)
+        job_info["JobDependencies"] = ",".join(job_ids)
 
 
 class DeadlineKeyValueVar(dict):
@@ -420,6 +654,11 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
     use_published = True
     asset_dependencies = False
     default_priority = 50
+    # Collect payloads to context batch which is submitted at once by
+    #   'SubmitDeadlineBatch' plugin
+    #   - used only by plugins which don't override 'process_submission'
+    #   - opt-in in settings of AfterEffects, Harmony and Houdini submitters
+    batch_submission = False
 
     def __init__(self, *args, **kwargs):
         super(AbstractSubmitDeadline, self).__init__(*args, **kwargs)
@@ -460,6 +699,10 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
         self.plugin_info = self.get_plugin_info()
         self.aux_files = self.get_aux_files()
 
+        if self._use_batch_submission():
+            self.add_to_batch_submission()
+            return
+
         job_id = self.process_submission()
         self.log.info("Submitted job to Deadline: {}.".format(job_id))
 
@@ -476,6 +719,50 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             render_job_id = self.submit(payload)
             self.log.info("Render job id: %s", render_job_id)
 
+    def _use_batch_submission(self):
+        return (
+            self.batch_submission
+            and type(self).process_submission
+            is AbstractSubmitDeadline.process_submission
+        )
+
+    def add_to_batch_submission(self):
+        """Add payloads of the instance to context batch submission.
+
+        Payloads are submitted later by 'SubmitDeadlineBatch' plugin which
+        also stores response to 'deadlineSubmissionJob' of the instance.
+
+        Returns:
+            list[int]: Indexes of payloads in batch.
+        """
+
+        batch = DeadlineBatchSubmission.get_from_context(
+            self._instance.context
+        )
+        job_idx = batch.add(
+            self._deadline_url,
+            self.assemble_payload(),
+            instance=self._instance,
+        )
+        self.log.info("Job added to Deadline batch submission.")
+        indexes = [job_idx]
+
+        if self._instance.data.get("splitRender"):
+            self.log.info("Splitting export and render in two jobs")
+            render_job_info = self.get_job_info(dependency_job_ids=[])
+            render_plugin_info = self.get_plugin_info(job_type="render")
+            payload = self.assemble_payload(
+                job_info=render_job_info,
+                plugin_info=render_plugin_info
+            )
+            indexes.append(batch.add(
+                self._deadline_url,
+                payload,
+                instance=self._instance,
+                dependencies=[job_idx],
+            ))
+        return indexes
+
     def process_submission(self):
         """Process data for submission.
 
@@ -593,22 +880,7 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             KnownPublishError: if submission fails.
 
         """
-        url = "{}/api/jobs".format(self._deadline_url)
-        response = requests_post(url, json=payload)
-        if not response.ok:
-            self.log.error("Submission failed!")
-            self.log.error(response.status_code)
-            self.log.error(response.content)
-            self.log.debug(payload)
-            raise KnownPublishError(response.text)
-
-        try:
-            result = response.json()
-        except JSONDecodeError:
-            msg = "Broken response {}. ".format(response)
-            msg += "Try restarting the Deadline Webservice."
-            self.log.warning(msg, exc_info=True)
-            raise KnownPublishError("Broken response from DL")
+        result = submit_deadline_payload(self._deadline_url, payload, self.log)
 
         # for submit publish job
         self._instance.data["deadlineSubmissionJob"] = result
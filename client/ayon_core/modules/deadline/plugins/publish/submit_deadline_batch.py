@@ -0,0 +1,31 @@
+import pyblish.api
+
+from openpype_modules.deadline.abstract_submit_deadline import (
+    DeadlineBatchSubmission,
+)
+
+
+class SubmitDeadlineBatch(pyblish.api.ContextPlugin):
+    """Submit Deadline payloads collected by instance submit plugins.
+
+    Submit plugins with enabled 'batch_submission' only add their payloads
+    to batch stored on context. All payloads are submitted here at once and
+    job dependencies between them are resolved.
+    """
+
+    label = "Submit Deadline Batch"
+    order = pyblish.api.IntegratorOrder + 0.15
+    targets = ["local"]
+
+    def process(self, context):
+        batch = context.data.get(DeadlineBatchSubmission.context_key)
+        if not batch:
+            self.log.debug("Nothing to submit in Deadline batch.")
+            return
+
+        self.log.info("Submitting {} jobs to Deadline.".format(len(batch)))
+        results = batch.submit(self.log)
+        for result in results:
+            self.log.info(
+                "Submitted job to Deadline: {}.".format(result["_id"])
+            )
@@ -5,7 +5,6 @@ import json
 import re
 from copy import deepcopy
 
-import requests
 import ayon_api
 import pyblish.api
 
@@ -20,6 +19,9 @@ from ayon_core.pipeline.farm.pyblish_functions import (
     prepare_cache_representations,
     create_metadata_path
 )
+from openpype_modules.deadline.abstract_submit_deadline import (
+    get_deadline_session,
+)
 
 
 class ProcessSubmittedCacheJobOnFarm(pyblish.api.InstancePlugin,
@@ -212,7 +214,8 @@ class ProcessSubmittedCacheJobOnFarm(pyblish.api.InstancePlugin,
         self.log.debug("Submitting Deadline publish job ...")
 
         url = "{}/api/jobs".format(self.deadline_url)
-        response = requests.post(url, json=payload, timeout=10)
+        session = get_deadline_session(url)
+        response = session.post(url, json=payload, timeout=10)
         if not response.ok:
             raise Exception(response.text)
 
@@ -160,10 +160,12 @@ class JobQueueAddon(AYONAddon):
         )
 
     @classmethod
-    def start_server(cls, port=None, host=None):
+    def start_server(
+        cls, port=None, host=None, persistent=False, storage_path=None
+    ):
         from .job_server import main
 
-        return main(port, host)
+        return main(port, host, persistent, storage_path)
 
     @classmethod
     def start_worker(cls, app_name, server_url=None):
@@ -222,8 +224,17 @@ def cli_main():
 )
 @click_wrap.option("--port", help="Server port")
 @click_wrap.option("--host", help="Server host (ip address)")
-def cli_start_server(port, host):
-    JobQueueAddon.start_server(port, host)
+@click_wrap.option(
+    "--persistent",
+    is_flag=True,
+    help="Store jobs to database so they survive server restart."
+)
+@click_wrap.option(
+    "--storage_path",
+    help="Path to jobs database. Implies '--persistent'."
+)
+def cli_start_server(port, host, persistent, storage_path):
+    JobQueueAddon.start_server(port, host, persistent, storage_path)
 
 
 @cli_main.command(
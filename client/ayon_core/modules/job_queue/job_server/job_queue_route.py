@@ -40,7 +40,16 @@ class JobQueueResource:
                 status=400, message="Key \"host_name\" not filled."
             )
 
-        job = self._job_queue.create_job(host_name, data)
+        try:
+            priority = int(data.get("priority") or 0)
+        except (TypeError, ValueError):
+            return Response(
+                status=400, message="Key \"priority\" must be an integer."
+            )
+
+        job = self._job_queue.create_job(
+            host_name, data, priority=priority, user=data.get("user")
+        )
         return Response(status=201, text=job.id)
 
     async def get_job(self, request):
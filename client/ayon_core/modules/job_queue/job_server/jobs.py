@@ -11,7 +11,15 @@ class Job:
     # Remove done jobs each n days to clear memory
     keep_in_memory_days = 3
 
-    def __init__(self, host_name, data, job_id=None, created_time=None):
+    def __init__(
+        self,
+        host_name,
+        data,
+        job_id=None,
+        created_time=None,
+        priority=None,
+        user=None,
+    ):
         if job_id is None:
             job_id = str(uuid4())
         self._id = job_id
@@ -22,6 +30,8 @@ class Job:
         self._done_time = None
         self.host_name = host_name
         self.data = data
+        self.priority = int(priority or 0)
+        self.user = user or ""
         self._result_data = None
 
         self._started = False
@@ -31,6 +41,48 @@ class Job:
         self._deleted = False
 
         self._worker = None
+        self._change_callback = None
+
+    @classmethod
+    def from_stored_data(cls, job_data):
+        """Create job from data loaded from storage.
+
+        Args:
+            job_data (dict[str, Any]): Data from 'JobsStorage'.
+
+        Returns:
+            Job: Restored job.
+        """
+
+        job = cls(
+            job_data["host_name"],
+            job_data["data"],
+            job_id=job_data["id"],
+            created_time=job_data["created_time"],
+            priority=job_data["priority"],
+            user=job_data["user"],
+        )
+        if job_data["done"]:
+            job._done = True
+            job._done_time = job_data["done_time"]
+            job._errored = job_data["errored"]
+            job._message = job_data["message"]
+            job._result_data = job_data["result"]
+        return job
+
+    def set_change_callback(self, callback):
+        """Set callback triggered when job's state changes.
+
+        Args:
+            callback (Union[Callable[[Job], None], None]): Callback which
+                receives the job as argument.
+        """
+
+        self._change_callback = callback
+
+    def _trigger_change(self):
+        if self._change_callback is not None:
+            self._change_callback(self)
 
     def keep_in_memory(self):
         if self._done_time is None:
@@ -48,6 +100,26 @@ class Job:
     def done(self):
         return self._done
 
+    @property
+    def errored(self):
+        return self._errored
+
+    @property
+    def message(self):
+        return self._message
+
+    @property
+    def result_data(self):
+        return self._result_data
+
+    @property
+    def created_time(self):
+        return self._created_time
+
+    @property
+    def done_time(self):
+        return self._done_time
+
     def reset(self):
         self._started = False
         self._started_time = None
@@ -57,6 +129,7 @@ class Job:
         self._message = None
 
         self._worker = None
+        self._trigger_change()
 
     @property
     def started(self):
@@ -93,6 +166,7 @@ class Job:
         self._result_data = data
         if self._worker is not None:
             self._worker.set_current_job(None)
+        self._trigger_change()
 
     def status(self):
         worker_id = None
@@ -122,21 +196,123 @@ class Job:
         return output
 
 
+class HostJobQueue:
+    """Queue of waiting jobs for single host name.
+
+    Jobs with higher priority are popped first. Jobs with same priority are
+    popped in round-robin order across submitting users, and in FIFO order
+    for single user.
+    """
+
+    def __init__(self):
+        # Deques of jobs by user name by priority
+        self._queues_by_priority = {}
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __bool__(self):
+        return self._count > 0
+
+    def _get_user_queue(self, job):
+        user_queues = self._queues_by_priority.get(job.priority)
+        if user_queues is None:
+            user_queues = collections.OrderedDict()
+            self._queues_by_priority[job.priority] = user_queues
+
+        jobs = user_queues.get(job.user)
+        if jobs is None:
+            jobs = collections.deque()
+            user_queues[job.user] = jobs
+        return user_queues, jobs
+
+    def append(self, job):
+        """Add job to the end of queue."""
+        _, jobs = self._get_user_queue(job)
+        jobs.append(job)
+        self._count += 1
+
+    def appendleft(self, job):
+        """Add job to the start of queue, e.g. when worker was lost."""
+        user_queues, jobs = self._get_user_queue(job)
+        jobs.appendleft(job)
+        user_queues.move_to_end(job.user, last=False)
+        self._count += 1
+
+    def popleft(self):
+        """Pop next job from queue.
+
+        Raises:
+            IndexError: When queue is empty.
+        """
+
+        if not self._queues_by_priority:
+            raise IndexError("pop from an empty queue")
+
+        priority = max(self._queues_by_priority)
+        user_queues = self._queues_by_priority[priority]
+        user, jobs = next(iter(user_queues.items()))
+        job = jobs.popleft()
+        self._count -= 1
+        if jobs:
+            # Next job is taken from next user
+            user_queues.move_to_end(user)
+        else:
+            user_queues.pop(user)
+            if not user_queues:
+                self._queues_by_priority.pop(priority)
+        return job
+
+
 class JobQueue:
     """Queue holds jobs that should be done and workers that can do them.
 
     Also asign jobs to a worker.
+
+    Args:
+        storage (Optional[JobsStorage]): Persistent storage of jobs. Jobs
+            are kept only in memory if not passed.
     """
     old_jobs_check_minutes_interval = 30
 
-    def __init__(self):
+    def __init__(self, storage=None):
         self._last_old_jobs_check = datetime.datetime.now()
         self._jobs_by_id = {}
         self._job_queue_by_host_name = collections.defaultdict(
-            collections.deque
+            HostJobQueue
         )
         self._workers_by_id = {}
         self._workers_by_host_name = collections.defaultdict(list)
+        self._idle_workers_by_host_name = collections.defaultdict(
+            collections.OrderedDict
+        )
+        self._storage = storage
+        if storage is not None:
+            self._load_stored_jobs()
+
+    def _load_stored_jobs(self):
+        for job_data in self._storage.load_jobs():
+            job = Job.from_stored_data(job_data)
+            if not job.keep_in_memory():
+                self._storage.remove_job(job.id)
+                continue
+
+            self._jobs_by_id[job.id] = job
+            job.set_change_callback(self._on_job_change)
+            if not job.done:
+                self._job_queue_by_host_name[job.host_name].append(job)
+
+    def _on_job_change(self, job):
+        if self._storage is not None and not job.deleted:
+            self._storage.save_job(job)
+
+    def _on_worker_state_change(self, worker):
+        idle_workers = self._idle_workers_by_host_name[worker.host_name]
+        if worker.is_idle() and worker.id in self._workers_by_id:
+            idle_workers[worker.id] = worker
+        else:
+            idle_workers.pop(worker.id, None)
 
     def workers(self):
         """All currently registered workers."""
@@ -147,6 +323,8 @@ class JobQueue:
         print("Added new worker for \"{}\"".format(host_name))
         self._workers_by_id[worker.id] = worker
         self._workers_by_host_name[host_name].append(worker)
+        worker.set_state_change_callback(self._on_worker_state_change)
+        self._on_worker_state_change(worker)
 
     def get_worker(self, worker_id):
         return self._workers_by_id.get(worker_id)
@@ -163,7 +341,9 @@ class JobQueue:
 
         # Remove worker from registered workers
         self._workers_by_id.pop(worker.id, None)
+        worker.set_state_change_callback(None)
         host_name = worker.host_name
+        self._idle_workers_by_host_name[host_name].pop(worker.id, None)
         if worker in self._workers_by_host_name[host_name]:
             self._workers_by_host_name[host_name].remove(worker)
 
@@ -174,26 +354,21 @@ class JobQueue:
 
         Error all jobs without needed worker.
         """
-        available_host_names = set()
-        for worker in self._workers_by_id.values():
-            host_name = worker.host_name
-            available_host_names.add(host_name)
-            if worker.is_idle():
-                jobs = self._job_queue_by_host_name[host_name]
-                while jobs:
+        for host_name in tuple(self._job_queue_by_host_name.keys()):
+            jobs = self._job_queue_by_host_name[host_name]
+            if self._workers_by_host_name.get(host_name):
+                idle_workers = self._idle_workers_by_host_name[host_name]
+                while jobs and idle_workers:
                     job = jobs.popleft()
                     if not job.deleted:
+                        # Worker is removed from idle workers by callback
+                        worker = next(iter(idle_workers.values()))
                         worker.set_current_job(job)
-                        break
-
-        for host_name in tuple(self._job_queue_by_host_name.keys()):
-            if host_name in available_host_names:
                 continue
 
-            jobs_deque = self._job_queue_by_host_name[host_name]
             message = ("Not available workers for \"{}\"").format(host_name)
-            while jobs_deque:
-                job = jobs_deque.popleft()
+            while jobs:
+                job = jobs.popleft()
                 if not job.deleted:
                     job.set_done(False, message)
         self._remove_old_jobs()
@@ -205,11 +380,13 @@ class JobQueue:
         """Job by it's id."""
         return self._jobs_by_id.get(job_id)
 
-    def create_job(self, host_name, job_data):
+    def create_job(self, host_name, job_data, priority=None, user=None):
         """Create new job from passed data and add it to queue."""
-        job = Job(host_name, job_data)
+        job = Job(host_name, job_data, priority=priority, user=user)
         self._jobs_by_id[job.id] = job
         self._job_queue_by_host_name[host_name].append(job)
+        job.set_change_callback(self._on_job_change)
+        self._on_job_change(job)
         return job
 
     def _remove_old_jobs(self):
@@ -222,6 +399,8 @@ class JobQueue:
             job = self._jobs_by_id[job_id]
             if not job.keep_in_memory():
                 self._jobs_by_id.pop(job_id)
+                if self._storage is not None:
+                    self._storage.remove_job(job_id)
 
     def remove_job(self, job_id):
         """Delete job and eventually stop it."""
@@ -231,6 +410,8 @@ class JobQueue:
 
         job.set_deleted()
         self._jobs_by_id.pop(job.id)
+        if self._storage is not None:
+            self._storage.remove_job(job.id)
 
     def get_job_status(self, job_id):
         """Job's status based on id."""
@@ -13,7 +13,7 @@ log = logging.getLogger(__name__)
 
 class WebServerManager:
     """Manger that care about web server thread."""
-    def __init__(self, port, host, loop=None):
+    def __init__(self, port, host, loop=None, storage=None):
         self.port = port
         self.host = host
         self.app = web.Application()
@@ -21,7 +21,7 @@ class WebServerManager:
             loop = asyncio.new_event_loop()
 
         # add route with multiple methods for single "external app"
-        self.webserver_thread = WebServerThread(self, loop)
+        self.webserver_thread = WebServerThread(self, loop, storage)
 
     @property
     def url(self):
@@ -61,7 +61,7 @@ class WebServerManager:
 
 class WebServerThread(threading.Thread):
     """ Listener for requests in thread."""
-    def __init__(self, manager, loop):
+    def __init__(self, manager, loop, storage=None):
         super(WebServerThread, self).__init__()
 
         self._is_running = False
@@ -71,7 +71,7 @@ class WebServerThread(threading.Thread):
         self.runner = None
         self.site = None
 
-        job_queue = JobQueue()
+        job_queue = JobQueue(storage)
         self.job_queue_route = JobQueueResource(job_queue, manager)
         self.workers_route = WorkerRpc(job_queue, manager, loop=loop)
 
@@ -0,0 +1,154 @@
+import os
+import json
+import sqlite3
+import datetime
+import threading
+
+from ayon_core.lib.local_settings import get_ayon_appdirs
+
+
+def get_default_storage_path():
+    """Default path to jobs database in AYON app data directory."""
+    return get_ayon_appdirs("job_queue", "jobs.db")
+
+
+class JobsStorage:
+    """Persistent storage of jobs using SQLite database.
+
+    Database is using WAL journal mode so writes of jobs state are cheap and
+    don't block readers. Jobs which were not finished are queued again when
+    server is restarted.
+
+    Args:
+        filepath (Optional[str]): Path to database file. Default path in
+            AYON app data directory is used if not passed.
+    """
+
+    def __init__(self, filepath=None):
+        if not filepath:
+            filepath = get_default_storage_path()
+
+        dirpath = os.path.dirname(filepath)
+        if dirpath and not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        self._filepath = filepath
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            filepath, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " host_name TEXT NOT NULL,"
+            " user TEXT NOT NULL,"
+            " priority INTEGER NOT NULL,"
+            " created_time TEXT NOT NULL,"
+            " done_time TEXT,"
+            " done INTEGER NOT NULL,"
+            " errored INTEGER NOT NULL,"
+            " message TEXT,"
+            " data TEXT,"
+            " result TEXT"
+            ")"
+        )
+        self._connection.commit()
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def load_jobs(self):
+        """Load stored jobs.
+
+        Returns:
+            list[dict[str, Any]]: Jobs data ordered by creation time.
+        """
+
+        with self._lock:
+            cursor = self._connection.execute(
+                "SELECT id, host_name, user, priority, created_time,"
+                " done_time, done, errored, message, data, result"
+                " FROM jobs ORDER BY created_time"
+            )
+            rows = cursor.fetchall()
+
+        output = []
+        for row in rows:
+            (
+                job_id, host_name, user, priority, created_time,
+                done_time, done, errored, message, data, result
+            ) = row
+            if done_time:
+                done_time = datetime.datetime.fromisoformat(done_time)
+            output.append({
+                "id": job_id,
+                "host_name": host_name,
+                "user": user,
+                "priority": priority,
+                "created_time": datetime.datetime.fromisoformat(
+                    created_time
+                ),
+                "done_time": done_time or None,
+                "done": bool(done),
+                "errored": bool(errored),
+                "message": message,
+                "data": json.loads(data) if data else None,
+                "result": json.loads(result) if result else None,
+            })
+        return output
+
+    def save_job(self, job):
+        """Store current state of job.
+
+        Args:
+            job (Job): Job to store.
+        """
+
+        done_time = job.done_time
+        if done_time is not None:
+            done_time = done_time.isoformat()
+
+        result = job.result_data
+        if result is not None:
+            result = json.dumps(result)
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO jobs (id, host_name, user, priority,"
+                " created_time, done_time, done, errored, message, data,"
+                " result) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job.id,
+                    job.host_name,
+                    job.user,
+                    job.priority,
+                    job.created_time.isoformat(),
+                    done_time,
+                    int(job.done),
+                    int(job.errored),
+                    job.message,
+                    json.dumps(job.data),
+                    result,
+                )
+            )
+            self._connection.commit()
+
+    def remove_job(self, job_id):
+        """Remove job from storage.
+
+        Args:
+            job_id (str): Job id.
+        """
+
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM jobs WHERE id = ?", (job_id, )
+            )
+            self._connection.commit()
@@ -4,6 +4,7 @@ import time
 import socket
 
 from .server import WebServerManager
+from .storage import JobsStorage
 
 
 class SharedObjects:
@@ -14,7 +15,7 @@ class SharedObjects:
         cls.stopped = True
 
 
-def main(port=None, host=None):
+def main(port=None, host=None, persistent=False, storage_path=None):
     def signal_handler(sig, frame):
         print("Signal to kill process received. Termination starts.")
         SharedObjects.stop()
@@ -34,8 +35,13 @@ def main(port=None, host=None):
         ).format(host, port))
         return 1
 
+    storage = None
+    if persistent or storage_path:
+        storage = JobsStorage(storage_path)
+        print("Using jobs storage {}".format(storage.filepath))
+
     print("Running server {}:{}".format(host, port))
-    manager = WebServerManager(port, host)
+    manager = WebServerManager(port, host, storage=storage)
     manager.start_server()
 
     stopped = False
@@ -44,6 +50,9 @@ def main(port=None, host=None):
             stopped = True
             manager.stop_server()
         time.sleep(0.1)
+
+    if storage is not None:
+        storage.close()
     return 0
 
 
@@ -18,6 +18,7 @@ class Worker:
         self._http_request = http_request
         self._state = WorkerState.IDLE
         self._job = None
+        self._state_change_callback = None
 
         # Give ability to send requests to worker
         http_request.request_id = str(uuid4())
@@ -103,6 +104,16 @@ class Worker:
     def is_working(self):
         return self._state is WorkerState.JOB_SENT
 
+    def set_state_change_callback(self, callback):
+        """Set callback triggered when worker's state changes.
+
+        Args:
+            callback (Union[Callable[[Worker], None], None]): Callback
+                which receives the worker as argument.
+        """
+
+        self._state_change_callback = callback
+
     def set_current_job(self, job):
         if job is self._job:
             return
@@ -111,12 +122,17 @@ class Worker:
         if job is None:
             self._set_idle()
         else:
-            self._state = WorkerState.JOB_ASSIGNED
+            self._set_state(WorkerState.JOB_ASSIGNED)
             job.set_worker(self)
 
     def _set_idle(self):
         self._job = None
-        self._state = WorkerState.IDLE
+        self._set_state(WorkerState.IDLE)
 
     def set_working(self):
-        self._state = WorkerState.JOB_SENT
+        self._set_state(WorkerState.JOB_SENT)
+
+    def _set_state(self, state):
+        self._state = state
+        if self._state_change_callback is not None:
+            self._state_change_callback(self)
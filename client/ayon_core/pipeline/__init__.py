@@ -42,6 +42,7 @@ from .load import (
     load_container,
     remove_container,
     update_container,
+    update_containers,
     switch_container,
 
     loaders_from_representation,
@@ -147,6 +148,7 @@ __all__ = (
     "load_container",
     "remove_container",
     "update_container",
+    "update_containers",
     "switch_container",
 
     "loaders_from_representation",
@@ -1,11 +1,17 @@
 import re
 import os
 import json
+import time
+import atexit
+import threading
 import contextlib
 import functools
 import platform
 import tempfile
 import warnings
+import subprocess
+import collections
+import queue
 from copy import deepcopy
 
 from ayon_core import AYON_CORE_ROOT
@@ -13,8 +19,10 @@ from ayon_core.settings import get_project_settings
 from ayon_core.lib import (
     StringTemplate,
     run_ayon_launcher_process,
+    get_ayon_launcher_args,
     Logger
 )
+from ayon_core.lib.execute import clean_envs_for_ayon_process
 from ayon_core.pipeline import Anatomy
 from ayon_core.lib.transcoding import VIDEO_EXTENSIONS, IMAGE_EXTENSIONS
 
@@ -25,13 +33,46 @@ log = Logger.get_logger(__name__)
 class CachedData:
     remapping = {}
     has_compatible_ocio_package = None
+    # Data cached by config path with modification time of the config
     config_version_data = {}
     ocio_config_colorspaces = {}
+    ocio_config_views = {}
+    config_file_rules_colorspaces = {}
+    # Compiled imageio file rules from settings
+    compiled_file_rules = {}
     allowed_exts = {
         ext.lstrip(".") for ext in IMAGE_EXTENSIONS.union(VIDEO_EXTENSIONS)
     }
 
 
+def _get_cached_config_data(cache, config_path, get_func):
+    """Get data cached for config path.
+
+    Cached data are used only if modification time of the config file did
+    not change since the data were cached.
+
+    Args:
+        cache (dict[str, tuple[Union[int, None], Any]]): Cache where data
+            are stored.
+        config_path (str): Path to config.ocio file.
+        get_func (Callable[[], Any]): Function used to get data if cache
+            is not valid.
+
+    Returns:
+        Any: Cached data.
+    """
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    cached = cache.get(config_path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, get_func())
+        cache[config_path] = cached
+    return cached[1]
+
+
 class DeprecatedWarning(DeprecationWarning):
     pass
 
@@ -120,6 +161,223 @@ def get_ocio_config_script_path():
     )
 
 
+class _OCIOWorkerError(Exception):
+    """OCIO worker process could not be used."""
+    pass
+
+
+class _OCIOWorker:
+    """Long running process used to query OCIO data.
+
+    Process is running 'ocio_wrapper.py serve' and is used for whole host
+    session, so a new process is not started for each query. Results are
+    cached by config path, config modification time and query.
+    """
+
+    # Must match 'RESPONSE_PREFIX' in 'ocio_wrapper.py'
+    response_prefix = "__ayon_ocio_response__:"
+    cache_size = 256
+    # Seconds to wait for response before worker is considered stuck
+    response_timeout = 60
+
+    _lock = threading.Lock()
+    _process = None
+    _output_queue = None
+    _disabled = False
+    _request_id = 0
+    _cache = collections.OrderedDict()
+
+    @classmethod
+    def call(cls, command, **kwargs):
+        """Run command in worker process.
+
+        Args:
+            command (str): Command name of 'ocio_wrapper.py'.
+            **kwargs (str): Command arguments.
+
+        Returns:
+            Any: Result of the command.
+
+        Raises:
+            _OCIOWorkerError: Worker process is not available.
+            RuntimeError: Command failed in worker process.
+        """
+
+        cache_key = cls._get_cache_key(command, kwargs)
+        with cls._lock:
+            if cache_key is not None and cache_key in cls._cache:
+                cls._cache.move_to_end(cache_key)
+                return deepcopy(cls._cache[cache_key])
+
+            result = cls._send_request(command, kwargs)
+            if cache_key is not None:
+                cls._cache[cache_key] = deepcopy(result)
+                while len(cls._cache) > cls.cache_size:
+                    cls._cache.popitem(last=False)
+        return result
+
+    @classmethod
+    def stop(cls, kill=False):
+        """Stop worker process if is running.
+
+        Args:
+            kill (Optional[bool]): Kill process without waiting for it to
+                finish.
+        """
+        process = cls._process
+        cls._process = None
+        cls._output_queue = None
+        if process is None or process.poll() is not None:
+            return
+
+        if kill:
+            process.kill()
+            return
+
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except Exception:
+            process.kill()
+
+    @staticmethod
+    def _get_cache_key(command, kwargs):
+        config_path = kwargs.get("in_path") or kwargs.get("config_path")
+        if not config_path:
+            return None
+        try:
+            mtime = os.stat(config_path).st_mtime_ns
+        except OSError:
+            return None
+        return (
+            os.path.normpath(config_path),
+            mtime,
+            command,
+            tuple(
+                (key, tuple(value) if isinstance(value, list) else value)
+                for key, value in sorted(kwargs.items())
+            )
+        )
+
+    @classmethod
+    def _get_process(cls):
+        if cls._disabled:
+            raise _OCIOWorkerError("OCIO worker process is not available.")
+
+        if cls._process is not None and cls._process.poll() is None:
+            return cls._process
+
+        kwargs = {}
+        if platform.system().lower() == "windows":
+            kwargs["creationflags"] = getattr(
+                subprocess, "CREATE_NO_WINDOW", 0
+            )
+
+        try:
+            args = get_ayon_launcher_args(
+                "run", get_ocio_config_script_path(), "serve"
+            )
+            log.debug("Starting OCIO worker: {}".format(" ".join(args)))
+            process = subprocess.Popen(
+                args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=clean_envs_for_ayon_process(os.environ),
+                universal_newlines=True,
+                bufsize=1,
+                **kwargs
+            )
+        except Exception as exc:
+            cls._disabled = True
+            raise _OCIOWorkerError(
+                "Failed to start OCIO worker process. {}".format(exc)
+            )
+
+        # Output is read in thread so waiting for response can time out
+        output_queue = queue.Queue()
+        thread = threading.Thread(
+            target=cls._read_output, args=(process.stdout, output_queue)
+        )
+        thread.daemon = True
+        thread.start()
+
+        cls._process = process
+        cls._output_queue = output_queue
+        return process
+
+    @staticmethod
+    def _read_output(stdout, output_queue):
+        try:
+            for line in stdout:
+                output_queue.put(line)
+        except (OSError, ValueError):
+            pass
+        # Mark end of output
+        output_queue.put(None)
+
+    @classmethod
+    def _send_request(cls, command, kwargs):
+        process = cls._get_process()
+        cls._request_id += 1
+        request_id = cls._request_id
+        request = json.dumps({
+            "id": request_id,
+            "command": command,
+            "kwargs": kwargs,
+        })
+        output_queue = cls._output_queue
+        deadline = time.time() + cls.response_timeout
+        try:
+            process.stdin.write(request + "\n")
+            process.stdin.flush()
+            while True:
+                try:
+                    line = output_queue.get(
+                        timeout=max(deadline - time.time(), 0)
+                    )
+                except queue.Empty:
+                    # Worker is stuck and can't be used anymore
+                    cls._disabled = True
+                    cls.stop(kill=True)
+                    raise _OCIOWorkerError(
+                        "OCIO worker did not respond in {} seconds.".format(
+                            cls.response_timeout
+                        )
+                    )
+
+                if not line:
+                    raise _OCIOWorkerError(
+                        "OCIO worker process ended unexpectedly."
+                    )
+
+                if not line.startswith(cls.response_prefix):
+                    log.debug(line.rstrip())
+                    continue
+
+                response = json.loads(line[len(cls.response_prefix):])
+                if response["id"] == request_id:
+                    break
+
+        except (OSError, ValueError, _OCIOWorkerError) as exc:
+            # Don't try to use the worker anymore if it did not respond
+            cls._disabled = True
+            cls.stop()
+            raise _OCIOWorkerError(str(exc))
+
+        error = response.get("error")
+        if error:
+            raise RuntimeError(
+                "OCIO worker failed to process '{}'.\n{}".format(
+                    command, error
+                )
+            )
+        return response["result"]
+
+
+atexit.register(_OCIOWorker.stop)
+
+
 def get_colorspace_name_from_filepath(
     filepath, host_name, project_name,
     config_data=None, file_rules=None,
@@ -143,6 +401,46 @@ def get_colorspace_name_from_filepath(
     Returns:
         str: name of colorspace
     """
+    return get_colorspaces_from_filepaths(
+        [filepath], host_name, project_name,
+        config_data=config_data,
+        file_rules=file_rules,
+        project_settings=project_settings,
+        validate=validate
+    )[filepath]
+
+
+def get_colorspaces_from_filepaths(
+    filepaths, host_name, project_name,
+    config_data=None, file_rules=None,
+    project_settings=None,
+    validate=True
+):
+    """Get colorspace names for multiple filepaths.
+
+    Same logic as 'get_colorspace_name_from_filepath' is used but settings,
+    file rules and config data are resolved only once for all filepaths.
+    Useful to resolve colorspaces of sequence files or of multiple
+    representations at once.
+
+    Args:
+        filepaths (Iterable[str]): path strings, file rule pattern is
+            tested on them
+        host_name (str): host name
+        project_name (str): project name
+        config_data (Optional[dict]): config path and template in dict.
+                                      Defaults to None.
+        file_rules (Optional[dict]): file rule data from settings.
+                                     Defaults to None.
+        project_settings (Optional[dict]): project settings. Defaults to None.
+        validate (Optional[bool]): should resulting colorspaces be validated
+                                with config file? Defaults to True.
+
+    Returns:
+        dict[str, Union[str, None]]: colorspace name by filepath
+    """
+    filepaths = list(filepaths)
+    output = {filepath: None for filepath in filepaths}
     project_settings, config_data, file_rules = _get_context_settings(
         host_name, project_name,
         config_data=config_data, file_rules=file_rules,
@@ -151,40 +449,62 @@ def get_colorspace_name_from_filepath(
 
     if not config_data:
         # in case global or host color management is not enabled
-        return None
+        return output
+
+    config_path = config_data["path"]
 
     # use ImageIO file rules
-    colorspace_name = get_imageio_file_rules_colorspace_from_filepath(
-        filepath, host_name, project_name,
-        config_data=config_data, file_rules=file_rules,
-        project_settings=project_settings
-    )
+    compiled_file_rules = _get_compiled_file_rules(file_rules)
+    for filepath in output:
+        output[filepath] = _get_file_rules_colorspace(
+            compiled_file_rules, filepath
+        )
 
     # try to get colorspace from OCIO v2 file rules
+    missing = [
+        filepath
+        for filepath, colorspace_name in output.items()
+        if not colorspace_name
+    ]
     if (
-        not colorspace_name
-        and compatibility_check_config_version(config_data["path"], major=2)
+        missing
+        and compatibility_check_config_version(config_path, major=2)
     ):
-        colorspace_name = get_config_file_rules_colorspace_from_filepath(
-            config_data["path"], filepath)
+        output.update(
+            _get_config_file_rules_colorspaces(config_path, missing)
+        )
 
     # use parse colorspace from filepath as fallback
-    colorspace_name = colorspace_name or parse_colorspace_from_filepath(
-        filepath, config_path=config_data["path"]
-    )
+    missing = [
+        filepath
+        for filepath, colorspace_name in output.items()
+        if not colorspace_name
+    ]
+    if missing:
+        colorspaces = get_ocio_config_colorspaces(config_path)["colorspaces"]
+        for filepath in missing:
+            output[filepath] = parse_colorspace_from_filepath(
+                filepath, colorspaces=colorspaces, config_path=config_path
+            )
 
-    if not colorspace_name:
-        log.info("No imageio file rule matched input path: '{}'".format(
-            filepath
+    not_matched = [
+        filepath
+        for filepath, colorspace_name in output.items()
+        if not colorspace_name
+    ]
+    if not_matched:
+        log.info("No imageio file rule matched input paths: {}".format(
+            ", ".join("'{}'".format(path) for path in not_matched)
         ))
-        return None
 
-    # validate matching colorspace with config
+    # validate matching colorspaces with config
     if validate:
-        validate_imageio_colorspace_in_config(
-            config_data["path"], colorspace_name)
+        for colorspace_name in set(output.values()):
+            if colorspace_name:
+                validate_imageio_colorspace_in_config(
+                    config_path, colorspace_name)
 
-    return colorspace_name
+    return output
 
 
 # TODO: remove this in future - backward compatibility
@@ -253,20 +573,44 @@ def get_imageio_file_rules_colorspace_from_filepath(
         return None
 
     # match file rule from path
-    colorspace_name = None
-    for file_rule in file_rules:
-        pattern = file_rule["pattern"]
-        extension = file_rule["ext"]
-        ext_match = re.match(
-            r".*(?=.{})".format(extension), filepath
-        )
-        file_match = re.search(
-            pattern, filepath
-        )
+    return _get_file_rules_colorspace(
+        _get_compiled_file_rules(file_rules), filepath
+    )
+
 
-        if ext_match and file_match:
-            colorspace_name = file_rule["colorspace"]
+def _get_compiled_file_rules(file_rules):
+    """Compile regexes of imageio file rules from settings.
 
+    Args:
+        file_rules (list[dict[str, str]]): file rule data from settings
+
+    Returns:
+        list[tuple[re.Pattern, re.Pattern, str]]: extension regex, pattern
+            regex and colorspace name of each file rule
+    """
+    key = tuple(
+        (file_rule["pattern"], file_rule["ext"], file_rule["colorspace"])
+        for file_rule in file_rules
+    )
+    compiled_rules = CachedData.compiled_file_rules.get(key)
+    if compiled_rules is None:
+        compiled_rules = [
+            (
+                re.compile(r".*(?=.{})".format(extension)),
+                re.compile(pattern),
+                colorspace_name
+            )
+            for pattern, extension, colorspace_name in key
+        ]
+        CachedData.compiled_file_rules[key] = compiled_rules
+    return compiled_rules
+
+
+def _get_file_rules_colorspace(compiled_file_rules, filepath):
+    colorspace_name = None
+    for ext_regex, pattern_regex, rule_colorspace in compiled_file_rules:
+        if ext_regex.match(filepath) and pattern_regex.search(filepath):
+            colorspace_name = rule_colorspace
     return colorspace_name
 
 
@@ -283,25 +627,73 @@ def get_config_file_rules_colorspace_from_filepath(config_path, filepath):
     Returns:
         Union[str, None]: matching colorspace name
     """
-    if not compatibility_check():
-        # python environment is not compatible with PyOpenColorIO
-        # needs to be run in subprocess
-        result_data = _get_wrapped_with_subprocess(
+    return _get_config_file_rules_colorspaces(
+        config_path, [filepath]
+    )[filepath] or None
+
+
+def _get_config_file_rules_colorspaces(config_path, filepaths):
+    """Get colorspaces from OCIO v2 file rules for multiple file paths.
+
+    Results are cached by config path and its modification time.
+
+    Args:
+        config_path (str): path leading to config.ocio file
+        filepaths (list[str]): paths leading to files
+
+    Returns:
+        dict[str, Union[str, None]]: matching colorspace name by filepath
+    """
+    cached = _get_cached_config_data(
+        CachedData.config_file_rules_colorspaces, config_path, dict
+    )
+    missing = [
+        filepath
+        for filepath in set(filepaths)
+        if filepath not in cached
+    ]
+    if missing:
+        if compatibility_check():
+            # TODO: refactor this so it is not imported but part of this file
+            from ayon_core.scripts.ocio_wrapper import _get_config_file_rules_colorspaces_from_filepaths  # noqa: E501
+
+            result = _get_config_file_rules_colorspaces_from_filepaths(
+                config_path, missing
+            )
+        else:
+            # python environment is not compatible with PyOpenColorIO
+            # needs to be run in subprocess
+            result = _get_wrapped_config_file_rules_colorspaces(
+                config_path, missing
+            )
+        cached.update(result)
+
+    return {
+        filepath: cached[filepath]
+        for filepath in filepaths
+    }
+
+
+def _get_wrapped_config_file_rules_colorspaces(config_path, filepaths):
+    try:
+        return _OCIOWorker.call(
+            "get_config_file_rules_colorspaces_from_filepaths",
+            config_path=config_path,
+            filepaths=filepaths
+        )
+    except _OCIOWorkerError as exc:
+        log.debug(
+            "OCIO worker is not available, using new process. {}".format(exc)
+        )
+
+    return {
+        filepath: _run_ocio_wrapper_process(
             "colorspace", "get_config_file_rules_colorspace_from_filepath",
             config_path=config_path,
             filepath=filepath
         )
-        if result_data:
-            return result_data[0]
-
-    # TODO: refactor this so it is not imported but part of this file
-    from ayon_core.scripts.ocio_wrapper import _get_config_file_rules_colorspace_from_filepath  # noqa: E501
-
-    result_data = _get_config_file_rules_colorspace_from_filepath(
-        config_path, filepath)
-
-    if result_data:
-        return result_data[0]
+        for filepath in filepaths
+    }
 
 
 def parse_colorspace_from_filepath(
@@ -330,27 +722,6 @@ def parse_colorspace_from_filepath(
     Returns:
         str: name of colorspace
     """
-    def _get_colorspace_match_regex(colorspaces):
-        """Return a regex pattern
-
-        Allows to search a colorspace match in a filename
-
-        Args:
-            colorspaces (list): List of colorspace names
-
-        Returns:
-            re.Pattern: regex pattern
-        """
-        pattern = "|".join(
-            # Allow to match spaces also as underscores because the
-            # integrator replaces spaces with underscores in filenames
-            re.escape(colorspace) for colorspace in
-            # Sort by longest first so the regex matches longer matches
-            # over smaller matches, e.g. matching 'Output - sRGB' over 'sRGB'
-            sorted(colorspaces, key=len, reverse=True)
-        )
-        return re.compile(pattern)
-
     if not colorspaces and not config_path:
         raise ValueError(
             "Must provide `config_path` if `colorspaces` is not provided."
@@ -360,14 +731,11 @@ def parse_colorspace_from_filepath(
         colorspaces
         or get_ocio_config_colorspaces(config_path)["colorspaces"]
     )
-    underscored_colorspaces = {
-        key.replace(" ", "_"): key for key in colorspaces
-        if " " in key
-    }
+    regex_pattern, underscored_colorspaces = _get_colorspace_match_data(
+        tuple(colorspaces)
+    )
 
     # match colorspace from  filepath
-    regex_pattern = _get_colorspace_match_regex(
-        list(colorspaces) + list(underscored_colorspaces))
     match = regex_pattern.search(filepath)
     colorspace = match.group(0) if match else None
 
@@ -383,6 +751,38 @@ def parse_colorspace_from_filepath(
     return None
 
 
+@functools.lru_cache(maxsize=32)
+def _get_colorspace_match_data(colorspaces):
+    """Return a regex pattern and underscored colorspace names
+
+    Allows to search a colorspace match in a filename
+
+    Args:
+        colorspaces (tuple[str]): Colorspace names
+
+    Returns:
+        tuple[re.Pattern, dict[str, str]]: regex pattern and colorspace
+            names by their underscored variant
+    """
+    underscored_colorspaces = {
+        key.replace(" ", "_"): key for key in colorspaces
+        if " " in key
+    }
+    pattern = "|".join(
+        # Allow to match spaces also as underscores because the
+        # integrator replaces spaces with underscores in filenames
+        re.escape(colorspace) for colorspace in
+        # Sort by longest first so the regex matches longer matches
+        # over smaller matches, e.g. matching 'Output - sRGB' over 'sRGB'
+        sorted(
+            list(colorspaces) + list(underscored_colorspaces),
+            key=len,
+            reverse=True
+        )
+    )
+    return re.compile(pattern), underscored_colorspaces
+
+
 def validate_imageio_colorspace_in_config(config_path, colorspace_name):
     """Validator making sure colorspace name is used in config.ocio
 
@@ -423,7 +823,28 @@ def get_data_subprocess(config_path, data_type):
 def _get_wrapped_with_subprocess(command_group, command, **kwargs):
     """Get data via subprocess
 
-    Wrapper for Python 2 hosts.
+    Wrapper for Python 2 hosts. Long running OCIO worker process is used
+    if possible, otherwise new process is started for the query.
+
+    Args:
+        command_group (str): command group name
+        command (str): command name
+        **kwargs: command arguments
+
+    Returns:
+        Any[dict, None]: data
+    """
+    try:
+        return _OCIOWorker.call(command, **kwargs)
+    except _OCIOWorkerError as exc:
+        log.debug(
+            "OCIO worker is not available, using new process. {}".format(exc)
+        )
+    return _run_ocio_wrapper_process(command_group, command, **kwargs)
+
+
+def _run_ocio_wrapper_process(command_group, command, **kwargs):
+    """Get data via new process of 'ocio_wrapper.py'.
 
     Args:
         command_group (str): command group name
@@ -475,28 +896,29 @@ def compatibility_check():
 def compatibility_check_config_version(config_path, major=1, minor=None):
     """Making sure PyOpenColorIO config version is compatible"""
 
-    if not CachedData.config_version_data.get(config_path):
+    def _get_version_data():
         if compatibility_check():
             # TODO: refactor this so it is not imported but part of this file
             from ayon_core.scripts.ocio_wrapper import _get_version_data
 
-            CachedData.config_version_data[config_path] = \
-                _get_version_data(config_path)
+            return _get_version_data(config_path)
 
-        else:
-            # python environment is not compatible with PyOpenColorIO
-            # needs to be run in subprocess
-            CachedData.config_version_data[config_path] = \
-                _get_wrapped_with_subprocess(
-                    "config", "get_version", config_path=config_path
-            )
+        # python environment is not compatible with PyOpenColorIO
+        # needs to be run in subprocess
+        return _get_wrapped_with_subprocess(
+            "config", "get_version", config_path=config_path
+        )
+
+    version_data = _get_cached_config_data(
+        CachedData.config_version_data, config_path, _get_version_data
+    )
 
     # check major version
-    if CachedData.config_version_data[config_path]["major"] != major:
+    if version_data["major"] != major:
         return False
 
     # check minor version
-    if minor and CachedData.config_version_data[config_path]["minor"] != minor:
+    if minor and version_data["minor"] != minor:
         return False
 
     # compatible
@@ -515,22 +937,22 @@ def get_ocio_config_colorspaces(config_path):
     Returns:
         dict: colorspace and family in couple
     """
-    if not CachedData.ocio_config_colorspaces.get(config_path):
+    def _get_colorspaces():
         if not compatibility_check():
             # python environment is not compatible with PyOpenColorIO
             # needs to be run in subprocess
-            CachedData.ocio_config_colorspaces[config_path] = \
-                _get_wrapped_with_subprocess(
-                    "config", "get_colorspace", in_path=config_path
+            return _get_wrapped_with_subprocess(
+                "config", "get_colorspace", in_path=config_path
             )
-        else:
-            # TODO: refactor this so it is not imported but part of this file
-            from ayon_core.scripts.ocio_wrapper import _get_colorspace_data
 
-            CachedData.ocio_config_colorspaces[config_path] = \
-                _get_colorspace_data(config_path)
+        # TODO: refactor this so it is not imported but part of this file
+        from ayon_core.scripts.ocio_wrapper import _get_colorspace_data
 
-    return CachedData.ocio_config_colorspaces[config_path]
+        return _get_colorspace_data(config_path)
+
+    return _get_cached_config_data(
+        CachedData.ocio_config_colorspaces, config_path, _get_colorspaces
+    )
 
 
 def convert_colorspace_enumerator_item(
@@ -714,17 +1136,22 @@ def get_ocio_config_views(config_path):
     Returns:
         dict: `display/viewer` and viewer data
     """
-    if not compatibility_check():
-        # python environment is not compatible with PyOpenColorIO
-        # needs to be run in subprocess
-        return _get_wrapped_with_subprocess(
-            "config", "get_views", in_path=config_path
-        )
+    def _get_views():
+        if not compatibility_check():
+            # python environment is not compatible with PyOpenColorIO
+            # needs to be run in subprocess
+            return _get_wrapped_with_subprocess(
+                "config", "get_views", in_path=config_path
+            )
+
+        # TODO: refactor this so it is not imported but part of this file
+        from ayon_core.scripts.ocio_wrapper import _get_views_data
 
-    # TODO: refactor this so it is not imported but part of this file
-    from ayon_core.scripts.ocio_wrapper import _get_views_data
+        return _get_views_data(config_path)
 
-    return _get_views_data(config_path)
+    return _get_cached_config_data(
+        CachedData.ocio_config_views, config_path, _get_views
+    )
 
 
 # TODO: remove this in future - backward compatibility
@@ -1122,7 +1549,7 @@ def set_colorspace_data_to_representation(
         filename = filename[0]
 
     # get matching colorspace from rules
-    colorspace = colorspace or get_imageio_colorspace_from_filepath(
+    colorspace = colorspace or get_imageio_file_rules_colorspace_from_filepath(
         filename, host_name, project_name,
         config_data=config_data,
         file_rules=file_rules,
@@ -1176,6 +1603,18 @@ def get_display_view_colorspace_subprocess(config_path, display, view):
         view color space name (str) e.g. "Output - sRGB"
     """
 
+    try:
+        return _OCIOWorker.call(
+            "get_display_view_colorspace_name",
+            in_path=config_path,
+            display=display,
+            view=view
+        )
+    except _OCIOWorkerError as exc:
+        log.debug(
+            "OCIO worker is not available, using new process. {}".format(exc)
+        )
+
     with _make_temp_json_file() as tmp_json_path:
         # Prepare subprocess arguments
         args = [
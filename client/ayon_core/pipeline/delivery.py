@@ -1,12 +1,20 @@
 """Functions useful for delivery of published representations."""
 import os
 import copy
+import time
 import shutil
 import glob
-import clique
 import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import clique
 
-from ayon_core.lib import create_hard_link
+from ayon_core.lib import (
+    Logger,
+    create_hard_link,
+    collect_frames,
+    get_datetime_data,
+)
 
 
 def _copy_file(src_path, dst_path):
@@ -327,3 +335,511 @@ def deliver_sequence(
         uploaded += 1
 
     return report_items, uploaded
+
+
+DeliveryTransfer = collections.namedtuple(
+    "DeliveryTransfer",
+    ["representation_id", "src_path", "dst_path", "size"]
+)
+
+
+class RepresentationsDelivery(object):
+    """Plan and process delivery of multiple representations.
+
+    Source and destination paths of all files are planned before any file
+    is transferred, same transfers are processed only once. Files are
+    hardlinked if possible, copied otherwise, using multiple threads.
+
+    Planned transfers can be used as dry-run manifest with 'get_manifest'.
+
+    Example:
+        delivery = RepresentationsDelivery(anatomy, "default")
+        delivery.add_representations(repre_entities)
+        report_items, delivered = delivery.deliver(print)
+
+    Args:
+        anatomy (Anatomy): Project anatomy.
+        template_name (str): Name of delivery template.
+        format_dict (Optional[dict]): Root values used instead of anatomy
+            roots for destination (output of 'get_format_dict').
+        renumber_frame (Optional[bool]): Renumber frames of sequences.
+        frame_start (Optional[int]): First frame of renumbered sequences.
+        max_workers (Optional[int]): Maximum number of transfer threads.
+        log (Optional[logging.Logger]): Logger.
+    """
+
+    frame_indicator = "@####@"
+    default_max_workers = 8
+    # Minimum time between progress callbacks in seconds
+    progress_interval = 0.1
+
+    def __init__(
+        self,
+        anatomy,
+        template_name,
+        format_dict=None,
+        renumber_frame=False,
+        frame_start=0,
+        max_workers=None,
+        log=None,
+    ):
+        from ayon_core.pipeline.load import RepresentationPathResolver
+
+        if log is None:
+            log = Logger.get_logger(self.__class__.__name__)
+
+        self._anatomy = anatomy
+        self._template_name = template_name
+        self._format_dict = format_dict or {}
+        self._renumber_frame = renumber_frame
+        self._frame_start = frame_start
+        self._max_workers = max_workers or self.default_max_workers
+        self._log = log
+
+        self._path_resolver = RepresentationPathResolver(anatomy)
+        self._datetime_data = get_datetime_data()
+        self._report_items = collections.defaultdict(list)
+        self._transfers_by_dst = collections.OrderedDict()
+        self._dir_files_cache = {}
+
+    @property
+    def report_items(self):
+        return self._report_items
+
+    @property
+    def transfers(self):
+        """Planned transfers.
+
+        Returns:
+            list[DeliveryTransfer]: Planned transfers.
+        """
+
+        return list(self._transfers_by_dst.values())
+
+    def add_representations(self, repre_entities):
+        """Plan delivery of representations.
+
+        Args:
+            repre_entities (Iterable[dict[str, Any]]): Representation
+                entities.
+        """
+
+        for repre_entity in repre_entities:
+            self.add_representation(repre_entity)
+
+    def add_representation(self, repre_entity):
+        """Plan delivery of representation.
+
+        Args:
+            repre_entity (dict[str, Any]): Representation entity.
+
+        Returns:
+            int: Number of planned transfers of the representation.
+        """
+
+        anatomy_data = copy.deepcopy(repre_entity["context"])
+        new_report_items = check_destination_path(
+            repre_entity["id"],
+            self._anatomy,
+            anatomy_data,
+            self._datetime_data,
+            self._template_name
+        )
+        if new_report_items:
+            for title, items in new_report_items.items():
+                self._report_items[title].extend(items)
+            return 0
+
+        if self._format_dict:
+            anatomy_data["root"] = self._format_dict["root"]
+
+        if repre_entity.get("files"):
+            transfers = self._plan_files_transfers(repre_entity, anatomy_data)
+        else:
+            transfers = self._plan_path_transfers(repre_entity, anatomy_data)
+
+        if transfers is None:
+            return 0
+
+        planned = 0
+        for transfer in transfers:
+            if self._add_transfer(transfer):
+                planned += 1
+        return planned
+
+    def get_manifest(self):
+        """Dry-run manifest of planned delivery.
+
+        Returns:
+            dict[str, Any]: Planned transfers and errors.
+        """
+
+        transfers = self.transfers
+        return {
+            "template_name": self._template_name,
+            "files_count": len(transfers),
+            "size": sum(transfer.size or 0 for transfer in transfers),
+            "transfers": [
+                {
+                    "representation_id": transfer.representation_id,
+                    "src": transfer.src_path,
+                    "dst": transfer.dst_path,
+                    "size": transfer.size,
+                }
+                for transfer in transfers
+            ],
+            "errors": {
+                title: list(items)
+                for title, items in self._report_items.items()
+            },
+        }
+
+    def deliver(self, progress_callback=None):
+        """Transfer planned files.
+
+        Progress callback is called from the thread where this method was
+        called with dictionary containing 'files_done', 'files_total',
+        'bytes_done', 'bytes_total' and 'bytes_per_second'.
+
+        Args:
+            progress_callback (Optional[Callable[[dict], None]]): Callback
+                to report progress.
+
+        Returns:
+            tuple[collections.defaultdict, int]: Report items and number of
+                delivered files.
+        """
+
+        transfers = self.transfers
+        bytes_total = sum(transfer.size or 0 for transfer in transfers)
+        progress = {
+            "files_done": 0,
+            "files_total": len(transfers),
+            "bytes_done": 0,
+            "bytes_total": bytes_total,
+            "bytes_per_second": 0.0,
+        }
+        if not transfers:
+            if progress_callback is not None:
+                progress_callback(dict(progress))
+            return self._report_items, 0
+
+        dst_dirs = {
+            os.path.dirname(transfer.dst_path)
+            for transfer in transfers
+        }
+        for dst_dir in dst_dirs:
+            os.makedirs(dst_dir, exist_ok=True)
+
+        delivered = 0
+        start_time = time.time()
+        last_report_time = 0.0
+        max_workers = min(self._max_workers, len(transfers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._transfer_file, transfer): transfer
+                for transfer in transfers
+            }
+            for future in as_completed(futures):
+                transfer = futures[future]
+                try:
+                    future.result()
+                    delivered += 1
+                except Exception as exc:
+                    self._report_items["Failed to deliver file"].append(
+                        "{} -> {}: {}".format(
+                            transfer.src_path, transfer.dst_path, exc
+                        )
+                    )
+                    self._log.warning(
+                        "Failed to deliver {}".format(transfer.src_path),
+                        exc_info=True
+                    )
+
+                progress["files_done"] += 1
+                progress["bytes_done"] += transfer.size or 0
+                if progress_callback is None:
+                    continue
+
+                now = time.time()
+                is_last = progress["files_done"] == progress["files_total"]
+                if (
+                    not is_last
+                    and now - last_report_time < self.progress_interval
+                ):
+                    continue
+                last_report_time = now
+                elapsed = now - start_time
+                if elapsed > 0:
+                    progress["bytes_per_second"] = (
+                        progress["bytes_done"] / elapsed
+                    )
+                progress_callback(dict(progress))
+
+        return self._report_items, delivered
+
+    def _transfer_file(self, transfer):
+        self._log.debug("Copying single: {} -> {}".format(
+            transfer.src_path, transfer.dst_path
+        ))
+        _copy_file(transfer.src_path, transfer.dst_path)
+
+    def _add_transfer(self, transfer):
+        existing = self._transfers_by_dst.get(transfer.dst_path)
+        if existing is None:
+            self._transfers_by_dst[transfer.dst_path] = transfer
+            return True
+
+        if os.path.normcase(existing.src_path) != os.path.normcase(
+            transfer.src_path
+        ):
+            self._report_items[
+                "Multiple source files for same destination"
+            ].append("{} and {} -> {}".format(
+                existing.src_path, transfer.src_path, transfer.dst_path
+            ))
+        return False
+
+    def _get_dir_files(self, dirpath):
+        """Files in directory with their sizes, directory is listed once.
+
+        Returns:
+            dict[str, int]: File size by filename.
+        """
+
+        dir_files = self._dir_files_cache.get(dirpath)
+        if dir_files is None:
+            dir_files = {}
+            try:
+                with os.scandir(dirpath) as scan_iter:
+                    for entry in scan_iter:
+                        try:
+                            if entry.is_file():
+                                dir_files[entry.name] = entry.stat().st_size
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            self._dir_files_cache[dirpath] = dir_files
+        return dir_files
+
+    def _get_file_size(self, path):
+        dirpath, filename = os.path.split(path)
+        return self._get_dir_files(dirpath).get(filename)
+
+    def _format_delivery_path(self, anatomy_data):
+        template_obj = self._anatomy.get_template_item(
+            "delivery", self._template_name, "path"
+        )
+        delivery_path = template_obj.format_strict(anatomy_data)
+
+        # Backwards compatibility when extension contained `.`
+        delivery_path = delivery_path.replace("..", ".")
+        # Make sure path is valid for all platforms
+        delivery_path = os.path.normpath(delivery_path.replace("\\", "/"))
+        # Remove newlines from the end of the string to avoid OSError
+        #   during copy
+        return delivery_path.rstrip()
+
+    def _get_delivery_path_by_frame(self, anatomy_data, frames):
+        """Destination path for each frame.
+
+        Template is formatted only once if frame key is used without
+        formatting specification.
+        """
+
+        template_obj = self._anatomy.get_template_item(
+            "delivery", self._template_name, "path"
+        )
+        if (
+            "{frame}" in template_obj.template
+            and "{frame:" not in template_obj.template
+        ):
+            anatomy_data = copy.deepcopy(anatomy_data)
+            anatomy_data["frame"] = self.frame_indicator
+            delivery_path = self._format_delivery_path(anatomy_data)
+            if delivery_path.count(self.frame_indicator) == 1:
+                return {
+                    frame: delivery_path.replace(
+                        self.frame_indicator, str(frame)
+                    )
+                    for frame in frames
+                }
+
+        output = {}
+        for frame in frames:
+            anatomy_data["frame"] = frame
+            output[frame] = self._format_delivery_path(anatomy_data)
+        return output
+
+    def _plan_files_transfers(self, repre_entity, anatomy_data):
+        src_paths = [
+            os.path.normpath(
+                self._anatomy.fill_root(repre_file["path"]).replace(
+                    "\\", "/"
+                )
+            )
+            for repre_file in repre_entity["files"]
+        ]
+        sources_and_frames = collect_frames(src_paths)
+
+        frames = set(sources_and_frames.values())
+        frames.discard(None)
+        first_frame = None
+        if frames:
+            first_frame = min(frames)
+
+        dst_frame_by_src = {}
+        for src_path, frame in sources_and_frames.items():
+            if self._renumber_frame and frame is not None:
+                # Calculate offset between first frame and current frame
+                # - '0' for first frame
+                offset = self._frame_start - int(first_frame)
+                # Add offset to new frame start
+                dst_frame = int(frame) + offset
+                if dst_frame < 0:
+                    msg = (
+                        "Renumber frame has a smaller number than"
+                        " original frame"
+                    )
+                    self._report_items[msg].append(src_path)
+                    self._log.warning("{} <{}>".format(msg, dst_frame))
+                    continue
+                frame = dst_frame
+            dst_frame_by_src[src_path] = frame
+
+        dst_frames = {
+            frame
+            for frame in dst_frame_by_src.values()
+            if frame is not None
+        }
+        delivery_path_by_frame = {}
+        if dst_frames:
+            delivery_path_by_frame = self._get_delivery_path_by_frame(
+                anatomy_data, dst_frames
+            )
+
+        transfers = []
+        for src_path, frame in dst_frame_by_src.items():
+            size = self._get_file_size(src_path)
+            if size is None:
+                msg = "{} doesn't exist for {}".format(
+                    src_path, repre_entity["id"]
+                )
+                self._report_items["Source file was not found"].append(msg)
+                continue
+
+            if frame is None:
+                dst_path = self._format_delivery_path(anatomy_data)
+            else:
+                dst_path = delivery_path_by_frame[frame]
+            transfers.append(DeliveryTransfer(
+                repre_entity["id"], src_path, dst_path, size
+            ))
+        return transfers
+
+    def _plan_path_transfers(self, repre_entity, anatomy_data):
+        """Fallback for representations without files."""
+
+        try:
+            repre_path = self._path_resolver.get_path(repre_entity)
+        except Exception as exc:
+            msg = "Failed to resolve representation path"
+            self._report_items[msg].append(
+                "Representation: {} ({})".format(repre_entity["id"], exc)
+            )
+            return None
+        src_path = os.path.normpath(repre_path.replace("\\", "/"))
+        if not repre_entity["context"].get("frame"):
+            size = self._get_file_size(src_path)
+            if size is None:
+                msg = "{} doesn't exist for {}".format(
+                    src_path, repre_entity["id"]
+                )
+                self._report_items["Source file was not found"].append(msg)
+                return None
+            dst_path = self._format_delivery_path(anatomy_data)
+            return [
+                DeliveryTransfer(repre_entity["id"], src_path, dst_path, size)
+            ]
+
+        delivery_template = self._anatomy.get_template_item(
+            "delivery", self._template_name, "path"
+        )
+        # Check if 'frame' key is available in template which is required
+        #   for sequence delivery
+        if "{frame" not in delivery_template.template:
+            msg = (
+                "Delivery template \"{}\" in anatomy of project \"{}\""
+                "does not contain '{{frame}}' key to fill. Delivery of"
+                " sequence can't be processed."
+            ).format(self._template_name, self._anatomy.project_name)
+            self._report_items[""].append(msg)
+            return None
+
+        context = repre_entity["context"]
+        ext = context.get("ext", context.get("representation"))
+        if not ext:
+            msg = "Source extension not found, cannot find collection"
+            self._report_items[msg].append(src_path)
+            self._log.warning("{} <{}>".format(msg, context))
+            return None
+
+        ext = "." + ext
+        # context.representation could be .psd
+        ext = ext.replace("..", ".")
+
+        dir_path = os.path.dirname(src_path)
+        dir_files = self._get_dir_files(dir_path)
+        src_collections, _ = clique.assemble(list(dir_files.keys()))
+        src_collection = None
+        for col in src_collections:
+            if col.tail == ext:
+                src_collection = col
+                break
+
+        if src_collection is None:
+            msg = "Source collection of files was not found"
+            self._report_items[msg].append(src_path)
+            self._log.warning("{} <{}>".format(msg, src_path))
+            return None
+
+        anatomy_data = copy.deepcopy(anatomy_data)
+        anatomy_data["frame"] = self.frame_indicator
+        delivery_path = self._format_delivery_path(anatomy_data)
+        dst_head, dst_tail = delivery_path.split(self.frame_indicator)
+        dst_collection = clique.Collection(
+            head=dst_head,
+            tail=dst_tail,
+            padding=src_collection.padding
+        )
+
+        first_frame = min(src_collection.indexes)
+        transfers = []
+        for index in src_collection.indexes:
+            src_padding = src_collection.format("{padding}") % index
+            src_file_name = "{}{}{}".format(
+                src_collection.head, src_padding, src_collection.tail
+            )
+            dst_index = index
+            if self._renumber_frame:
+                # Calculate offset between first frame and current frame
+                # - '0' for first frame
+                dst_index = index + (self._frame_start - first_frame)
+                if dst_index < 0:
+                    msg = (
+                        "Renumber frame has a smaller number than"
+                        " original frame"
+                    )
+                    self._report_items[msg].append(src_file_name)
+                    self._log.warning("{} <{}>".format(msg, context))
+                    return None
+
+            dst_padding = dst_collection.format("{padding}") % dst_index
+            transfers.append(DeliveryTransfer(
+                repre_entity["id"],
+                os.path.normpath(os.path.join(dir_path, src_file_name)),
+                "{}{}{}".format(dst_head, dst_padding, dst_tail),
+                dir_files[src_file_name]
+            ))
+        return transfers
@@ -20,6 +20,7 @@ from .utils import (
     load_container,
     remove_container,
     update_container,
+    update_containers,
     switch_container,
 
     get_loader_identifier,
@@ -28,6 +29,7 @@ from .utils import (
     get_representation_path_from_context,
     get_representation_path,
     get_representation_path_with_anatomy,
+    RepresentationPathResolver,
 
     is_compatible_loader,
 
@@ -75,6 +77,7 @@ __all__ = (
     "load_container",
     "remove_container",
     "update_container",
+    "update_containers",
     "switch_container",
 
     "get_loader_identifier",
@@ -83,6 +86,7 @@ __all__ = (
     "get_representation_path_from_context",
     "get_representation_path",
     "get_representation_path_with_anatomy",
+    "RepresentationPathResolver",
 
     "is_compatible_loader",
 
@@ -460,78 +460,282 @@ def remove_container(container):
 
 def update_container(container, version=-1):
     """Update a container"""
-    from ayon_core.pipeline import get_current_project_name
 
-    # Compute the different version from 'representation'
-    project_name = get_current_project_name()
-    current_representation = ayon_api.get_representation_by_id(
-        project_name, container["representation"]
-    )
+    return update_containers([container], version)[0]
 
-    assert current_representation is not None, "This is a bug"
 
-    current_version_id = current_representation["versionId"]
-    current_version = ayon_api.get_version_by_id(
-        project_name, current_version_id, fields={"productId"}
-    )
-    if isinstance(version, HeroVersionType):
-        new_version = ayon_api.get_hero_version_by_product_id(
-            project_name, current_version["productId"]
-        )
-    elif version == -1:
-        new_version = ayon_api.get_last_version_by_product_id(
-            project_name, current_version["productId"]
-        )
+def update_containers(containers, version=-1, raise_on_error=True):
+    """Update multiple containers.
 
-    else:
-        new_version = ayon_api.get_version_by_name(
-            project_name, version, current_version["productId"]
-        )
+    Entities needed for update of all containers are queried at once, so
+    number of server requests does not grow with number of containers.
+    Containers are updated in passed order. By default update stops on
+    first error, with 'raise_on_error' set to 'False' all containers are
+    updated and the error is returned in place of result of the failed
+    container.
 
-    if new_version is None:
-        raise ValueError("Failed to find matching version")
+    Args:
+        containers (list[dict[str, Any]]): Containers to update.
+        version (Union[int, HeroVersionType, list]): Version to update
+            to. Version '-1' is the latest version and 'HeroVersionType'
+            is the hero version. Can be a list specifying a version for each
+            container.
+        raise_on_error (Optional[bool]): Raise error of first container
+            which failed to update.
 
-    product_entity = ayon_api.get_product_by_id(
-        project_name, current_version["productId"]
-    )
-    folder_entity = ayon_api.get_folder_by_id(
-        project_name, product_entity["folderId"]
-    )
+    Returns:
+        list[Any]: Result of loader update, or exception if update failed
+            and 'raise_on_error' is disabled, for each container.
+    """
+    from ayon_core.pipeline import get_current_project_name
+    from .plugins import discover_loader_plugins
 
-    repre_name = current_representation["name"]
-    new_representation = ayon_api.get_representation_by_name(
-        project_name, repre_name, new_version["id"]
-    )
-    if new_representation is None:
-        raise ValueError(
-            "Representation '{}' wasn't found on requested version".format(
-                repre_name
+    containers = list(containers)
+    if isinstance(version, (list, tuple)):
+        assert len(containers) == len(version), (
+            "Number of containers mismatches number of versions: "
+            "{} containers - {} versions".format(
+                len(containers), len(version)
             )
         )
+        versions = list(version)
+    else:
+        versions = [version] * len(containers)
+
+    if not containers:
+        return []
+
+    project_name = get_current_project_name()
+    contexts = _get_update_contexts(project_name, containers, versions)
+
+    loaders_by_identifier = {}
+    for loader_plugin in discover_loader_plugins():
+        loaders_by_identifier.setdefault(
+            get_loader_identifier(loader_plugin), loader_plugin
+        )
+
+    results = []
+    for container, context in zip(containers, contexts):
+        try:
+            result = _update_container_with_context(
+                container, context, loaders_by_identifier
+            )
+        except Exception as exc:
+            if raise_on_error:
+                raise
+            result = exc
+        results.append(result)
+    return results
 
+
+def _update_container_with_context(
+    container, context, loaders_by_identifier
+):
+    if isinstance(context, Exception):
+        raise context
+
+    new_representation = context["representation"]
     path = get_representation_path(new_representation)
     if not path or not os.path.exists(path):
         raise ValueError("Path {} doesn't exist".format(path))
 
     # Run update on the Loader for this container
-    Loader = _get_container_loader(container)
+    Loader = loaders_by_identifier.get(container["loader"])
     if not Loader:
         raise LoaderNotFoundError(
             "Can't update container because loader '{}' was not found."
             .format(container.get("loader"))
         )
-    project_entity = ayon_api.get_project(project_name)
-    context = {
-        "project": project_entity,
-        "folder": folder_entity,
-        "product": product_entity,
-        "version": new_version,
-        "representation": new_representation,
-    }
 
     return Loader().update(container, context)
 
 
+def _get_update_contexts(project_name, containers, versions):
+    """Prepare representation contexts to update containers to.
+
+    Args:
+        project_name (str): Project name.
+        containers (list[dict[str, Any]]): Containers to update.
+        versions (list[Union[int, HeroVersionType]]): Version to update to
+            for each container.
+
+    Returns:
+        list[Union[dict[str, Any], Exception]]: Context for each container
+            or exception that should be raised for the container.
+    """
+    repre_ids = {container["representation"] for container in containers}
+    current_repres_by_id = {
+        repre_entity["id"]: repre_entity
+        for repre_entity in ayon_api.get_representations(
+            project_name,
+            representation_ids=repre_ids,
+            active=None,
+            fields={"id", "name", "versionId"}
+        )
+    }
+    current_version_ids = {
+        repre_entity["versionId"]
+        for repre_entity in current_repres_by_id.values()
+    }
+    current_versions_by_id = {}
+    if current_version_ids:
+        current_versions_by_id = {
+            version_entity["id"]: version_entity
+            for version_entity in ayon_api.get_versions(
+                project_name,
+                version_ids=current_version_ids,
+                active=None,
+                fields={"id", "productId"}
+            )
+        }
+
+    product_ids_by_container_idx = {}
+    hero_product_ids = set()
+    last_product_ids = set()
+    versions_by_product_id = collections.defaultdict(set)
+    for idx, (container, version) in enumerate(zip(containers, versions)):
+        repre_entity = current_repres_by_id.get(container["representation"])
+        if repre_entity is None:
+            continue
+        version_entity = current_versions_by_id.get(repre_entity["versionId"])
+        if version_entity is None:
+            continue
+        product_id = version_entity["productId"]
+        product_ids_by_container_idx[idx] = product_id
+        if isinstance(version, HeroVersionType):
+            hero_product_ids.add(product_id)
+        elif version == -1:
+            last_product_ids.add(product_id)
+        else:
+            versions_by_product_id[product_id].add(version)
+
+    hero_versions_by_product_id = {}
+    if hero_product_ids:
+        hero_versions_by_product_id = {
+            version_entity["productId"]: version_entity
+            for version_entity in ayon_api.get_hero_versions(
+                project_name, product_ids=hero_product_ids
+            )
+        }
+
+    last_versions_by_product_id = {}
+    if last_product_ids:
+        last_versions_by_product_id = ayon_api.get_last_versions(
+            project_name, last_product_ids
+        )
+
+    version_entities_by_key = {}
+    if versions_by_product_id:
+        for version_entity in ayon_api.get_versions(
+            project_name,
+            product_ids=set(versions_by_product_id),
+            versions={
+                version
+                for product_versions in versions_by_product_id.values()
+                for version in product_versions
+            },
+            active=None
+        ):
+            key = (version_entity["productId"], version_entity["version"])
+            version_entities_by_key[key] = version_entity
+
+    new_versions_by_container_idx = {}
+    for idx, product_id in product_ids_by_container_idx.items():
+        version = versions[idx]
+        if isinstance(version, HeroVersionType):
+            new_version = hero_versions_by_product_id.get(product_id)
+        elif version == -1:
+            new_version = last_versions_by_product_id.get(product_id)
+        else:
+            new_version = version_entities_by_key.get((product_id, version))
+
+        if new_version is not None:
+            new_versions_by_container_idx[idx] = new_version
+
+    product_ids = {
+        new_version["productId"]
+        for new_version in new_versions_by_container_idx.values()
+    }
+    products_by_id = {}
+    if product_ids:
+        products_by_id = {
+            product_entity["id"]: product_entity
+            for product_entity in ayon_api.get_products(
+                project_name, product_ids=product_ids, active=None
+            )
+        }
+
+    folder_ids = {
+        product_entity["folderId"]
+        for product_entity in products_by_id.values()
+    }
+    folders_by_id = {}
+    if folder_ids:
+        folders_by_id = {
+            folder_entity["id"]: folder_entity
+            for folder_entity in ayon_api.get_folders(
+                project_name, folder_ids=folder_ids, active=None
+            )
+        }
+
+    new_version_ids = {
+        new_version["id"]
+        for new_version in new_versions_by_container_idx.values()
+    }
+    repre_names = {
+        current_repres_by_id[container["representation"]]["name"]
+        for idx, container in enumerate(containers)
+        if idx in new_versions_by_container_idx
+    }
+    new_repres_by_key = {}
+    if new_version_ids:
+        for repre_entity in ayon_api.get_representations(
+            project_name,
+            representation_names=repre_names,
+            version_ids=new_version_ids,
+            active=None
+        ):
+            key = (repre_entity["versionId"], repre_entity["name"])
+            new_repres_by_key[key] = repre_entity
+
+    project_entity = None
+    if new_repres_by_key:
+        project_entity = ayon_api.get_project(project_name)
+
+    output = []
+    for idx, container in enumerate(containers):
+        current_repre = current_repres_by_id.get(container["representation"])
+        if current_repre is None:
+            output.append(AssertionError("This is a bug"))
+            continue
+
+        new_version = new_versions_by_container_idx.get(idx)
+        if new_version is None:
+            output.append(ValueError("Failed to find matching version"))
+            continue
+
+        repre_name = current_repre["name"]
+        new_representation = new_repres_by_key.get(
+            (new_version["id"], repre_name)
+        )
+        if new_representation is None:
+            output.append(ValueError(
+                "Representation '{}' wasn't found on requested version"
+                .format(repre_name)
+            ))
+            continue
+
+        product_entity = products_by_id[new_version["productId"]]
+        output.append({
+            "project": project_entity,
+            "folder": folders_by_id[product_entity["folderId"]],
+            "product": product_entity,
+            "version": new_version,
+            "representation": new_representation,
+        })
+    return output
+
+
 def switch_container(container, representation, loader_plugin=None):
     """Switch a container to representation
 
@@ -620,27 +824,159 @@ def get_representation_path_with_anatomy(repre_entity, anatomy):
             invalid or not available.
     """
 
-    try:
-        template = repre_entity["attrib"]["template"]
+    return RepresentationPathResolver(anatomy).get_path(repre_entity)
+
+
+class RepresentationPathResolver(object):
+    """Resolve paths of representations of one project.
+
+    Anatomy roots are used to fill 'root' key in representation template.
+    Parsed templates are cached by template string, and content of
+    directories used for existence checks is cached, so resolving paths of
+    many representations is cheap. Passed representation entities are not
+    modified.
+
+    Args:
+        anatomy (Anatomy): Project anatomy object.
+    """
+
+    def __init__(self, anatomy):
+        self._anatomy = anatomy
+        self._templates_by_str = {}
+        self._dir_filenames = {}
+
+    @property
+    def anatomy(self):
+        return self._anatomy
+
+    def reset(self):
+        """Reset cached directories content used for existence checks."""
 
-    except KeyError:
-        raise InvalidRepresentationContext((
-            "Representation document does not"
-            " contain template in data ('data.template')"
-        ))
+        self._dir_filenames = {}
 
-    try:
-        context = repre_entity["context"]
-        context["root"] = anatomy.roots
-        path = StringTemplate.format_strict_template(template, context)
+    def get_path(self, repre_entity):
+        """Receive path of representation.
 
-    except TemplateUnsolved as exc:
-        raise InvalidRepresentationContext((
-            "Couldn't resolve representation template with available data."
-            " Reason: {}".format(str(exc))
-        ))
+        Args:
+            repre_entity (Dict[str, Any]): Representation entity.
+
+        Returns:
+            TemplateResult: Normalized path of representation.
+
+        Raises:
+            InvalidRepresentationContext: When representation data are
+                probably invalid or not available.
+        """
+
+        try:
+            template = repre_entity["attrib"]["template"]
+
+        except KeyError:
+            raise InvalidRepresentationContext((
+                "Representation document does not"
+                " contain template in data ('data.template')"
+            ))
+
+        data = dict(repre_entity["context"])
+        data["root"] = self._anatomy.roots
+        try:
+            path = self._get_template(template).format_strict(data)
+
+        except TemplateUnsolved as exc:
+            raise InvalidRepresentationContext((
+                "Couldn't resolve representation template with available data."
+                " Reason: {}".format(str(exc))
+            ))
+
+        return path.normalized()
+
+    def get_paths(self, repre_entities, check_exists=False):
+        """Receive paths of multiple representations.
+
+        Existence check is done using one directory scan per directory,
+        for paths with frame placeholder ('#' or '%') is path considered
+        as existing if any file with same prefix and extension is available.
+
+        Args:
+            repre_entities (Iterable[Dict[str, Any]]): Representation
+                entities.
+            check_exists (Optional[bool]): Paths that don't exist are
+                returned as None.
+
+        Returns:
+            list[Union[TemplateResult, None]]: Path of each representation
+                in passed order. None is used if path can't be resolved.
+        """
+
+        paths = []
+        for repre_entity in repre_entities:
+            try:
+                path = self.get_path(repre_entity)
+            except InvalidRepresentationContext:
+                path = None
+            paths.append(path)
+
+        if check_exists:
+            paths = [
+                path if path and self.path_exists(path) else None
+                for path in paths
+            ]
+        return paths
+
+    def path_exists(self, path):
+        """Check if path exists using cached directory content.
+
+        Args:
+            path (str): Normalized path to check.
+
+        Returns:
+            bool: Path exists.
+        """
+
+        dirpath, filename = os.path.split(path)
+        filenames = self._get_dir_filenames(dirpath)
+        if not filenames:
+            return False
+
+        filename = os.path.normcase(filename)
+        if filename in filenames:
+            return True
+
+        base_name, ext = os.path.splitext(filename)
+        filename_items = None
+        if "#" in base_name:
+            filename_items = [part for part in base_name.split("#") if part]
+        elif "%" in base_name:
+            filename_items = base_name.split("%")
+
+        if not filename_items:
+            return False
+
+        filename_start = filename_items[0]
+        return any(
+            name.startswith(filename_start) and name.endswith(ext)
+            for name in filenames
+        )
 
-    return path.normalized()
+    def _get_template(self, template):
+        template_obj = self._templates_by_str.get(template)
+        if template_obj is None:
+            template_obj = StringTemplate(template)
+            self._templates_by_str[template] = template_obj
+        return template_obj
+
+    def _get_dir_filenames(self, dirpath):
+        filenames = self._dir_filenames.get(dirpath)
+        if filenames is None:
+            filenames = set()
+            try:
+                with os.scandir(dirpath) as scan_iter:
+                    for entry in scan_iter:
+                        filenames.add(os.path.normcase(entry.name))
+            except OSError:
+                pass
+            self._dir_filenames[dirpath] = filenames
+        return filenames
 
 
 def get_representation_path(representation, root=None):
@@ -673,7 +1009,7 @@ def get_representation_path(representation, root=None):
             return None
 
         try:
-            context = representation["context"]
+            context = dict(representation["context"])
             context["root"] = root
             path = StringTemplate.format_strict_template(
                 template, context
@@ -42,6 +42,21 @@ from .lib import (
     get_plugin_settings,
     get_publish_instance_label,
     get_publish_instance_families,
+
+    is_parallel_validation_enabled,
+    is_plugin_executable_in_thread,
+    InstancesThreadsProcess,
+    process_instances_in_threads,
+    publish_iter,
+)
+
+from .profiling import (
+    get_publish_stage,
+    process_plugin_with_profile,
+    get_result_profile_item,
+    get_report_profile_items,
+    convert_profile_items_to_chrome_trace,
+    write_chrome_trace,
 )
 
 from .abstract_expected_files import ExpectedFiles
@@ -92,6 +107,19 @@ __all__ = (
     "get_publish_instance_label",
     "get_publish_instance_families",
 
+    "is_parallel_validation_enabled",
+    "is_plugin_executable_in_thread",
+    "InstancesThreadsProcess",
+    "process_instances_in_threads",
+    "publish_iter",
+
+    "get_publish_stage",
+    "process_plugin_with_profile",
+    "get_result_profile_item",
+    "get_report_profile_items",
+    "convert_profile_items_to_chrome_trace",
+    "write_chrome_trace",
+
     "ExpectedFiles",
 
     "RenderInstance",
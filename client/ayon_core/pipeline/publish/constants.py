@@ -9,3 +9,5 @@ ValidateMeshOrder = pyblish.api.ValidatorOrder + 0.3
 DEFAULT_PUBLISH_TEMPLATE = "default"
 DEFAULT_HERO_PUBLISH_TEMPLATE = "default"
 TRANSIENT_DIR_TEMPLATE = "default"
+
+PARALLEL_VALIDATION_ENV_KEY = "AYON_PUBLISH_PARALLEL_VALIDATION"
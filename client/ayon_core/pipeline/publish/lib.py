@@ -2,17 +2,26 @@ import os
 import sys
 import inspect
 import copy
+import logging
 import tempfile
+import threading
 import xml.etree.ElementTree
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeoutError,
+)
 
 import pyblish.util
 import pyblish.plugin
+import pyblish.logic
+import pyblish.lib
 import pyblish.api
 
 from ayon_core.lib import (
     Logger,
     import_filepath,
     filter_profiles,
+    env_value_to_bool,
 )
 from ayon_core.settings import get_project_settings
 from ayon_core.pipeline import (
@@ -21,11 +30,15 @@ from ayon_core.pipeline import (
 )
 from ayon_core.pipeline.plugin_discover import DiscoverResult
 
+from ayon_core.lib.profiling import ProcessTimer
+
 from .constants import (
     DEFAULT_PUBLISH_TEMPLATE,
     DEFAULT_HERO_PUBLISH_TEMPLATE,
-    TRANSIENT_DIR_TEMPLATE
+    TRANSIENT_DIR_TEMPLATE,
+    PARALLEL_VALIDATION_ENV_KEY,
 )
+from .profiling import process_plugin_with_profile
 
 
 def get_template_name_profiles(
@@ -934,3 +947,401 @@ def get_publish_instance_families(instance):
         families.discard(family)
     output.extend(families)
     return output
+
+
+class _ThreadLogRecordsHandler(logging.Handler):
+    """Collect pyblish log records by thread where they were created.
+
+    Same as 'pyblish.lib.MessageHandler' but records of each processed
+    instance are stored separately.
+    """
+
+    def __init__(self):
+        super(_ThreadLogRecordsHandler, self).__init__()
+        self._records_by_thread_id = {}
+
+    def set_thread_records(self, records):
+        self._records_by_thread_id[threading.get_ident()] = records
+
+    def unset_thread_records(self):
+        self._records_by_thread_id.pop(threading.get_ident(), None)
+
+    def emit(self, record):
+        if not record.name.startswith("pyblish"):
+            return
+        records = self._records_by_thread_id.get(record.thread)
+        if records is not None:
+            records.append(record)
+
+
+def is_parallel_validation_enabled():
+    """Thread safe validators can process instances in parallel.
+
+    Parallel validation is enabled with environment variable
+    'AYON_PUBLISH_PARALLEL_VALIDATION'.
+
+    Returns:
+        bool: Parallel validation is enabled.
+    """
+
+    return env_value_to_bool(PARALLEL_VALIDATION_ENV_KEY)
+
+
+def is_plugin_executable_in_thread(plugin):
+    """Plugin can process multiple instances at once in threads.
+
+    Only instance plugins in validation order range marked with
+    'executable_in_thread' can be processed in threads.
+
+    Args:
+        plugin (type[pyblish.api.Plugin]): Publish plugin.
+
+    Returns:
+        bool: Plugin can be processed in threads.
+    """
+
+    return bool(
+        getattr(plugin, "executable_in_thread", False)
+        and issubclass(plugin, pyblish.api.InstancePlugin)
+        and pyblish.lib.inrange(plugin.order, pyblish.api.ValidatorOrder)
+    )
+
+
+def _process_instance_in_thread(plugin, context, instance, records_handler):
+    result = {
+        "success": False,
+        "plugin": plugin,
+        "instance": instance,
+        "action": None,
+        "error": None,
+        "records": [],
+        "duration": None,
+        "progress": 0,
+        "context": context,
+    }
+    records = []
+    records_handler.set_thread_records(records)
+    timer = ProcessTimer(thread_cpu=True)
+    timer.start()
+    try:
+        plugin().process(instance)
+        result["success"] = True
+
+    except Exception as exc:
+        pyblish.lib.extract_traceback(exc, plugin.__module__)
+        result["error"] = exc
+
+    finally:
+        timer.stop()
+        records_handler.unset_thread_records()
+
+    profile = timer.to_data()
+    result["duration"] = profile["wall_time"]
+    result["profile"] = profile
+    result["records"] = records
+    return result
+
+
+class InstancesThreadsProcess:
+    """Process instance plugin for multiple instances in threads.
+
+    Instances are processed in threads after 'start' is called. Results
+    are finished, stored to context and pyblish signals are emitted, from
+    the thread which calls 'process_next_result', in order of passed
+    instances. So output does not depend on order in which threads
+    finished and caller can do other work between results.
+
+    Args:
+        plugin (type[pyblish.api.InstancePlugin]): Thread safe plugin.
+        context (pyblish.api.Context): Publish context.
+        instances (Iterable[pyblish.api.Instance]): Instances to process.
+        max_workers (Optional[int]): Maximum number of threads.
+    """
+
+    def __init__(self, plugin, context, instances, max_workers=None):
+        self._plugin = plugin
+        self._context = context
+        self._instances = list(instances)
+        self._max_workers = max_workers
+        self._executor = None
+        self._futures = []
+        self._next_idx = 0
+        self._records_handler = None
+        self._old_root_level = None
+        self._log = Logger.get_logger(self.__class__.__name__)
+
+    @property
+    def instances(self):
+        return list(self._instances)
+
+    @property
+    def is_finished(self):
+        """All results were processed or process was stopped."""
+        return self._next_idx >= len(self._futures)
+
+    def start(self):
+        """Start processing of instances in threads."""
+        if self._executor is not None or not self._instances:
+            return
+
+        records_handler = _ThreadLogRecordsHandler()
+        root_logger = logging.getLogger()
+        self._old_root_level = root_logger.level
+        root_logger.addHandler(records_handler)
+        root_logger.setLevel(logging.DEBUG)
+        self._records_handler = records_handler
+
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        self._futures = [
+            self._executor.submit(
+                _process_instance_in_thread,
+                self._plugin,
+                self._context,
+                instance,
+                records_handler
+            )
+            for instance in self._instances
+        ]
+
+    def get_next_instance(self):
+        """Instance of which result will be processed next.
+
+        Returns:
+            Union[pyblish.api.Instance, None]: Instance or None if all
+                results were processed.
+        """
+        if self.is_finished:
+            return None
+        return self._instances[self._next_idx]
+
+    def process_next_result(self, timeout=None):
+        """Finish result of next instance if it is available.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for the result. Wait
+                until result is available if is 'None'.
+
+        Returns:
+            Union[dict[str, Any], None]: Result with same structure as
+                result of 'pyblish.plugin.process' or None if result is not
+                available yet.
+        """
+        if self.is_finished:
+            return None
+
+        future = self._futures[self._next_idx]
+        try:
+            result = future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            return None
+
+        self._next_idx += 1
+        if self.is_finished:
+            self._cleanup()
+
+        error = result["error"]
+        if error is not None:
+            pyblish.lib.emit(
+                "pluginFailed",
+                plugin=self._plugin,
+                context=self._context,
+                instance=result["instance"],
+                error=error
+            )
+            self._log.error(error.formatted_traceback)
+        self._context.data.setdefault("results", []).append(result)
+        pyblish.lib.emit("pluginProcessed", result=result)
+        return result
+
+    def stop(self):
+        """Stop processing, instances which did not start are skipped."""
+        for future in self._futures[self._next_idx:]:
+            future.cancel()
+        self._next_idx = len(self._futures)
+        self._cleanup()
+
+    def _cleanup(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        if self._records_handler is not None:
+            root_logger = logging.getLogger()
+            root_logger.removeHandler(self._records_handler)
+            root_logger.setLevel(self._old_root_level)
+            self._records_handler = None
+
+
+def process_instances_in_threads(
+    plugin, context, instances, max_workers=None
+):
+    """Process instance plugin for multiple instances in threads.
+
+    Result of each instance has same structure as result of
+    'pyblish.plugin.process'. Results are stored to context and pyblish
+    signals are emitted in order of passed instances, from the thread
+    where the function was called, so output does not depend on order in
+    which threads finished.
+
+    Args:
+        plugin (type[pyblish.api.InstancePlugin]): Thread safe plugin.
+        context (pyblish.api.Context): Publish context.
+        instances (Iterable[pyblish.api.Instance]): Instances to process.
+        max_workers (Optional[int]): Maximum number of threads.
+
+    Returns:
+        list[dict[str, Any]]: Result for each instance in passed order.
+    """
+
+    process = InstancesThreadsProcess(
+        plugin, context, instances, max_workers
+    )
+    process.start()
+    results = []
+    try:
+        while not process.is_finished:
+            results.append(process.process_next_result())
+    finally:
+        process.stop()
+    return results
+
+
+def publish_iter(
+    context=None, plugins=None, targets=None, parallel_validation=None
+):
+    """Publish iterator for headless publishing.
+
+    Same as 'pyblish.util.publish_iter' but result of each plugin contains
+    measured 'profile'. When parallel validation is enabled, validators
+    marked with 'executable_in_thread' process all their instances at once
+    in threads.
+
+    Args:
+        context (Optional[pyblish.api.Context]): Publish context.
+        plugins (Optional[list[type[pyblish.api.Plugin]]]): Publish plugins,
+            discovered if not passed.
+        targets (Optional[list[str]]): Targets of publishing.
+        parallel_validation (Optional[bool]): Process thread safe
+            validators in parallel. Value is based on environment
+            variable 'AYON_PUBLISH_PARALLEL_VALIDATION' if not passed.
+
+    Yields:
+        dict[str, Any]: Result of each processed plugin.
+    """
+
+    if parallel_validation is None:
+        parallel_validation = is_parallel_validation_enabled()
+
+    if not parallel_validation:
+        for result in _profile_results(
+            pyblish.util.publish_iter(context, plugins, targets)
+        ):
+            yield result
+        return
+
+    if context is None:
+        context = pyblish.api.Context()
+
+    if plugins is None:
+        plugins = pyblish.api.discover()
+
+    plugins = [plugin for plugin in plugins if plugin.active]
+    collectors = [
+        plugin
+        for plugin in plugins
+        if pyblish.lib.inrange(plugin.order, pyblish.api.CollectorOrder)
+    ]
+
+    # Approximation of all tasks, same as in 'pyblish.util.publish_iter'
+    tasks_count = len(list(
+        pyblish.logic.Iterator(plugins, context, targets=targets)
+    ))
+    processed_count = 0
+    for plugin, instance in pyblish.logic.Iterator(
+        collectors, context, targets=targets
+    ):
+        result = process_plugin_with_profile(plugin, context, instance)
+        processed_count += 1
+        result["progress"] = float(processed_count) / tasks_count
+        yield result
+
+    plugins = [
+        plugin
+        for plugin in plugins
+        if plugin not in collectors
+        and (
+            not plugin.__instanceEnabled__
+            or pyblish.logic.instances_by_plugin(context, plugin)
+        )
+    ]
+
+    if not targets:
+        targets = ["default"] + pyblish.api.registered_targets()
+
+    log = Logger.get_logger("publish_iter")
+    test = pyblish.logic.registered_test()
+    state = {
+        "nextOrder": None,
+        "ordersWithError": set()
+    }
+    for plugin in pyblish.logic.plugins_by_targets(plugins, targets):
+        state["nextOrder"] = plugin.order
+        message = test(**state)
+        if message:
+            log.error("Stopped due to {}".format(message))
+            break
+
+        instances = [None]
+        if plugin.__instanceEnabled__:
+            instances = [
+                instance
+                for instance in pyblish.logic.instances_by_plugin(
+                    context, plugin
+                )
+                if instance.data.get("publish") is not False
+            ]
+
+        if (
+            parallel_validation
+            and len(instances) > 1
+            and is_plugin_executable_in_thread(plugin)
+        ):
+            results = process_instances_in_threads(
+                plugin, context, instances
+            )
+        else:
+            results = (
+                process_plugin_with_profile(plugin, context, instance)
+                for instance in instances
+            )
+
+        for result in results:
+            processed_count += 1
+            result["progress"] = float(processed_count) / tasks_count
+            if result["error"] is not None:
+                state["ordersWithError"].add(plugin.order)
+            yield result
+
+    pyblish.api.emit("published", context=context)
+
+
+def _profile_results(results_iter):
+    """Store profile of each step of results iterator to its result.
+
+    Processing of plugin happens while iterator is generating the result,
+    so the measured step is time spent on processing of the plugin.
+
+    Args:
+        results_iter (Iterator[dict[str, Any]]): Publish results iterator.
+
+    Yields:
+        dict[str, Any]: Result with 'profile'.
+    """
+
+    while True:
+        with ProcessTimer() as timer:
+            result = next(results_iter, None)
+        if result is None:
+            return
+        result["profile"] = timer.to_data()
+        yield result
@@ -0,0 +1,217 @@
+"""Timing profile of publish plugins processing.
+
+Each result of processed plugin and instance can contain 'profile' with
+data measured by 'ProcessTimer'. Profile is stored to publish report and
+can be converted to Chrome trace format which can be opened in
+'chrome://tracing' or 'https://ui.perfetto.dev'.
+"""
+import json
+
+import pyblish.api
+import pyblish.lib
+import pyblish.plugin
+
+from ayon_core.lib.profiling import ProcessTimer
+
+PUBLISH_STAGES = (
+    ("collect", pyblish.api.CollectorOrder),
+    ("validate", pyblish.api.ValidatorOrder),
+    ("extract", pyblish.api.ExtractorOrder),
+    ("integrate", pyblish.api.IntegratorOrder),
+)
+
+
+def get_publish_stage(order):
+    """Name of publish stage for plugin order.
+
+    Args:
+        order (float): Order of publish plugin.
+
+    Returns:
+        str: One of 'collect', 'validate', 'extract', 'integrate' or
+            'other' if order is out of range of all stages.
+    """
+
+    for stage, stage_order in PUBLISH_STAGES:
+        if pyblish.lib.inrange(order, stage_order):
+            return stage
+    return "other"
+
+
+def process_plugin_with_profile(plugin, context, instance=None):
+    """Process plugin and store measured profile to result.
+
+    Args:
+        plugin (type[pyblish.api.Plugin]): Plugin to process.
+        context (pyblish.api.Context): Publish context.
+        instance (Optional[pyblish.api.Instance]): Instance to process.
+
+    Returns:
+        dict[str, Any]: Result of 'pyblish.plugin.process' with 'profile'.
+    """
+
+    with ProcessTimer() as timer:
+        result = pyblish.plugin.process(plugin, context, instance)
+    result["profile"] = timer.to_data()
+    return result
+
+
+def _create_profile_item(
+    plugin_name, plugin_label, order, instance_id, instance_label, profile
+):
+    item = {
+        "plugin_name": plugin_name,
+        "plugin_label": plugin_label or plugin_name,
+        "order": order,
+        "stage": get_publish_stage(order),
+        "instance_id": instance_id,
+        "instance_label": instance_label,
+    }
+    item.update(profile)
+    return item
+
+
+def get_result_profile_item(result):
+    """Profile item of single publish result.
+
+    Args:
+        result (dict[str, Any]): Result of processed plugin.
+
+    Returns:
+        Union[dict[str, Any], None]: Profile item or None if result does
+            not contain profile.
+    """
+
+    profile = result.get("profile")
+    if not profile:
+        return None
+
+    plugin = result["plugin"]
+    instance = result["instance"]
+    instance_id = None
+    if instance is None:
+        instance_label = (
+            result["context"].data.get("label") or "Context"
+        )
+    else:
+        instance_id = instance.id
+        instance_label = (
+            instance.data.get("label") or instance.data.get("name")
+        )
+    return _create_profile_item(
+        plugin.__name__,
+        getattr(plugin, "label", None),
+        plugin.order,
+        instance_id,
+        instance_label,
+        profile
+    )
+
+
+def get_report_profile_items(report_data):
+    """Profile items stored in publish report.
+
+    Args:
+        report_data (dict[str, Any]): Publish report data.
+
+    Returns:
+        list[dict[str, Any]]: Profile items sorted by start time.
+    """
+
+    context_label = (
+        (report_data.get("context") or {}).get("label") or "Context"
+    )
+    instances = report_data.get("instances") or {}
+    output = []
+    for plugin_data in report_data["plugins_data"]:
+        for instance_data in plugin_data["instances_data"]:
+            profile = instance_data.get("profile")
+            if not profile:
+                continue
+
+            instance_id = instance_data["id"]
+            instance_label = context_label
+            if instance_id is not None:
+                instance_info = instances.get(instance_id) or {}
+                instance_label = (
+                    instance_info.get("label")
+                    or instance_info.get("name")
+                    or instance_id
+                )
+            output.append(_create_profile_item(
+                plugin_data["name"],
+                plugin_data["label"],
+                plugin_data["order"],
+                instance_id,
+                instance_label,
+                profile
+            ))
+    output.sort(key=lambda item: item["start"])
+    return output
+
+
+def convert_profile_items_to_chrome_trace(profile_items):
+    """Convert profile items to Chrome trace event format.
+
+    Args:
+        profile_items (Iterable[dict[str, Any]]): Profile items.
+
+    Returns:
+        dict[str, Any]: Chrome trace data.
+    """
+
+    profile_items = list(profile_items)
+    start = None
+    if profile_items:
+        start = min(item["start"] for item in profile_items)
+
+    events = []
+    thread_indexes = {}
+    for item in profile_items:
+        thread_id = item.get("thread_id")
+        if thread_id not in thread_indexes:
+            thread_indexes[thread_id] = len(thread_indexes)
+        events.append({
+            "name": item["plugin_label"],
+            "cat": item["stage"],
+            "ph": "X",
+            "ts": (item["start"] - start) * 1000000,
+            "dur": item["wall_time"] * 1000,
+            "pid": 0,
+            "tid": thread_indexes[thread_id],
+            "args": {
+                "plugin": item["plugin_name"],
+                "instance": item["instance_label"],
+                "cpu_time_ms": item["cpu_time"],
+                "subprocess_time_ms": item["subprocess_time"],
+                "peak_rss": item["peak_rss"],
+                "peak_rss_increase": item["peak_rss_increase"],
+            }
+        })
+
+    for thread_id, thread_idx in thread_indexes.items():
+        events.append({
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 0,
+            "tid": thread_idx,
+            "args": {"name": "Thread {}".format(thread_id)},
+        })
+
+    return {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+    }
+
+
+def write_chrome_trace(profile_items, filepath):
+    """Write profile items to file in Chrome trace format.
+
+    Args:
+        profile_items (Iterable[dict[str, Any]]): Profile items.
+        filepath (str): Path to output json file.
+    """
+
+    trace_data = convert_profile_items_to_chrome_trace(profile_items)
+    with open(filepath, "w") as stream:
+        json.dump(trace_data, stream)
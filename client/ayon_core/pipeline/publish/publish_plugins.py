@@ -78,9 +78,13 @@ class KnownPublishError(Exception):
 
 
 class AYONPyblishPluginMixin:
+    # Validator can be processed for multiple instances at once in
+    #   separate threads when parallel validation is enabled
+    # - plugin must not change context or instances, or use host API which
+    #   is not thread safe
+    executable_in_thread = False
+
     # TODO
-    # executable_in_thread = False
-    #
     # state_message = None
     # state_percent = None
     # _state_change_callbacks = []
@@ -7,6 +7,12 @@ from .path_resolving import (
     get_last_workfile_with_version,
     get_last_workfile,
 
+    WorkdirFileItem,
+    get_workdir_filenames,
+    get_workdir_file_items,
+    clear_workdir_listing_cache,
+    workdir_file_exists,
+
     get_custom_workfile_template,
     get_custom_workfile_template_by_string_context,
 
@@ -30,6 +36,12 @@ __all__ = (
     "get_last_workfile_with_version",
     "get_last_workfile",
 
+    "WorkdirFileItem",
+    "get_workdir_filenames",
+    "get_workdir_file_items",
+    "clear_workdir_listing_cache",
+    "workdir_file_exists",
+
     "get_custom_workfile_template",
     "get_custom_workfile_template_by_string_context",
 
@@ -1,7 +1,10 @@
 import os
 import re
 import copy
+import time
 import platform
+import threading
+import collections
 
 import ayon_api
 
@@ -198,6 +201,216 @@ def get_workdir(
     )
 
 
+WorkdirFileItem = collections.namedtuple(
+    "WorkdirFileItem", ["filename", "modified"]
+)
+
+
+class _WorkdirListingCache:
+    """Cache of file names in workdirs invalidated by directory mtime.
+
+    Directory is listed only if its modification time changed since last
+    listing. Listing is not trusted if directory was modified right before
+    it was listed because modification time on some filesystems has low
+    resolution.
+
+    Only file names are cached. Overwriting of existing file does not
+    change modification time of the directory, so file stats must not be
+    cached with the listing.
+    """
+
+    # Seconds in which directory modification time is not trusted
+    unstable_mtime_offset = 2.0
+    cache_size = 256
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cache = collections.OrderedDict()
+
+    def clear(self, workdir=None):
+        with self._lock:
+            if workdir is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(os.path.normpath(workdir), None)
+
+    def get_filenames(self, workdir):
+        workdir = os.path.normpath(workdir)
+        try:
+            dir_mtime = os.stat(workdir).st_mtime
+        except OSError:
+            self.clear(workdir)
+            return ()
+
+        with self._lock:
+            cached = self._cache.get(workdir)
+            if cached is not None and cached[0] == dir_mtime:
+                self._cache.move_to_end(workdir)
+                return cached[1]
+
+        listed_at = time.time()
+        filenames = []
+        try:
+            with os.scandir(workdir) as scan_iter:
+                for entry in scan_iter:
+                    try:
+                        if entry.is_file():
+                            filenames.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return ()
+
+        filenames = tuple(filenames)
+        if listed_at - dir_mtime > self.unstable_mtime_offset:
+            with self._lock:
+                self._cache[workdir] = (dir_mtime, filenames)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return filenames
+
+
+_workdir_listing_cache = _WorkdirListingCache()
+
+
+def get_workdir_filenames(workdir):
+    """Names of files in workdir.
+
+    Listing is cached and is refreshed when modification time of the
+    directory changes, so repeated calls on same directory do only one
+    'stat' call.
+
+    Args:
+        workdir (str): Path to directory.
+
+    Returns:
+        tuple[str, ...]: File names in directory. Empty if directory
+            does not exist.
+    """
+
+    return _workdir_listing_cache.get_filenames(workdir)
+
+
+def get_workdir_file_items(workdir, extensions=None):
+    """Files in workdir with their modification time.
+
+    File names are taken from cached listing of the directory, modification
+    time is always read from the file, so it is up to date also when a file
+    was overwritten.
+
+    Args:
+        workdir (str): Path to directory.
+        extensions (Optional[Iterable[str]]): Return only files with these
+            extensions, compared case insensitive.
+
+    Returns:
+        list[WorkdirFileItem]: Files in directory. Empty if directory
+            does not exist.
+    """
+
+    if extensions is not None:
+        extensions = {
+            ext.lower() if ext.startswith(".") else ".{}".format(ext.lower())
+            for ext in extensions
+        }
+
+    items = []
+    for filename in get_workdir_filenames(workdir):
+        if (
+            extensions is not None
+            and os.path.splitext(filename)[-1].lower() not in extensions
+        ):
+            continue
+        try:
+            modified = os.path.getmtime(os.path.join(workdir, filename))
+        except OSError:
+            continue
+        items.append(WorkdirFileItem(filename, modified))
+    return items
+
+
+def clear_workdir_listing_cache(workdir=None):
+    """Clear cached listing of workdirs.
+
+    Args:
+        workdir (Optional[str]): Clear cache only for this directory.
+    """
+
+    _workdir_listing_cache.clear(workdir)
+
+
+def workdir_file_exists(filepath):
+    """Check if file exists using cached listing of its directory.
+
+    Args:
+        filepath (str): Path to file.
+
+    Returns:
+        bool: File exists.
+    """
+
+    workdir, filename = os.path.split(os.path.normpath(filepath))
+    filename = os.path.normcase(filename)
+    return any(
+        os.path.normcase(item) == filename
+        for item in get_workdir_filenames(workdir)
+    )
+
+
+_version_regex_templates = {}
+_version_regexes = {}
+
+
+def _get_workfile_version_regex(file_template, fill_data, extensions):
+    """Compiled regex matching workfile names with version group.
+
+    Template converted to regex is cached by template and extensions,
+    compiled regex is cached by filled pattern.
+    """
+
+    key = (file_template, tuple(sorted(extensions)))
+    regex_template = _version_regex_templates.get(key)
+    if regex_template is None:
+        # Build template without optionals, version to digits only regex
+        # and comment to any definable value.
+        # Escape extensions dot for regex
+        regex_exts = [
+            "\\" + ext
+            for ext in sorted(extensions)
+        ]
+        ext_expression = "(?:" + "|".join(regex_exts) + ")"
+
+        # Replace `.{ext}` with `{ext}` so we are sure there is not dot at
+        #   the end
+        regex_template = re.sub(r"\.?{ext}", ext_expression, file_template)
+        # Replace optional keys with optional content regex
+        regex_template = re.sub(r"<.*?>", r".*?", regex_template)
+        # Replace `{version}` with group regex
+        regex_template = re.sub(
+            r"{version.*?}", r"([0-9]+)", regex_template
+        )
+        regex_template = re.sub(r"{comment.*?}", r".+?", regex_template)
+        _version_regex_templates[key] = regex_template
+
+    pattern = StringTemplate.format_strict_template(
+        regex_template, fill_data
+    )
+    regex = _version_regexes.get(pattern)
+    if regex is None:
+        # Match with ignore case on Windows due to the Windows
+        # OS not being case-sensitive. This avoids later running
+        # into the error that the file did exist if it existed
+        # with a different upper/lower-case.
+        flags = 0
+        if platform.system().lower() == "windows":
+            flags = re.IGNORECASE
+        regex = re.compile(pattern, flags)
+        if len(_version_regexes) >= 512:
+            _version_regexes.clear()
+        _version_regexes[pattern] = regex
+    return regex
+
+
 def get_last_workfile_with_version(
     workdir, file_template, fill_data, extensions
 ):
@@ -235,43 +448,19 @@ def get_last_workfile_with_version(
     # Fast match on extension
     filenames = [
         filename
-        for filename in os.listdir(workdir)
+        for filename in get_workdir_filenames(workdir)
         if os.path.splitext(filename)[-1] in dotted_extensions
     ]
 
-    # Build template without optionals, version to digits only regex
-    # and comment to any definable value.
-    # Escape extensions dot for regex
-    regex_exts = [
-        "\\" + ext
-        for ext in dotted_extensions
-    ]
-    ext_expression = "(?:" + "|".join(regex_exts) + ")"
-
-    # Replace `.{ext}` with `{ext}` so we are sure there is not dot at the end
-    file_template = re.sub(r"\.?{ext}", ext_expression, file_template)
-    # Replace optional keys with optional content regex
-    file_template = re.sub(r"<.*?>", r".*?", file_template)
-    # Replace `{version}` with group regex
-    file_template = re.sub(r"{version.*?}", r"([0-9]+)", file_template)
-    file_template = re.sub(r"{comment.*?}", r".+?", file_template)
-    file_template = StringTemplate.format_strict_template(
-        file_template, fill_data
+    regex = _get_workfile_version_regex(
+        file_template, fill_data, dotted_extensions
     )
 
-    # Match with ignore case on Windows due to the Windows
-    # OS not being case-sensitive. This avoids later running
-    # into the error that the file did exist if it existed
-    # with a different upper/lower-case.
-    kwargs = {}
-    if platform.system().lower() == "windows":
-        kwargs["flags"] = re.IGNORECASE
-
     # Get highest version among existing matching files
     version = None
     output_filenames = []
     for filename in sorted(filenames):
-        match = re.match(file_template, filename, **kwargs)
+        match = regex.match(filename)
         if not match:
             continue
 
@@ -294,8 +483,12 @@ def get_last_workfile_with_version(
         else:
             last_time = None
             for _output_filename in output_filenames:
-                full_path = os.path.join(workdir, _output_filename)
-                mod_time = os.path.getmtime(full_path)
+                try:
+                    mod_time = os.path.getmtime(
+                        os.path.join(workdir, _output_filename)
+                    )
+                except OSError:
+                    continue
                 if last_time is None or last_time < mod_time:
                     output_filename = _output_filename
                     last_time = mod_time
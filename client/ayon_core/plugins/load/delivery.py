@@ -1,6 +1,4 @@
-import copy
 import platform
-from collections import defaultdict
 
 import ayon_api
 from qtpy import QtWidgets, QtCore, QtGui
@@ -8,17 +6,10 @@ from qtpy import QtWidgets, QtCore, QtGui
 from ayon_core.pipeline import load, Anatomy
 from ayon_core import resources, style
 
-from ayon_core.lib import (
-    format_file_size,
-    collect_frames,
-    get_datetime_data,
-)
-from ayon_core.pipeline.load import get_representation_path_with_anatomy
+from ayon_core.lib import format_file_size
 from ayon_core.pipeline.delivery import (
     get_format_dict,
-    check_destination_path,
-    deliver_single_file,
-    deliver_sequence,
+    RepresentationsDelivery,
 )
 
 
@@ -76,7 +67,6 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self.anatomy = Anatomy(project_name)
         self._representations = None
         self.log = log
-        self.currently_uploaded = 0
 
         self._set_representations(project_name, contexts)
 
@@ -103,6 +93,11 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
 
         root_line_edit = QtWidgets.QLineEdit()
 
+        dry_run_checkbox = QtWidgets.QCheckBox()
+        dry_run_checkbox.setToolTip(
+            "Only show files which would be delivered"
+        )
+
         repre_checkboxes_layout = QtWidgets.QFormLayout()
         repre_checkboxes_layout.setContentsMargins(10, 5, 5, 10)
 
@@ -127,14 +122,15 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         input_layout.addRow("Renumber Frame", renumber_frame)
         input_layout.addRow("Renumber start frame", first_frame_start)
         input_layout.addRow("Root", root_line_edit)
+        input_layout.addRow("Dry run", dry_run_checkbox)
         input_layout.addRow("Representations", repre_checkboxes_layout)
 
         btn_delivery = QtWidgets.QPushButton("Deliver")
         btn_delivery.setEnabled(False)
 
         progress_bar = QtWidgets.QProgressBar(self)
-        progress_bar.setMinimum = 0
-        progress_bar.setMaximum = 100
+        progress_bar.setMinimum(0)
+        progress_bar.setMaximum(100)
         progress_bar.setVisible(False)
 
         text_area = QtWidgets.QTextEdit()
@@ -156,6 +152,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self.first_frame_start = first_frame_start
         self.renumber_frame = renumber_frame
         self.root_line_edit = root_line_edit
+        self.dry_run_checkbox = dry_run_checkbox
         self.progress_bar = progress_bar
         self.text_area = text_area
         self.btn_delivery = btn_delivery
@@ -179,97 +176,39 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.log.error(error_message.replace("\n", " "))
 
     def deliver(self):
-        """Main method to loop through all selected representations"""
+        """Plan delivery of all selected representations and process it."""
         self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
         self.btn_delivery.setEnabled(False)
         QtWidgets.QApplication.processEvents()
 
-        report_items = defaultdict(list)
-
         selected_repres = self._get_selected_repres()
 
-        datetime_data = get_datetime_data()
         template_name = self.dropdown.currentText()
         format_dict = get_format_dict(self.anatomy, self.root_line_edit.text())
-        renumber_frame = self.renumber_frame.isChecked()
-        frame_offset = self.first_frame_start.value()
-        for repre in self._representations:
-            if repre["name"] not in selected_repres:
-                continue
-
-            repre_path = get_representation_path_with_anatomy(
-                repre, self.anatomy
-            )
-
-            anatomy_data = copy.deepcopy(repre["context"])
-            new_report_items = check_destination_path(repre["id"],
-                                                      self.anatomy,
-                                                      anatomy_data,
-                                                      datetime_data,
-                                                      template_name)
+        delivery = RepresentationsDelivery(
+            self.anatomy,
+            template_name,
+            format_dict=format_dict,
+            renumber_frame=self.renumber_frame.isChecked(),
+            frame_start=self.first_frame_start.value(),
+            log=self.log
+        )
+        delivery.add_representations(
+            repre
+            for repre in self._representations
+            if repre["name"] in selected_repres
+        )
 
-            report_items.update(new_report_items)
-            if new_report_items:
-                continue
+        if self.dry_run_checkbox.isChecked():
+            manifest = delivery.get_manifest()
+            self.progress_bar.setVisible(False)
+            self.text_area.setText(self._format_manifest(manifest))
+            self.text_area.setVisible(True)
+            self.btn_delivery.setEnabled(True)
+            return
 
-            args = [
-                repre_path,
-                repre,
-                self.anatomy,
-                template_name,
-                anatomy_data,
-                format_dict,
-                report_items,
-                self.log
-            ]
-
-            if repre.get("files"):
-                src_paths = []
-                for repre_file in repre["files"]:
-                    src_path = self.anatomy.fill_root(repre_file["path"])
-                    src_paths.append(src_path)
-                sources_and_frames = collect_frames(src_paths)
-
-                frames = set(sources_and_frames.values())
-                frames.discard(None)
-                first_frame = None
-                if frames:
-                    first_frame = min(frames)
-
-                for src_path, frame in sources_and_frames.items():
-                    args[0] = src_path
-                    # Renumber frames
-                    if renumber_frame and frame is not None:
-                        # Calculate offset between
-                        # first frame and current frame
-                        # - '0' for first frame
-                        offset = frame_offset - int(first_frame)
-                        # Add offset to new frame start
-                        dst_frame = int(frame) + offset
-                        if dst_frame < 0:
-                            msg = "Renumber frame has a smaller number than original frame"     # noqa
-                            report_items[msg].append(src_path)
-                            self.log.warning("{} <{}>".format(
-                                msg, dst_frame))
-                            continue
-                        frame = dst_frame
-
-                    if frame is not None:
-                        anatomy_data["frame"] = frame
-                    new_report_items, uploaded = deliver_single_file(*args)
-                    report_items.update(new_report_items)
-                    self._update_progress(uploaded)
-            else:  # fallback for Pype2 and representations without files
-                frame = repre["context"].get("frame")
-                if frame:
-                    repre["context"]["frame"] = len(str(frame)) * "#"
-
-                if not frame:
-                    new_report_items, uploaded = deliver_single_file(*args)
-                else:
-                    new_report_items, uploaded = deliver_sequence(*args)
-                report_items.update(new_report_items)
-                self._update_progress(uploaded)
+        report_items, _ = delivery.deliver(self._update_progress)
 
         self.text_area.setText(self._format_report(report_items))
         self.text_area.setVisible(True)
@@ -353,12 +292,22 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.template_label.setText(template_value)
             self.btn_delivery.setEnabled(bool(self._get_selected_repres()))
 
-    def _update_progress(self, uploaded):
-        """Update progress bar after each repre copied."""
-        self.currently_uploaded += uploaded
-
-        ratio = self.currently_uploaded / self.files_selected
-        self.progress_bar.setValue(ratio * self.progress_bar.maximum())
+    def _update_progress(self, progress):
+        """Update progress bar and transfer speed during delivery."""
+        bytes_total = progress["bytes_total"]
+        if bytes_total:
+            ratio = progress["bytes_done"] / bytes_total
+        elif progress["files_total"]:
+            ratio = progress["files_done"] / progress["files_total"]
+        else:
+            ratio = 1.0
+        self.progress_bar.setValue(int(ratio * self.progress_bar.maximum()))
+        self.selected_label.setText("{}/{} files, {}/s".format(
+            progress["files_done"],
+            progress["files_total"],
+            format_file_size(progress["bytes_per_second"])
+        ))
+        QtWidgets.QApplication.processEvents()
 
     def _format_report(self, report_items):
         """Format final result and error details as html."""
@@ -374,3 +323,20 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                 txt += "{}<br>".format(item)
 
         return txt
+
+    def _format_manifest(self, manifest):
+        """Format dry-run manifest as html."""
+        txt = "<h2>Dry run: {} files, size {}</h2>".format(
+            manifest["files_count"],
+            format_file_size(manifest["size"])
+        )
+        for title, items in manifest["errors"].items():
+            txt += "<h3>{}</h3>".format(title)
+            for item in items:
+                txt += "{}<br>".format(item)
+
+        if manifest["transfers"]:
+            txt += "<h3>Transfers</h3>"
+        for transfer in manifest["transfers"]:
+            txt += "{} -> {}<br>".format(transfer["src"], transfer["dst"])
+        return txt
@@ -75,6 +75,11 @@ class ExtractBurnin(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    # Maximum number of processes converting input, based on CPUs if None
+    transcode_max_workers = None
+
+    # Cached burnin script module, 'False' if can't be imported
+    _burnin_module = None
 
     def process(self, instance):
         if not self.profiles:
@@ -210,10 +215,6 @@ class ExtractBurnin(publish.Extractor):
         _burnin_data, _temp_data = self.prepare_basic_data(instance)
 
         anatomy = instance.context.data["anatomy"]
-        scriptpath = self.burnin_script_path()
-
-        # Args that will execute the script
-        executable_args = ["run", scriptpath]
         for repre, repre_burnin_defs in burnins_per_repres:
             # Create copy of `_burnin_data` and `_temp_data` for repre.
             burnin_data = copy.deepcopy(_burnin_data)
@@ -257,7 +258,8 @@ class ExtractBurnin(publish.Extractor):
                 convert_input_paths_for_ffmpeg(
                     src_filepaths,
                     new_staging_dir,
-                    self.log
+                    self.log,
+                    max_workers=self.transcode_max_workers
                 )
 
             # Add anatomy keys to burnin_data.
@@ -286,6 +288,8 @@ class ExtractBurnin(publish.Extractor):
             first_output = True
 
             files_to_delete = []
+            new_repres = []
+            script_outputs = []
 
             repre_burnin_options = copy.deepcopy(burnin_options)
             # Use fps from representation for output in options
@@ -346,55 +350,32 @@ class ExtractBurnin(publish.Extractor):
                     repre, new_repre, temp_data, filename_suffix
                 )
 
-                # Data for burnin script
-                script_data = {
-                    "input": temp_data["full_input_path"],
+                script_outputs.append({
                     "output": temp_data["full_output_path"],
                     "burnin_data": burnin_data,
                     "options": repre_burnin_options,
                     "values": burnin_values,
-                    "full_input_path": temp_data["full_input_paths"][0],
-                    "first_frame": temp_data["first_frame"],
                     "ffmpeg_cmd": new_repre.get("ffmpeg_cmd", "")
-                }
-
-                self.log.debug(
-                    "script_data: {}".format(json.dumps(script_data, indent=4))
-                )
-
-                # Dump data to string
-                dumped_script_data = json.dumps(script_data)
-
-                # Store dumped json to temporary file
-                temporary_json_file = tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False
-                )
-                temporary_json_file.write(dumped_script_data)
-                temporary_json_file.close()
-                temporary_json_filepath = temporary_json_file.name.replace(
-                    "\\", "/"
-                )
-
-                # Prepare subprocess arguments
-                args = list(executable_args)
-                args.append(temporary_json_filepath)
-                args.append("--headless")
-                self.log.debug("Executing: {}".format(" ".join(args)))
-
-                # Run burnin script
-                process_kwargs = {
-                    "logger": self.log
-                }
-
-                run_ayon_launcher_process(*args, **process_kwargs)
-                # Remove the temporary json
-                os.remove(temporary_json_filepath)
+                })
 
                 for filepath in temp_data["full_input_paths"]:
                     filepath = filepath.replace("\\", "/")
                     if filepath not in files_to_delete:
                         files_to_delete.append(filepath)
 
+                new_repres.append(new_repre)
+
+            # All burnin definitions of the representation are rendered
+            #   at once, input is same for all of them
+            script_data = {
+                "input": temp_data["full_input_path"],
+                "full_input_path": temp_data["full_input_paths"][0],
+                "first_frame": temp_data["first_frame"],
+                "outputs": script_outputs,
+            }
+            self.render_burnins(script_data)
+
+            for new_repre in new_repres:
                 # Add new representation to instance
                 instance.data["representations"].append(new_repre)
 
@@ -838,6 +819,79 @@ class ExtractBurnin(publish.Extractor):
                 families.append(family)
         return families
 
+    def render_burnins(self, script_data):
+        """Render burnins of one source representation.
+
+        Burnins are rendered in current process if burnin script can be
+        imported, otherwise burnin script is executed in AYON launcher
+        process.
+
+        Args:
+            script_data (dict[str, Any]): Input and outputs definitions for
+                burnin script.
+        """
+        self.log.debug(
+            "script_data: {}".format(json.dumps(script_data, indent=4))
+        )
+
+        otio_burnin = self._get_burnin_module()
+        if otio_burnin is not None:
+            otio_burnin.burnins_from_data_multiple(
+                script_data["input"],
+                script_data["outputs"],
+                full_input_path=script_data["full_input_path"],
+                first_frame=script_data["first_frame"],
+                logger=self.log,
+            )
+            return
+
+        # Store dumped json to temporary file
+        temporary_json_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        )
+        temporary_json_file.write(json.dumps(script_data))
+        temporary_json_file.close()
+        temporary_json_filepath = temporary_json_file.name.replace(
+            "\\", "/"
+        )
+
+        # Prepare subprocess arguments
+        args = [
+            "run",
+            self.burnin_script_path(),
+            temporary_json_filepath,
+            "--headless"
+        ]
+        self.log.debug("Executing: {}".format(" ".join(args)))
+
+        # Run burnin script
+        try:
+            run_ayon_launcher_process(*args, logger=self.log)
+        finally:
+            # Remove the temporary json
+            os.remove(temporary_json_filepath)
+
+    def _get_burnin_module(self):
+        """Burnin script module if can be imported in current process.
+
+        Returns:
+            Union[ModuleType, None]: Burnin script module or None.
+        """
+        cls = self.__class__
+        if cls._burnin_module is None:
+            try:
+                from ayon_core.scripts import otio_burnin
+
+                cls._burnin_module = otio_burnin
+            except Exception:
+                self.log.debug(
+                    "Burnin script can't be imported in current process,"
+                    " burnins will be rendered in AYON launcher process.",
+                    exc_info=True
+                )
+                cls._burnin_module = False
+        return cls._burnin_module or None
+
     def burnin_script_path(self):
         """Return path to python script for burnin processing."""
         scriptpath = os.path.normpath(
@@ -3,6 +3,7 @@ import re
 import copy
 import json
 import shutil
+import tempfile
 import subprocess
 from abc import ABCMeta, abstractmethod
 
@@ -12,6 +13,7 @@ import speedcopy
 import pyblish.api
 
 from ayon_core.lib import (
+    create_hard_link,
     get_ffmpeg_tool_args,
     filter_profiles,
     path_to_subprocess_arg,
@@ -75,6 +77,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = []
+    # Maximum number of processes converting input, based on CPUs if None
+    transcode_max_workers = None
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -288,7 +292,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 convert_input_paths_for_ffmpeg(
                     input_filepaths,
                     new_staging_dir,
-                    self.log
+                    self.log,
+                    max_workers=self.transcode_max_workers
                 )
 
             try:
@@ -319,6 +324,15 @@ class ExtractReview(pyblish.api.InstancePlugin):
         layer_name
     ):
         fill_data = copy.deepcopy(instance.data["anatomyData"])
+        gaps_filled = False
+        use_concat_input = False
+        # Concat files by frame range used instead of filling gaps
+        concat_files = {}
+        files_to_clean = []
+        new_repres = []
+        # Groups of outputs rendered by one ffmpeg process
+        groups = []
+        groups_by_key = {}
         for _output_def in output_definitions:
             output_def = copy.deepcopy(_output_def)
             # Make sure output definition has "tags" key
@@ -368,15 +382,25 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
 
             temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
-            if temp_data["input_is_sequence"]:
+            if temp_data["input_is_sequence"] and not gaps_filled:
+                gaps_filled = True
                 self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
+                files_to_clean = self.fill_sequence_gaps_with_links(
                     files=temp_data["origin_repre"]["files"],
                     staging_dir=new_repre["stagingDir"],
                     start_frame=temp_data["frame_start"],
                     end_frame=temp_data["frame_end"]
                 )
+                # Use concat demuxer if links can't be created
+                if files_to_clean is None:
+                    self.log.debug(
+                        "Links are not supported in staging directory,"
+                        " gaps in sequence are filled using concat file."
+                    )
+                    files_to_clean = []
+                    use_concat_input = True
+            temp_data["input_use_concat"] = use_concat_input
+            temp_data["input_concat_files"] = concat_files
 
             # create or update outputName
             output_name = new_repre.get("outputName", "")
@@ -394,7 +418,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             })
 
             try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
+                ffmpeg_args_parts = self._ffmpeg_arguments_parts(
                     output_def,
                     instance,
                     new_repre,
@@ -413,20 +437,22 @@ class ExtractReview(pyblish.api.InstancePlugin):
                         ),
                         exc_info=True
                     )
-                    return
+                    break
                 raise NotImplementedError
 
-            subprcs_cmd = " ".join(ffmpeg_args)
-
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
-
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
-
-            # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
+            input_args, video_filters, audio_filters, output_args = (
+                ffmpeg_args_parts
+            )
+            output_args = self._move_filters_from_output_args(
+                output_args, video_filters, audio_filters
+            )
+            ffmpeg_args_parts = (
+                input_args, video_filters, audio_filters, output_args
+            )
+            # Command which would render only this output
+            subprcs_cmd = " ".join(
+                self.ffmpeg_full_args(*copy.deepcopy(ffmpeg_args_parts))
+            )
 
             new_repre.update({
                 "fps": temp_data["fps"],
@@ -443,6 +469,35 @@ class ExtractReview(pyblish.api.InstancePlugin):
             if "clean_name" in new_repre.get("tags", []):
                 new_repre.pop("outputName")
 
+            # Outputs with same input arguments (input and frame range)
+            #   are rendered by one ffmpeg process
+            group_key = None
+            if self._can_share_input(ffmpeg_args_parts):
+                group_key = tuple(input_args)
+            group = groups_by_key.get(group_key)
+            if group is None or group_key is None:
+                group = []
+                groups.append(group)
+                if group_key is not None:
+                    groups_by_key[group_key] = group
+            group.append({
+                "ffmpeg_args_parts": ffmpeg_args_parts,
+                "use_audio": not temp_data["output_ext_is_image"],
+                "ffmpeg_cmd": subprcs_cmd,
+            })
+            new_repres.append(new_repre)
+
+        try:
+            for group in groups:
+                self._render_outputs_group(group)
+
+        finally:
+            # delete files added to fill gaps
+            files_to_clean.extend(concat_files.values())
+            for filepath in files_to_clean:
+                os.unlink(filepath)
+
+        for new_repre in new_repres:
             # adding representation
             self.log.debug(
                 "Adding new representation: {}".format(new_repre)
@@ -451,6 +506,36 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
             add_repre_files_for_cleanup(instance, new_repre)
 
+    def _render_outputs_group(self, outputs):
+        """Render outputs which use same input.
+
+        Single output is rendered with its own command. Multiple outputs are
+        rendered with one ffmpeg process so input is decoded only once.
+
+        Args:
+            outputs (list[dict[str, Any]]): Prepared outputs.
+        """
+        if len(outputs) == 1:
+            subprcs_cmd = outputs[0]["ffmpeg_cmd"]
+        else:
+            input_args = outputs[0]["ffmpeg_args_parts"][0]
+            subprcs_cmd = " ".join(self.ffmpeg_multi_output_args(
+                input_args,
+                [
+                    (
+                        output["ffmpeg_args_parts"][1],
+                        output["ffmpeg_args_parts"][3],
+                        output["use_audio"],
+                    )
+                    for output in outputs
+                ]
+            ))
+
+        # run subprocess
+        self.log.debug("Executing: {}".format(subprcs_cmd))
+
+        run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
         # TODO GLOBAL ISSUE - Find better way how to find out if input
@@ -581,6 +666,33 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 process.
             temp_data (dict): Base data for successful process.
         """
+        return self.ffmpeg_full_args(*self._ffmpeg_arguments_parts(
+            output_def,
+            instance,
+            new_repre,
+            temp_data,
+            fill_data,
+            layer_name
+        ))
+
+    def _ffmpeg_arguments_parts(
+        self,
+        output_def,
+        instance,
+        new_repre,
+        temp_data,
+        fill_data,
+        layer_name
+    ):
+        """Prepares ffmpeg arguments split by their purpose.
+
+        Same as '_ffmpeg_arguments' but arguments are not merged into
+        final command.
+
+        Returns:
+            tuple[list, list, list, list]: Input arguments, video filters,
+                audio filters and output arguments with output filepath.
+        """
 
         # Get FFmpeg arguments from profile presets
         out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
@@ -639,6 +751,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
         if layer_name:
             ffmpeg_input_args.extend(["-layer", layer_name])
 
+        input_path = temp_data["full_input_path"]
         if temp_data["input_is_sequence"]:
             # Set start frame of input sequence (just frame in filename)
             # - definition of input filepath
@@ -646,20 +759,46 @@ class ExtractReview(pyblish.api.InstancePlugin):
             start_number = temp_data["first_sequence_frame"]
             if temp_data["without_handles"] and temp_data["handles_are_set"]:
                 start_number += temp_data["handle_start"]
-            ffmpeg_input_args.extend([
-                "-start_number", str(start_number)
-            ])
 
-            # TODO add fps mapping `{fps: fraction}` ?
-            # - e.g.: {
-            #     "25": "25/1",
-            #     "24": "24/1",
-            #     "23.976": "24000/1001"
-            # }
-            # Add framerate to input when input is sequence
-            ffmpeg_input_args.extend([
-                "-framerate", str(temp_data["fps"])
-            ])
+            if temp_data.get("input_use_concat"):
+                # Sequence with gaps is defined by concat file where
+                #   missing frames are covered by duration of previous frame
+                # - same file is used by outputs with same frame range
+                concat_files = temp_data["input_concat_files"]
+                concat_key = (start_number, output_frames_len)
+                input_path = concat_files.get(concat_key)
+                if input_path is None:
+                    input_path = self.create_sequence_concat_file(
+                        temp_data["origin_repre"]["files"],
+                        os.path.dirname(temp_data["full_input_path"]),
+                        start_number,
+                        output_frames_len,
+                        temp_data["fps"]
+                    )
+                    concat_files[concat_key] = input_path
+                ffmpeg_input_args.extend([
+                    "-f", "concat", "-safe", "0"
+                ])
+                # Output must have constant frame rate
+                ffmpeg_output_args.extend([
+                    "-r", str(temp_data["fps"])
+                ])
+
+            else:
+                ffmpeg_input_args.extend([
+                    "-start_number", str(start_number)
+                ])
+
+                # TODO add fps mapping `{fps: fraction}` ?
+                # - e.g.: {
+                #     "25": "25/1",
+                #     "24": "24/1",
+                #     "23.976": "24000/1001"
+                # }
+                # Add framerate to input when input is sequence
+                ffmpeg_input_args.extend([
+                    "-framerate", str(temp_data["fps"])
+                ])
             # Add duration of an input sequence if output is video
             if not temp_data["output_is_sequence"]:
                 ffmpeg_input_args.extend([
@@ -699,7 +838,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         # Add video/image input path
         ffmpeg_input_args.extend([
-            "-i", path_to_subprocess_arg(temp_data["full_input_path"])
+            "-i", path_to_subprocess_arg(input_path)
         ])
 
         # Add audio arguments if there are any. Skipped when output are images.
@@ -759,7 +898,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -807,6 +946,34 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        output_args = self._move_filters_from_output_args(
+            output_args, video_filters, audio_filters
+        )
+
+        all_args = [
+            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+        ]
+        all_args.extend(input_args)
+        if video_filters:
+            all_args.append("-filter:v")
+            all_args.append("\"{}\"".format(",".join(video_filters)))
+
+        if audio_filters:
+            all_args.append("-filter:a")
+            all_args.append("\"{}\"".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def _move_filters_from_output_args(
+        self, output_args, video_filters, audio_filters
+    ):
+        """Move filters found in output arguments to filters lists.
+
+        Returns:
+            list: Output arguments without filters.
+        """
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -823,40 +990,98 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     output_args.remove(arg)
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
+        return output_args
 
-        all_args = [
-            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
-        ]
-        all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v")
-            all_args.append("\"{}\"".format(",".join(video_filters)))
+    def _can_share_input(self, ffmpeg_args_parts):
+        """Output can be rendered with other outputs from same decoded input.
+
+        Outputs with audio inputs, audio filters, complex filters or with
+        labeled video filters are rendered separately.
 
+        Args:
+            ffmpeg_args_parts (tuple[list, list, list, list]): Arguments
+                prepared by '_ffmpeg_arguments_parts' with filters moved
+                from output arguments.
+
+        Returns:
+            bool: Output can be merged with other outputs.
+        """
+        input_args, video_filters, audio_filters, output_args = (
+            ffmpeg_args_parts
+        )
         if audio_filters:
-            all_args.append("-filter:a")
-            all_args.append("\"{}\"".format(",".join(audio_filters)))
+            return False
 
-        all_args.extend(output_args)
+        input_count = 0
+        for arg in input_args:
+            if arg == "-i" or arg.startswith("-i "):
+                input_count += 1
+        if input_count != 1:
+            return False
 
-        return all_args
+        for arg in output_args:
+            if (
+                arg.startswith("-filter_complex")
+                or arg.startswith("-lavfi")
+                or arg.startswith("-map")
+            ):
+                return False
 
-    def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
-        # type: (list, str, int, int) -> list
-        """Fill missing files in sequence by duplicating existing ones.
+        for video_filter in video_filters:
+            if "[" in video_filter or ";" in video_filter:
+                return False
+        return True
 
-        This will take nearest frame file and copy it with so as to fill
-        gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+    def ffmpeg_multi_output_args(self, input_args, outputs):
+        """Arguments to render multiple outputs from one decoded input.
+
+        Decoded input video is split into one branch per output, each
+        branch has video filters of the output.
+
+        Args:
+            input_args (list): Input arguments shared by all outputs.
+            outputs (list[tuple[list, list, bool]]): Video filters, output
+                arguments (with output filepath) and if audio of input
+                should be used for each output.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        graph_parts = ["[0:v]split={}{}".format(
+            len(outputs),
+            "".join("[in{}]".format(idx) for idx in range(len(outputs)))
+        )]
+        for idx, (video_filters, _, _) in enumerate(outputs):
+            graph_parts.append("[in{}]{}[out{}]".format(
+                idx, ",".join(video_filters) or "null", idx
+            ))
+
+        all_args = [
+            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+        ]
+        all_args.extend(input_args)
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(";".join(graph_parts)))
+
+        for idx, (_, output_args, use_audio) in enumerate(outputs):
+            all_args.extend(["-map", "\"[out{}]\"".format(idx)])
+            # Keep audio of video input which would be used by default
+            if use_audio:
+                all_args.extend(["-map", "\"0:a:0?\""])
+            all_args.extend(output_args)
+        return all_args
+
+    def _get_sequence_holes(self, files, start_frame, end_frame):
+        """Find missing frames in sequence and nearest existing frames.
 
         Args:
             files (list): List of representation files.
-            staging_dir (str): Path to staging directory.
             start_frame (int): Sequence start (no matter what files are there)
             end_frame (int): Sequence end (no matter what files are there)
 
         Returns:
-            list of added files. Those should be cleaned after work
-                is done.
+            tuple[clique.Collection, dict[int, int]]: Collection of files
+                and existing frame used for each missing frame.
 
         Raises:
             KnownPublishError: if more than one collection is obtained.
@@ -879,6 +1104,33 @@ class ExtractReview(pyblish.api.InstancePlugin):
             else:
                 # Use previous frame as source for hole
                 hole_frame_to_nearest[frame] = prev_frame
+        return col, hole_frame_to_nearest
+
+    def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
+        # type: (list, str, int, int) -> list
+        """Fill missing files in sequence by duplicating existing ones.
+
+        This will take nearest frame file and copy it with so as to fill
+        gaps in sequence. Last existing file there is is used to for the
+        hole ahead.
+
+        Args:
+            files (list): List of representation files.
+            staging_dir (str): Path to staging directory.
+            start_frame (int): Sequence start (no matter what files are there)
+            end_frame (int): Sequence end (no matter what files are there)
+
+        Returns:
+            list of added files. Those should be cleaned after work
+                is done.
+
+        Raises:
+            KnownPublishError: if more than one collection is obtained.
+        """
+
+        col, hole_frame_to_nearest = self._get_sequence_holes(
+            files, start_frame, end_frame
+        )
 
         # Calculate paths
         added_files = []
@@ -895,6 +1147,121 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         return added_files
 
+    def fill_sequence_gaps_with_links(
+        self, files, staging_dir, start_frame, end_frame
+    ):
+        # type: (list, str, int, int) -> Union[list, None]
+        """Fill missing files in sequence by links to existing ones.
+
+        Same as 'fill_sequence_gaps' but hardlinks, or symlinks, are created
+        instead of copies, so no data are duplicated. Nothing is created if
+        filesystem does not support links.
+
+        Args:
+            files (list): List of representation files.
+            staging_dir (str): Path to staging directory.
+            start_frame (int): Sequence start (no matter what files are there)
+            end_frame (int): Sequence end (no matter what files are there)
+
+        Returns:
+            Union[list, None]: Added files which should be cleaned after
+                work is done, or None if links can't be created.
+
+        Raises:
+            KnownPublishError: if more than one collection is obtained.
+        """
+
+        col, hole_frame_to_nearest = self._get_sequence_holes(
+            files, start_frame, end_frame
+        )
+
+        added_files = []
+        col_format = col.format("{head}{padding}{tail}")
+        for hole_frame, src_frame in hole_frame_to_nearest.items():
+            hole_fpath = os.path.join(staging_dir, col_format % hole_frame)
+            src_fpath = os.path.join(staging_dir, col_format % src_frame)
+            if not os.path.isfile(src_fpath):
+                raise KnownPublishError(
+                    "Missing previously detected file: {}".format(src_fpath))
+
+            try:
+                self._link_file(src_fpath, hole_fpath)
+            except (OSError, NotImplementedError):
+                self.log.debug(
+                    "Failed to create link of \"{}\"".format(src_fpath),
+                    exc_info=True
+                )
+                for filepath in added_files:
+                    os.unlink(filepath)
+                return None
+            added_files.append(hole_fpath)
+
+        return added_files
+
+    def _link_file(self, src_path, dst_path):
+        """Create hardlink of file, symlink if hardlink is not possible."""
+        try:
+            create_hard_link(src_path, dst_path)
+        except (OSError, NotImplementedError):
+            os.symlink(src_path, dst_path)
+
+    def create_sequence_concat_file(
+        self, files, input_dir, start_frame, frames_count, fps
+    ):
+        """Create ffmpeg concat demuxer file for sequence with gaps.
+
+        Each frame of output range is represented by existing frame file.
+        Missing frames are covered by duration of previous existing frame,
+        so no files are duplicated.
+
+        Args:
+            files (list): List of representation files.
+            input_dir (str): Directory where input files are.
+            start_frame (int): First frame used for output.
+            frames_count (int): Number of output frames.
+            fps (float): Frame rate of output.
+
+        Returns:
+            str: Path to concat file.
+
+        Raises:
+            KnownPublishError: if more than one collection is obtained.
+        """
+
+        end_frame = start_frame + frames_count - 1
+        col, hole_frame_to_nearest = self._get_sequence_holes(
+            files, start_frame, end_frame
+        )
+        col_format = col.format("{head}{padding}{tail}")
+
+        # Merge consecutive frames using same file
+        entries = []
+        for frame in range(int(start_frame), int(end_frame) + 1):
+            src_frame = hole_frame_to_nearest.get(frame, frame)
+            if entries and entries[-1][0] == src_frame:
+                entries[-1][1] += 1
+            else:
+                entries.append([src_frame, 1])
+
+        lines = ["ffconcat version 1.0"]
+        last_path = None
+        for src_frame, count in entries:
+            last_path = os.path.join(
+                input_dir, col_format % src_frame
+            ).replace("\\", "/").replace("'", "'\\''")
+            lines.append("file '{}'".format(last_path))
+            lines.append("duration {:0.10f}".format(count / fps))
+
+        # Last file must be repeated otherwise its duration is ignored
+        if last_path is not None:
+            lines.append("file '{}'".format(last_path))
+
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".ffconcat", delete=False
+        ) as stream:
+            stream.write("\n".join(lines))
+        return stream.name
+
     def input_output_paths(self, new_repre, output_def, temp_data):
         """Deduce input nad output file paths based on entered data.
 
@@ -2,13 +2,16 @@ import os
 import logging
 import sys
 import copy
+import collections
 
 import clique
 import six
 import pyblish.api
 from ayon_api import (
     get_attributes_for_type,
+    get_products,
     get_product_by_name,
+    get_versions,
     get_version_by_name,
     get_representations,
 )
@@ -20,7 +23,8 @@ from ayon_api.operations import (
 )
 from ayon_api.utils import create_entity_id
 
-from ayon_core.lib import source_hash
+from ayon_core.lib import source_hash_from_stat
+from ayon_core.lib.path_templates import FormatObject
 from ayon_core.lib.file_transaction import (
     FileTransaction,
     DuplicateDestinationError
@@ -83,6 +87,154 @@ def get_frame_padded(frame, padding):
     return "{frame:0{padding}d}".format(padding=padding, frame=frame)
 
 
+class _IndexPlaceholder(FormatObject):
+    """Frame or udim placeholder ignoring format spec of template key."""
+
+    value = "<<__sequence_index__>>"
+
+    def __init__(self):
+        pass
+
+    def __format__(self, *args, **kwargs):
+        return self.value
+
+
+class _ExistingEntitiesCache(object):
+    """Existing products, versions and representations of publish context.
+
+    Entities for all instances which will be integrated are queried at once,
+    instead of querying them for each instance separately. Missing entities
+    are queried on demand.
+
+    Args:
+        project_name (str): Project name.
+    """
+
+    def __init__(self, project_name):
+        self._project_name = project_name
+        # (folder id, product name) -> product entity or None
+        self._products_by_key = {}
+        # (product id, version number) -> version entity or None
+        self._versions_by_key = {}
+        # version id -> list of representation entities
+        self._repres_by_version_id = {}
+
+    def prefetch(self, keys):
+        """Query entities for multiple instances with single query per type.
+
+        Args:
+            keys (Iterable[tuple[str, str, int]]): Folder id, product name
+                and version number of instances.
+        """
+
+        keys = {
+            key
+            for key in keys
+            if (key[0], key[1]) not in self._products_by_key
+        }
+        if not keys:
+            return
+
+        folder_ids = {key[0] for key in keys}
+        product_names = {key[1] for key in keys}
+        for key in keys:
+            self._products_by_key[(key[0], key[1])] = None
+
+        product_keys = {(key[0], key[1]) for key in keys}
+        for product_entity in get_products(
+            self._project_name,
+            folder_ids=folder_ids,
+            product_names=product_names,
+            active=None,
+        ):
+            product_key = (product_entity["folderId"], product_entity["name"])
+            if product_key in product_keys:
+                self._products_by_key[product_key] = product_entity
+
+        version_keys = set()
+        for folder_id, product_name, version in keys:
+            product_entity = self._products_by_key[(folder_id, product_name)]
+            if product_entity is not None:
+                version_keys.add((product_entity["id"], version))
+
+        if not version_keys:
+            return
+
+        for version_key in version_keys:
+            self._versions_by_key[version_key] = None
+
+        version_ids = set()
+        for version_entity in get_versions(
+            self._project_name,
+            product_ids={key[0] for key in version_keys},
+            versions={key[1] for key in version_keys},
+            active=None,
+        ):
+            version_key = (
+                version_entity["productId"], version_entity["version"]
+            )
+            if version_key in version_keys:
+                self._versions_by_key[version_key] = version_entity
+                version_ids.add(version_entity["id"])
+
+        if not version_ids:
+            return
+
+        for version_id in version_ids:
+            self._repres_by_version_id[version_id] = []
+
+        for repre_entity in get_representations(
+            self._project_name, version_ids=version_ids
+        ):
+            self._repres_by_version_id[repre_entity["versionId"]].append(
+                repre_entity
+            )
+
+    def get_product(self, folder_id, product_name):
+        key = (folder_id, product_name)
+        if key not in self._products_by_key:
+            self._products_by_key[key] = get_product_by_name(
+                self._project_name, product_name, folder_id
+            )
+        return self._products_by_key[key]
+
+    def get_version(self, product_id, version):
+        key = (product_id, version)
+        if key not in self._versions_by_key:
+            self._versions_by_key[key] = get_version_by_name(
+                self._project_name, version, product_id
+            )
+        return self._versions_by_key[key]
+
+    def get_representations(self, version_id):
+        if version_id not in self._repres_by_version_id:
+            self._repres_by_version_id[version_id] = list(
+                get_representations(
+                    self._project_name, version_ids=[version_id]
+                )
+            )
+        return list(self._repres_by_version_id[version_id])
+
+    def invalidate(self, product_entity, version_entity):
+        """Remove cached entities changed by integration.
+
+        Entities are queried again if are requested later, e.g. when more
+        instances are integrating the same product.
+
+        Args:
+            product_entity (dict[str, Any]): Integrated product.
+            version_entity (dict[str, Any]): Integrated version.
+        """
+
+        self._products_by_key.pop(
+            (product_entity["folderId"], product_entity["name"]), None
+        )
+        self._versions_by_key.pop(
+            (version_entity["productId"], version_entity["version"]), None
+        )
+        self._repres_by_version_id.pop(version_entity["id"], None)
+
+
 class IntegrateAsset(pyblish.api.InstancePlugin):
     """Register publish in the database and transfer files to destinations.
 
@@ -172,6 +324,10 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
     default_template_name = "publish"
 
+    # Number of threads used to transfer files to destination
+    #   - value lower than 2 means the files are transferred serially
+    file_transaction_workers = 8
+
     # Representation context keys that should always be written to
     # the database even if not used by the destination template
     db_representation_context_keys = [
@@ -212,9 +368,16 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["productType"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        # Query existing entities of all integrated instances at once
+        self._get_existing_entities_cache(instance.context)
+
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.file_transaction_workers,
+            progress_callback=self._log_transfer_progress,
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -235,6 +398,19 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # the try, except.
         file_transactions.finalize()
 
+    def _log_transfer_progress(
+        self, transferred_files, total_files, transferred_bytes, total_bytes
+    ):
+        # Log only each 10th percent of transferred files
+        step = max(total_files // 10, 1)
+        if transferred_files % step and transferred_files != total_files:
+            return
+        self.log.debug(
+            "Transferred {}/{} files ({}/{} bytes)".format(
+                transferred_files, total_files, transferred_bytes, total_bytes
+            )
+        )
+
     def filter_representations(self, instance):
         # Prepare repsentations that should be integrated
         repres = instance.data.get("representations")
@@ -292,12 +468,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         anatomy = instance.context.data["anatomy"]
 
+        entities_cache = self._get_existing_entities_cache(instance.context)
         # Get existing representations (if any)
         existing_repres_by_name = {
             repre_entity["name"].lower(): repre_entity
-            for repre_entity in get_representations(
-                project_name,
-                version_ids=[version_entity["id"]]
+            for repre_entity in entities_cache.get_representations(
+                version_entity["id"]
             )
         }
 
@@ -343,6 +519,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # increase if the file transaction takes a long time.
         op_session.commit()
 
+        # Cached entities of the product are not valid anymore
+        entities_cache.invalidate(product_entity, version_entity)
+
         self.log.info((
             "Product '{}' version {} written to database.."
         ).format(product_entity["name"], version_entity["version"]))
@@ -433,8 +612,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         self.log.debug("Product: {}".format(product_name))
 
         # Get existing product if it exists
-        existing_product_entity = get_product_by_name(
-            project_name, product_name, folder_entity["id"]
+        entities_cache = self._get_existing_entities_cache(instance.context)
+        existing_product_entity = entities_cache.get_product(
+            folder_entity["id"], product_name
         )
 
         # Define product data
@@ -502,10 +682,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         if task_entity:
             task_id = task_entity["id"]
 
-        existing_version = get_version_by_name(
-            project_name,
-            version_number,
-            product_entity["id"]
+        entities_cache = self._get_existing_entities_cache(instance.context)
+        existing_version = entities_cache.get_version(
+            product_entity["id"], version_number
         )
         version_id = None
         if existing_version:
@@ -783,22 +962,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            #   - template is formatted only once with frame placeholder
+            #       and destinations are expanded from it
+            repre_context, dst_filepaths = self._get_sequence_destinations(
+                path_template_obj,
+                template_data,
+                destination_indexes,
+                destination_padding,
+                is_udim
+            )
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -806,10 +978,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if not is_udim:
                 repre_context["frame"] = first_index_padded
 
-            # Update the destination indexes and padding
-            dst_collection = clique.assemble(dst_filepaths)[0][0]
-            dst_collection.padding = destination_padding
-            if len(src_collection.indexes) != len(dst_collection.indexes):
+            if len(src_collection.indexes) != len(dst_filepaths):
                 raise KnownPublishError((
                     "This is a bug. Source sequence frames length"
                     " does not match integration frames length"
@@ -817,7 +986,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
             # Multiple file transfers
             transfers = []
-            for src_file_name, dst in zip(src_collection, dst_collection):
+            for src_file_name, dst in zip(src_collection, dst_filepaths):
                 src = os.path.join(stagingdir, src_file_name)
                 transfers.append((src, dst))
 
@@ -909,6 +1078,80 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             "published_files": [transfer[1] for transfer in transfers]
         }
 
+    def _get_sequence_destinations(
+        self,
+        path_template_obj,
+        template_data,
+        destination_indexes,
+        destination_padding,
+        is_udim
+    ):
+        """Destination filepaths of sequence representation.
+
+        Template is formatted once with a placeholder in place of frame
+        (or udim) and destination of each index is created by replacing
+        the placeholder with padded index. Per-index formatting is used
+        only if the placeholder is not exactly once in the filled template.
+
+        Args:
+            path_template_obj (StringTemplate): Publish path template.
+            template_data (dict[str, Any]): Template fill data.
+            destination_indexes (list[int]): Destination frame indexes.
+            destination_padding (int): Padding of destination indexes.
+            is_udim (bool): Indexes are udim tiles.
+
+        Returns:
+            tuple[dict[str, Any], list[str]]: Representation context and
+                destination filepaths sorted by indexes.
+        """
+
+        index_key = "udim" if is_udim else "frame"
+        template_data[index_key] = _IndexPlaceholder()
+        template_filled = path_template_obj.format_strict(template_data)
+        # Keep last index in template data as if each index was formatted
+        template_data[index_key] = destination_indexes[-1]
+
+        parts = str(template_filled).split(_IndexPlaceholder.value)
+        if len(parts) == 2:
+            self.log.debug(
+                "Template filled: {}".format(
+                    get_frame_padded(
+                        destination_indexes[0], destination_padding
+                    ).join(parts)
+                )
+            )
+            repre_context = template_filled.used_values
+            repre_context[index_key] = get_frame_padded(
+                destination_indexes[0], destination_padding
+            )
+            head, tail = parts
+            dst_filepaths = [
+                "{}{}{}".format(
+                    head, get_frame_padded(index, destination_padding), tail
+                )
+                for index in sorted(destination_indexes)
+            ]
+            return repre_context, dst_filepaths
+
+        repre_context = None
+        dst_filepaths = []
+        for index in destination_indexes:
+            template_data[index_key] = index
+            template_filled = path_template_obj.format_strict(
+                template_data
+            )
+            dst_filepaths.append(template_filled)
+            if repre_context is None:
+                self.log.debug(
+                    "Template filled: {}".format(str(template_filled))
+                )
+                repre_context = template_filled.used_values
+
+        # Update the destination indexes and padding
+        dst_collection = clique.assemble(dst_filepaths)[0][0]
+        dst_collection.padding = destination_padding
+        return repre_context, list(dst_collection)
+
     def create_version_data(self, instance):
         """Create the data dictionary for the version
 
@@ -1026,29 +1269,65 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             list[dict[str, Any]]: Representation 'files' information.
 
         """
+        filepaths = list(filepaths)
+        stats_by_path = self._get_files_stats(filepaths)
         file_infos = []
         for filepath in filepaths:
-            file_info = self.prepare_file_info(filepath, anatomy)
+            file_info = self.prepare_file_info(
+                filepath, anatomy, stats_by_path.get(filepath)
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy):
+    def _get_files_stats(self, filepaths):
+        """Collect stat of files with single directory scan per directory.
+
+        Args:
+            filepaths (Iterable[str]): File paths.
+
+        Returns:
+            dict[str, os.stat_result]: Stat by filepath. Files which were
+                not found during scan are not in output.
+        """
+
+        filepaths_by_dir = collections.defaultdict(dict)
+        for filepath in filepaths:
+            dirpath, filename = os.path.split(filepath)
+            filepaths_by_dir[dirpath][filename] = filepath
+
+        output = {}
+        for dirpath, filepaths_by_name in filepaths_by_dir.items():
+            try:
+                with os.scandir(dirpath) as scan_iter:
+                    for entry in scan_iter:
+                        filepath = filepaths_by_name.get(entry.name)
+                        if filepath is not None:
+                            output[filepath] = entry.stat()
+            except OSError:
+                continue
+        return output
+
+    def prepare_file_info(self, path, anatomy, stat=None):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
             path (str): Destination url of published file.
             anatomy (Anatomy): Project anatomy part from instance.
+            stat (Optional[os.stat_result]): Stat of the file if already
+                available.
 
         Returns:
             dict[str, Any]: Representation file info dictionary.
 
         """
+        if stat is None:
+            stat = os.stat(path)
         return {
             "id": create_entity_id(),
             "name": os.path.basename(path),
             "path": self.get_rootless_path(anatomy, path),
-            "size": os.path.getsize(path),
-            "hash": source_hash(path),
+            "size": stat.st_size,
+            "hash": source_hash_from_stat(path, stat),
             "hash_type": "op3",
         }
 
@@ -1071,6 +1350,50 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                 "must be in project dir"
             ))
 
+    def _get_existing_entities_cache(self, context):
+        """Cache of existing entities shared by all instances of context.
+
+        On first call are queried existing products, versions and
+        representations of all instances which will be integrated.
+
+        Args:
+            context (pyblish.api.Context): Publish context.
+
+        Returns:
+            _ExistingEntitiesCache: Cache of existing entities.
+        """
+
+        entities_cache = context.data.get("integrateExistingEntities")
+        if entities_cache is not None:
+            return entities_cache
+
+        entities_cache = _ExistingEntitiesCache(context.data["projectName"])
+        context.data["integrateExistingEntities"] = entities_cache
+
+        keys = set()
+        for instance in context:
+            if (
+                not instance.data.get("publish", True)
+                or instance.data.get("farm")
+                or not instance.data.get("integrate", True)
+            ):
+                continue
+
+            folder_entity = instance.data.get("folderEntity")
+            product_name = instance.data.get("productName")
+            version = instance.data.get("version")
+            # Version number must be integer to match queried versions
+            if (
+                not folder_entity
+                or not product_name
+                or not isinstance(version, int)
+            ):
+                continue
+            keys.add((folder_entity["id"], product_name, version))
+
+        entities_cache.prefetch(keys)
+        return entities_cache
+
     def _get_attributes_for_type(self, context, entity_type):
         return self._get_attributes_by_type(context)[entity_type]
 
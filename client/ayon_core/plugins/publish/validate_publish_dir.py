@@ -18,6 +18,7 @@ class ValidatePublishDir(pyblish.api.InstancePlugin):
 
     order = ValidateContentsOrder
     label = "Validate publish dir"
+    executable_in_thread = True
 
     checked_template_names = ["source"]
     # validate instances might have interim family, needs to be mapped to final
@@ -18,6 +18,7 @@ class ValidateResources(pyblish.api.InstancePlugin):
 
     order = ValidateContentsOrder
     label = "Validate Resources"
+    executable_in_thread = True
 
     def process(self, instance):
 
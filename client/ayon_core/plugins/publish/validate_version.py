@@ -16,6 +16,7 @@ class ValidateVersion(pyblish.api.InstancePlugin):
 
     optional = False
     active = True
+    executable_in_thread = True
 
     def process(self, instance):
         version = instance.data.get("version")
@@ -17,14 +17,49 @@ Providing functionality:
 - _get_views_data - python 3 - module function
                  - returning all available viewers
                    found in input config path.
+- serve - console command - long running process
+        - reading json requests from stdin line by line and writing
+          responses to stdout
 """
 
-import click
+import os
+import sys
 import json
+import traceback
 from pathlib import Path
+
+import click
 import PyOpenColorIO as ocio
 
 
+# Loaded configs by normalized path with modification time of the file
+_CONFIGS_CACHE = {}
+
+
+def _get_config(config_path):
+    """Get OCIO config object.
+
+    Config is loaded only once and is loaded again only when modification
+    time of the config file changes.
+
+    Args:
+        config_path (Union[str, Path]): path to config.ocio file
+
+    Returns:
+        ocio.Config: OCIO config object.
+    """
+    config_path = str(config_path)
+    mtime = os.stat(config_path).st_mtime_ns
+    cache_key = os.path.normpath(config_path)
+    cached = _CONFIGS_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    config = ocio.Config.CreateFromFile(config_path)
+    _CONFIGS_CACHE[cache_key] = (mtime, config)
+    return config
+
+
 @click.group()
 def main():
     pass  # noqa: WPS100
@@ -104,7 +139,7 @@ def _get_colorspace_data(config_path):
         raise IOError(
             f"Input path `{config_path}` should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     colorspace_data = {
         "roles": {},
@@ -201,7 +236,7 @@ def _get_views_data(config_path):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     data_ = {}
     for display in config.getDisplays():
@@ -274,7 +309,7 @@ def _get_version_data(config_path):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     return {
         "major": config.getMajorVersion(),
@@ -339,7 +374,7 @@ def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
         IOError: Input config does not exist.
 
     Returns:
-        dict: aggregated available colorspaces
+        Union[str, None]: matching colorspace name
     """
     config_path = Path(config_path)
 
@@ -347,12 +382,45 @@ def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
         raise IOError(
             f"Input path `{config_path}` should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
-    # TODO: use `parseColorSpaceFromString` instead if ocio v1
-    colorspace = config.getColorSpaceFromFilepath(str(filepath))
+    return _get_file_rules_colorspace_name(config, filepath)
 
-    return colorspace
+
+def _get_config_file_rules_colorspaces_from_filepaths(config_path, filepaths):
+    """Return colorspaces found in v2 file rules for multiple paths.
+
+    Args:
+        config_path (str): path string leading to config.ocio
+        filepaths (list[str]): path strings tested by v2 file rules
+
+    Raises:
+        IOError: Input config does not exist.
+
+    Returns:
+        dict[str, Union[str, None]]: colorspace name by file path
+    """
+    config_path = Path(config_path)
+
+    if not config_path.is_file():
+        raise IOError(
+            f"Input path `{config_path}` should be `config.ocio` file")
+
+    config = _get_config(config_path)
+
+    return {
+        filepath: _get_file_rules_colorspace_name(config, filepath)
+        for filepath in filepaths
+    }
+
+
+def _get_file_rules_colorspace_name(config, filepath):
+    # TODO: use `parseColorSpaceFromString` instead if ocio v1
+    # Result is tuple of colorspace name and index of matching rule
+    result = config.getColorSpaceFromFilepath(str(filepath))
+    if result:
+        return result[0]
+    return None
 
 
 def _get_display_view_colorspace_name(config_path, display, view):
@@ -376,7 +444,7 @@ def _get_display_view_colorspace_name(config_path, display, view):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config.CreateFromFile(str(config_path))
+    config = _get_config(config_path)
     colorspace = config.getDisplayViewColorSpaceName(display, view)
 
     return colorspace
@@ -429,5 +497,83 @@ def get_display_view_colorspace_name(in_path, out_path,
 
     print(f"Display view colorspace saved to '{out_path}'")
 
+
+# Prefix of response lines so they can be distinguished from any other
+#   output of the process
+RESPONSE_PREFIX = "__ayon_ocio_response__:"
+
+# Commands available in 'serve' with their functions
+_SERVE_COMMANDS = {
+    "get_colorspace": lambda in_path: _get_colorspace_data(in_path),
+    "get_views": lambda in_path: _get_views_data(in_path),
+    "get_version": lambda config_path: _get_version_data(config_path),
+    "get_config_file_rules_colorspace_from_filepath": (
+        lambda config_path, filepath: (
+            _get_config_file_rules_colorspace_from_filepath(
+                config_path, filepath
+            )
+        )
+    ),
+    "get_config_file_rules_colorspaces_from_filepaths": (
+        lambda config_path, filepaths: (
+            _get_config_file_rules_colorspaces_from_filepaths(
+                config_path, filepaths
+            )
+        )
+    ),
+    "get_display_view_colorspace_name": (
+        lambda in_path, display, view: _get_display_view_colorspace_name(
+            in_path, display, view
+        )
+    ),
+}
+
+
+def _process_request(line):
+    response = {"id": None}
+    try:
+        request = json.loads(line)
+        response["id"] = request.get("id")
+        func = _SERVE_COMMANDS[request["command"]]
+        response["result"] = func(**(request.get("kwargs") or {}))
+
+    except Exception:
+        response["error"] = traceback.format_exc()
+    return response
+
+
+@main.command(
+    name="serve",
+    help=(
+        "process requests from stdin until stdin is closed "
+        "- each request is json on single line"
+    )
+)
+def serve():
+    """Process requests until stdin is closed.
+
+    Process is used as long living helper for processes without access
+    to OpenColorIO, so it is not necessary to start new process for each
+    query.
+
+    Each line of stdin is a json request with 'id', 'command' and 'kwargs'.
+    Command names and kwargs match console commands of this script. Response
+    is written to stdout on single line with 'RESPONSE_PREFIX' and
+    contains 'id' and 'result' or 'error'.
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py serve
+    """
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        response = _process_request(line)
+        sys.stdout.write(RESPONSE_PREFIX + json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
 if __name__ == '__main__':
     main()
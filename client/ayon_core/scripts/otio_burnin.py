@@ -1,5 +1,6 @@
 import os
 import sys
+import copy
 import subprocess
 import platform
 import json
@@ -14,9 +15,11 @@ from ayon_core.lib import (
     convert_ffprobe_fps_value,
 )
 
-FFMPEG = (
-    '{}%(input_args)s -i "%(input)s" %(filters)s %(args)s%(output)s'
+FFMPEG_INPUT = (
+    '{}%(input_args)s -i "%(input)s"'
 ).format(subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg")))
+FFMPEG_OUTPUT = "%(filters)s %(args)s%(output)s"
+FFMPEG = " ".join((FFMPEG_INPUT, FFMPEG_OUTPUT))
 
 DRAWTEXT = (
     "drawtext@'%(label)s'=fontfile='%(font)s':text=\\'%(text)s\\':"
@@ -137,6 +140,9 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
 
         super().__init__(source, source_streams)
 
+        # Copy class options so multiple burnins in one process
+        #   don't affect each other
+        self.options_init = copy.deepcopy(self.options_init)
         if options_init:
             self.options_init.update(options_init)
 
@@ -426,6 +432,41 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
         :returns: completed command
         :rtype: str
         """
+        return " ".join((
+            self.input_command(),
+            self.output_command(output, args, overwrite)
+        )).strip()
+
+    def input_command(self):
+        """Part of FFMPEG command with executable and input arguments.
+
+        :returns: command part
+        :rtype: str
+        """
+        input_args = list(self.input_args)
+        if self.first_frame is not None:
+            input_args.append("-start_number {}".format(self.first_frame))
+
+        input_args_str = ""
+        if input_args:
+            input_args_str = " {}".format(" ".join(input_args))
+
+        return FFMPEG_INPUT % {
+            'input_args': input_args_str,
+            'input': self.source,
+        }
+
+    def output_command(self, output=None, args=None, overwrite=False):
+        """Part of FFMPEG command with filters and arguments of one output.
+
+        Multiple outputs can follow single input part of command.
+
+        :param str output: output file
+        :param str args: additional FFMPEG arguments
+        :param bool overwrite: overwrite the output if it exists
+        :returns: command part
+        :rtype: str
+        """
         output = '"{}"'.format(output or '')
         if overwrite:
             output = '-y {}'.format(output)
@@ -442,20 +483,12 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
 
         if self.first_frame is not None:
             start_number_arg = "-start_number {}".format(self.first_frame)
-            self.input_args.append(start_number_arg)
-            if "start_number" not in args:
-                if not args:
-                    args = start_number_arg
-                else:
-                    args = " ".join((start_number_arg, args))
-
-        input_args = ""
-        if self.input_args:
-            input_args = " {}".format(" ".join(self.input_args))
-
-        return (FFMPEG % {
-            'input_args': input_args,
-            'input': self.source,
+            if not args:
+                args = start_number_arg
+            elif "start_number" not in args:
+                args = " ".join((start_number_arg, args))
+
+        return (FFMPEG_OUTPUT % {
             'output': output,
             'args': '%s ' % args if args else '',
             'filters': filters
@@ -469,49 +502,128 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
         :param str args: additional FFMPEG arguments
         :param bool overwrite: overwrite the output if it exists
         """
-        if not overwrite and os.path.exists(output):
-            raise RuntimeError("Destination '%s' exists, please "
-                               "use overwrite" % output)
-
-        is_sequence = "%" in output
+        self.validate_output(output, overwrite)
 
         command = self.command(
             output=output,
             args=args,
             overwrite=overwrite
         )
-        print("Launching command: {}".format(command))
+        _run_command(command, output)
+        self.validate_rendered_output(output, kwargs.get("duration"))
+        self.cleanup()
 
-        kwargs = {
-            "stdout": subprocess.PIPE,
-            "stderr": subprocess.PIPE,
-            "shell": True,
-        }
-        proc = subprocess.Popen(command, **kwargs)
-
-        _stdout, _stderr = proc.communicate()
-        if _stdout:
-            print(_stdout.decode("utf-8", errors="backslashreplace"))
-
-        # This will probably never happen as ffmpeg use stdout
-        if _stderr:
-            print(_stderr.decode("utf-8", errors="backslashreplace"))
+    def validate_output(self, output, overwrite):
+        """Raise an error if output exists and should not be overwritten."""
+        if not overwrite and os.path.exists(output):
+            raise RuntimeError("Destination '%s' exists, please "
+                               "use overwrite" % output)
 
-        if proc.returncode != 0:
-            raise RuntimeError(
-                "Failed to render '{}': {}'".format(output, command)
-            )
-        if is_sequence:
-            output = output % kwargs.get("duration")
+    def validate_rendered_output(self, output, duration=None):
+        """Raise an error if output was not rendered."""
+        if "%" in output:
+            output = output % duration
 
         if not os.path.exists(output):
             raise RuntimeError(
                 "Failed to generate this f*cking file '%s'" % output
             )
 
+    def cleanup(self):
+        """Remove temporary files created for rendering."""
         for path in self.cleanup_paths:
             if os.path.exists(path):
                 os.remove(path)
+        self.cleanup_paths = []
+
+
+def _run_command(command, output, logger=None):
+    """Run FFMPEG command.
+
+    Output of the process is printed, or logged if logger is passed.
+
+    Args:
+        command (str): Command to run.
+        output (str): Output path used in error message.
+        logger (Optional[logging.Logger]): Logger used for output.
+
+    Raises:
+        RuntimeError: Process finished with nonzero return code.
+    """
+    debug_log = print
+    info_log = print
+    if logger is not None:
+        debug_log = logger.debug
+        info_log = logger.info
+
+    debug_log("Launching command: {}".format(command))
+
+    kwargs = {
+        "stdout": subprocess.PIPE,
+        "stderr": subprocess.PIPE,
+        "shell": True,
+    }
+    proc = subprocess.Popen(command, **kwargs)
+
+    _stdout, _stderr = proc.communicate()
+    if _stdout:
+        _stdout = _stdout.decode("utf-8", errors="backslashreplace")
+        debug_log(_stdout)
+
+    # FFMPEG writes its log to stderr
+    if _stderr:
+        _stderr = _stderr.decode("utf-8", errors="backslashreplace")
+        info_log(_stderr)
+
+    if proc.returncode != 0:
+        exc_msg = "Failed to render '{}': {}".format(output, command)
+        if _stderr:
+            exc_msg += "\n\nError:\n{}".format(_stderr)
+        raise RuntimeError(exc_msg)
+
+
+def render_burnins(burnins_outputs, overwrite=True, logger=None):
+    """Render multiple burnins of same source using one FFMPEG process.
+
+    Source is decoded only once and each burnin is encoded to its output.
+    All burnins must be created for same source with same first frame.
+
+    Args:
+        burnins_outputs (list[tuple[ModifiedBurnins, str, str, dict]]):
+            Burnin, output path, additional FFMPEG arguments and burnin
+            data for each output.
+        overwrite (Optional[bool]): Overwrite outputs if already exist.
+        logger (Optional[logging.Logger]): Logger used for FFMPEG output,
+            output is printed if not passed.
+    """
+    if not burnins_outputs:
+        return
+
+    first_burnin = burnins_outputs[0][0]
+    command_parts = [first_burnin.input_command()]
+    for burnin, output, args, _ in burnins_outputs:
+        if (
+            burnin.source != first_burnin.source
+            or burnin.first_frame != first_burnin.first_frame
+        ):
+            raise ValueError(
+                "Burnins rendered at once must use same source."
+            )
+        burnin.validate_output(output, overwrite)
+        command_parts.append(
+            burnin.output_command(output, args, overwrite)
+        )
+
+    outputs = [item[1] for item in burnins_outputs]
+    try:
+        _run_command(
+            " ".join(command_parts).strip(), ", ".join(outputs), logger
+        )
+        for burnin, output, _, data in burnins_outputs:
+            burnin.validate_rendered_output(output, data.get("duration"))
+    finally:
+        for burnin, _, _, _ in burnins_outputs:
+            burnin.cleanup()
 
 
 def example(input_path, output_path):
@@ -644,6 +756,88 @@ def burnins_from_data(
     if full_input_path:
         ffprobe_data = _get_ffprobe_data(full_input_path)
 
+    burnin, ffmpeg_args_str = prepare_burnin(
+        input_path,
+        data,
+        codec_data=codec_data,
+        options=options,
+        burnin_values=burnin_values,
+        first_frame=first_frame,
+        source_ffmpeg_cmd=source_ffmpeg_cmd,
+        ffprobe_data=ffprobe_data
+    )
+    burnin.render(
+        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
+    )
+
+
+def burnins_from_data_multiple(
+    input_path, outputs, full_input_path=None, first_frame=None,
+    overwrite=True, logger=None
+):
+    """Add multiple burnins to video/image file with one FFMPEG process.
+
+    Source file is probed and decoded only once for all outputs.
+
+    Args:
+        input_path (str): Full path to input file where burnins should be add.
+        outputs (list[dict[str, Any]]): Output definitions. Each contains
+            "output" path, "burnin_data" and optionally "codec", "options",
+            "values" and "ffmpeg_cmd" (same meaning as arguments of
+            'burnins_from_data').
+        full_input_path (Optional[str]): Path to first input file used for
+            ffprobe.
+        first_frame (Optional[int]): First frame of input sequence.
+        overwrite (Optional[bool]): Outputs will be overwritten if already
+            exist, True by default.
+        logger (Optional[logging.Logger]): Logger used for FFMPEG output,
+            output is printed if not passed.
+    """
+    ffprobe_data = _get_ffprobe_data(full_input_path or input_path)
+
+    burnins_outputs = []
+    for output_data in outputs:
+        data = copy.deepcopy(output_data["burnin_data"])
+        burnin, ffmpeg_args_str = prepare_burnin(
+            input_path,
+            data,
+            codec_data=output_data.get("codec"),
+            options=output_data.get("options"),
+            burnin_values=output_data.get("values"),
+            first_frame=first_frame,
+            source_ffmpeg_cmd=output_data.get("ffmpeg_cmd"),
+            ffprobe_data=ffprobe_data
+        )
+        burnins_outputs.append(
+            (burnin, output_data["output"], ffmpeg_args_str, data)
+        )
+
+    render_burnins(burnins_outputs, overwrite=overwrite, logger=logger)
+
+
+def prepare_burnin(
+    input_path, data, codec_data=None, options=None, burnin_values=None,
+    first_frame=None, source_ffmpeg_cmd=None, ffprobe_data=None
+):
+    """Prepare burnin filters and FFMPEG output arguments.
+
+    Args:
+        input_path (str): Full path to input file where burnins should be add.
+        data (dict): Data required for burnin settings. Data are modified.
+        codec_data (Optional[list]): All codec related arguments in list.
+        options (Optional[dict]): Options for burnins.
+        burnin_values (Optional[dict]): Contain positioned values.
+        first_frame (Optional[int]): First frame of input sequence.
+        source_ffmpeg_cmd (Optional[str]): FFMPEG command used to create
+            source.
+        ffprobe_data (Optional[dict]): Ffprobe data of input.
+
+    Returns:
+        tuple[ModifiedBurnins, str]: Burnin object and FFMPEG arguments
+            for output.
+    """
+    # Make sure options from other burnins are not affected
+    options = copy.deepcopy(options)
     burnin = ModifiedBurnins(input_path, ffprobe_data, options, first_frame)
 
     frame_start = data.get("frame_start")
@@ -693,8 +887,7 @@ def burnins_from_data(
     if source_timecode is not None:
         data[SOURCE_TIMECODE_KEY[1:-1]] = SOURCE_TIMECODE_KEY
 
-    clean_up_paths = []
-    for align_text, value in burnin_values.items():
+    for align_text, value in (burnin_values or {}).items():
         if not value:
             continue
 
@@ -782,7 +975,7 @@ def burnins_from_data(
     ffmpeg_args = []
     if codec_data:
         # Use codec definition from method arguments
-        ffmpeg_args = codec_data
+        ffmpeg_args = list(codec_data)
         ffmpeg_args.append("-g 1")
 
     else:
@@ -804,12 +997,7 @@ def burnins_from_data(
                     ffmpeg_args.extend([arg, args[idx + 1]])
 
     # Use group one (same as `-intra` argument, which is deprecated)
-    ffmpeg_args_str = " ".join(ffmpeg_args)
-    burnin.render(
-        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
-    )
-    for path in clean_up_paths:
-        os.remove(path)
+    return burnin, " ".join(ffmpeg_args)
 
 
 if __name__ == "__main__":
@@ -818,6 +1006,16 @@ if __name__ == "__main__":
     with open(in_data_json_path, "r") as file_stream:
         in_data = json.load(file_stream)
 
+    if "outputs" in in_data:
+        burnins_from_data_multiple(
+            in_data["input"],
+            in_data["outputs"],
+            full_input_path=in_data.get("full_input_path"),
+            first_frame=in_data.get("first_frame"),
+        )
+        print("* Burnin script has finished")
+        sys.exit(0)
+
     burnins_from_data(
         in_data["input"],
         in_data["output"],
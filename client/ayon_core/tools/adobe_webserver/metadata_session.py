@@ -0,0 +1,250 @@
+"""Metadata of Adobe host documents used by websocket stubs.
+
+Adobe hosts store metadata of instances and containers as single json list
+in the active document. Session loads the list once, indexes items by ids
+and stores all changes with single call.
+"""
+import collections
+from abc import ABCMeta, abstractmethod
+
+import six
+
+
+@six.add_metaclass(ABCMeta)
+class BaseMetadataSession(object):
+    """Metadata of active document loaded once and indexed by item ids.
+
+    Changes are applied in memory and stored to the document with single
+    call on 'commit'. Session can be used as context manager which commits
+    changes on exit without exception.
+
+    Hosts implement how metadata and items of document are loaded and how
+    metadata are stored.
+
+    Args:
+        stub (Any): Host server stub used to read and store metadata.
+        items_meta (Optional[list[dict]]): Already loaded metadata, loaded
+            from document if not passed.
+        all_items (Optional[list[Any]]): Items of document used to remove
+            metadata of non-existing items on commit. Loaded on commit
+            if not passed.
+    """
+
+    def __init__(self, stub, items_meta=None, all_items=None):
+        self._stub = stub
+        if items_meta is None:
+            items_meta = self._load_items_meta()
+
+        self._all_items = all_items
+        self._items = []
+        self._indexes_by_member_id = collections.defaultdict(list)
+        self._indexes_by_instance_id = collections.defaultdict(list)
+        self._changed = False
+        self._validate_members = False
+        for item_meta in items_meta:
+            self._add_item(item_meta)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            self.commit()
+
+    @property
+    def changed(self):
+        return self._changed
+
+    @abstractmethod
+    def _load_items_meta(self):
+        """Load metadata of active document.
+
+        Returns:
+            list[dict]: Metadata items.
+        """
+
+        pass
+
+    @abstractmethod
+    def _load_all_items(self):
+        """Load items of active document which can have metadata.
+
+        Returns:
+            list[Any]: Document items with 'id' attribute.
+        """
+
+        pass
+
+    @abstractmethod
+    def _store_items(self, items):
+        """Store metadata to active document.
+
+        Args:
+            items (list[dict]): Metadata items to store.
+
+        Returns:
+            Any: Result of store call.
+        """
+
+        pass
+
+    def get_items(self):
+        """Current metadata items.
+
+        Returns:
+            list[dict]: Metadata items.
+        """
+
+        return [item for item in self._items if item is not None]
+
+    def read(self, item):
+        """Metadata of document item.
+
+        Args:
+            item (Any): Document item for which metadata are returned.
+
+        Returns:
+            Union[dict, None]: Item metadata or None if not found.
+        """
+
+        item_id = str(item.id)
+        for idx in self._indexes_by_member_id.get(item_id, []):
+            item_meta = self._items[idx]
+            if (
+                item_meta is not None
+                and self._is_readable(item_meta)
+                and self._get_member_id(item_meta) == item_id
+            ):
+                return item_meta
+        return None
+
+    def imprint(self, item_id, data):
+        """Update metadata of item or add new metadata.
+
+        Metadata of item are removed if 'data' are empty.
+
+        Args:
+            item_id (Union[int, str]): Document item id or instance id.
+            data (dict): Metadata to store.
+        """
+
+        item_id = str(item_id)
+        indexes = set(self._indexes_by_member_id.get(item_id, []))
+        indexes |= set(self._indexes_by_instance_id.get(item_id, []))
+        is_new = True
+        for idx in sorted(indexes):
+            item_meta = self._items[idx]
+            if item_meta is None or not self._is_item_match(
+                item_meta, item_id
+            ):
+                continue
+            is_new = False
+            if data:
+                item_meta.update(data)
+                self._index_item(idx, item_meta)
+            else:
+                self._items[idx] = None
+
+        if is_new and data:
+            self._add_item(data)
+
+        self._changed = True
+        self._validate_members = True
+
+    def remove_instance(self, instance_id):
+        """Remove metadata of instance.
+
+        Args:
+            instance_id (str): Instance id.
+        """
+
+        for idx in self._indexes_by_instance_id.get(str(instance_id), []):
+            item_meta = self._items[idx]
+            if (
+                item_meta is not None
+                and self._get_instance_id(item_meta) == instance_id
+            ):
+                self._items[idx] = None
+                self._changed = True
+
+    def commit(self):
+        """Store changed metadata to document with single call.
+
+        Returns:
+            Any: Result of store call, None if nothing changed.
+        """
+
+        if not self._changed:
+            return None
+
+        items = self.get_items()
+        # Ensure only valid ids are stored.
+        if self._validate_members:
+            if not self._all_items:
+                self._all_items = self._load_all_items()
+            item_ids = {str(int(item.id)) for item in self._all_items}
+            items = [
+                item
+                for item in items
+                if (
+                    not item.get("members")
+                    or str(int(item["members"][0])) in item_ids
+                )
+            ]
+
+        result = self._store_items(items)
+        self._changed = False
+        self._validate_members = False
+        return result
+
+    def _is_readable(self, item_meta):
+        """Metadata item can be returned by 'read'.
+
+        Args:
+            item_meta (dict): Metadata item.
+
+        Returns:
+            bool: Item can be returned.
+        """
+
+        return True
+
+    @staticmethod
+    def _get_member_id(item_meta):
+        members = item_meta.get("members")
+        if members:
+            return str(members[0])
+        return None
+
+    @staticmethod
+    def _get_instance_id(item_meta):
+        return item_meta.get("instance_id") or item_meta.get("uuid")
+
+    @staticmethod
+    def _is_item_match(item_meta, item_id):
+        members = item_meta.get("members")
+        if members and str(members[0]) == item_id:
+            return True
+        instance_id = item_meta.get("instance_id")
+        return instance_id is not None and str(instance_id) == item_id
+
+    def _add_item(self, item_meta):
+        idx = len(self._items)
+        self._items.append(item_meta)
+        self._index_item(idx, item_meta)
+
+    def _index_item(self, idx, item_meta):
+        # Indexes can contain outdated keys, matching is always validated
+        keys_by_index = (
+            (self._indexes_by_member_id, self._get_member_id(item_meta)),
+            (
+                self._indexes_by_instance_id,
+                self._get_instance_id(item_meta)
+            ),
+        )
+        for indexes, key in keys_by_index:
+            if key is None:
+                continue
+            key_indexes = indexes[str(key)]
+            if idx not in key_indexes:
+                key_indexes.append(idx)
@@ -37,7 +37,13 @@ from ayon_core.pipeline.create.context import (
     CreatorsOperationFailed,
     ConvertorsOperationFailed,
 )
-from ayon_core.pipeline.publish import get_publish_instance_label
+from ayon_core.pipeline.publish import (
+    get_publish_instance_label,
+    is_parallel_validation_enabled,
+    is_plugin_executable_in_thread,
+    InstancesThreadsProcess,
+    process_plugin_with_profile,
+)
 from ayon_core.tools.common_models import HierarchyModel
 
 # Define constant for plugin orders offset
@@ -155,7 +161,8 @@ class PublishReportMaker:
         self._current_plugin_data["instances_data"].append({
             "id": instance_id,
             "logs": self._extract_instance_log_items(result),
-            "process_time": result["duration"]
+            "process_time": result["duration"],
+            "profile": result.get("profile"),
         })
 
     def add_action_result(self, action, result):
@@ -230,7 +237,7 @@ class PublishReportMaker:
             "crashed_file_paths": crashed_file_paths,
             "id": uuid.uuid4().hex,
             "created_at": now.isoformat(),
-            "report_version": "1.0.1",
+            "report_version": "1.0.2",
         }
 
     def _extract_context_data(self, context):
@@ -1589,6 +1596,9 @@ class PublisherController(BasePublisherController):
     """
 
     _log = None
+    # Seconds to wait for result of instance processed in thread in one
+    #   main thread item, wait until result is available if 'None'
+    threads_result_timeout = None
 
     def __init__(self, headless=False):
         super(PublisherController, self).__init__()
@@ -1611,6 +1621,10 @@ class PublisherController(BasePublisherController):
 
         # Publishing should stop at validation stage
         self._publish_up_validation = False
+        # Thread safe validators process instances in parallel
+        self._publish_parallel_validation = False
+        # Instances of plugin processed in threads
+        self._publish_threads_process = None
         # This information is not much important for controller but for widget
         #   which can change (and set) the comment.
         self._publish_comment_is_set = False
@@ -2198,8 +2212,13 @@ class PublisherController(BasePublisherController):
     def _reset_publish(self):
         self._reset_attributes()
 
+        if self._publish_threads_process is not None:
+            self._publish_threads_process.stop()
+            self._publish_threads_process = None
+
         self._publish_up_validation = False
         self._publish_comment_is_set = False
+        self._publish_parallel_validation = is_parallel_validation_enabled()
 
         self._main_thread_iter = self._publish_iterator()
         self._publish_context = pyblish.api.Context()
@@ -2428,10 +2447,33 @@ class PublisherController(BasePublisherController):
                     self._publish_report.set_plugin_skipped()
                     continue
 
-                for instance in instances:
-                    if instance.data.get("publish") is False:
-                        continue
+                instances = [
+                    instance
+                    for instance in instances
+                    if instance.data.get("publish") is not False
+                ]
+                if (
+                    self._publish_parallel_validation
+                    and len(instances) > 1
+                    and is_plugin_executable_in_thread(plugin)
+                ):
+                    threads_process = InstancesThreadsProcess(
+                        plugin, self._publish_context, instances
+                    )
+                    self._publish_threads_process = threads_process
+                    threads_process.start()
+                    # Results are processed one by one in main thread, so
+                    #   UI is updated and publishing can be stopped between
+                    #   them
+                    while not threads_process.is_finished:
+                        yield MainThreadItem(
+                            self._process_thread_result_and_continue,
+                            threads_process
+                        )
+                    self._publish_threads_process = None
+                    continue
 
+                for instance in instances:
                     instance_label = (
                         instance.data.get("label")
                         or instance.data["name"]
@@ -2481,10 +2523,38 @@ class PublisherController(BasePublisherController):
         )
 
     def _process_and_continue(self, plugin, instance):
-        result = pyblish.plugin.process(
+        result = process_plugin_with_profile(
             plugin, self._publish_context, instance
         )
+        self._process_result(result)
+
+        self._publish_next_process()
+
+    def _process_thread_result_and_continue(self, threads_process):
+        # Publishing was stopped before the item was processed
+        if not self.publish_is_running:
+            return
 
+        instance = threads_process.get_next_instance()
+        if instance is not None:
+            instance_label = (
+                instance.data.get("label")
+                or instance.data["name"]
+            )
+            self._emit_event(
+                "publish.process.instance.changed",
+                {"instance_label": instance_label}
+            )
+
+        result = threads_process.process_next_result(
+            self.threads_result_timeout
+        )
+        if result is not None:
+            self._process_result(result)
+
+        self._publish_next_process()
+
+    def _process_result(self, result):
         exception = result.get("error")
         if exception:
             has_validation_error = False
@@ -2510,8 +2580,6 @@ class PublisherController(BasePublisherController):
 
         self._publish_report.add_result(result)
 
-        self._publish_next_process()
-
 
 def collect_families_from_instances(instances, only_active=False):
     """Collect all families for passed publish instances.
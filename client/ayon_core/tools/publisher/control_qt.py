@@ -70,6 +70,9 @@ class MainThreadProcess(QtCore.QObject):
 
 
 class QtPublisherController(PublisherController):
+    # Don't block UI while waiting for results of threads
+    threads_result_timeout = 0.05
+
     def __init__(self, *args, **kwargs):
         self._main_thread_processor = MainThreadProcess()
 
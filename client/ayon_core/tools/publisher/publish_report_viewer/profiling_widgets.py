@@ -0,0 +1,259 @@
+from qtpy import QtWidgets, QtCore, QtGui
+
+SORT_VALUE_ROLE = QtCore.Qt.UserRole + 1
+
+STAGE_COLORS = {
+    "collect": QtGui.QColor(86, 152, 214),
+    "validate": QtGui.QColor(230, 168, 66),
+    "extract": QtGui.QColor(111, 186, 96),
+    "integrate": QtGui.QColor(190, 103, 209),
+    "other": QtGui.QColor(150, 150, 150),
+}
+
+
+def _format_time(value):
+    if value is None:
+        return "-"
+    return "{:.1f}".format(value)
+
+
+def _format_memory(value):
+    if value is None:
+        return "-"
+    return "{:.1f}".format(value / (1024 * 1024))
+
+
+class ProfileTableModel(QtGui.QStandardItemModel):
+    columns = (
+        ("Plugin", "plugin_label", None),
+        ("Instance", "instance_label", None),
+        ("Stage", "stage", None),
+        ("Wall (ms)", "wall_time", _format_time),
+        ("CPU (ms)", "cpu_time", _format_time),
+        ("Subprocess (ms)", "subprocess_time", _format_time),
+        ("Peak RSS (MB)", "peak_rss", _format_memory),
+        ("RSS increase (MB)", "peak_rss_increase", _format_memory),
+    )
+
+    def __init__(self, *args, **kwargs):
+        super(ProfileTableModel, self).__init__(*args, **kwargs)
+        self.setHorizontalHeaderLabels(
+            [label for label, _, _ in self.columns]
+        )
+
+    def set_report(self, report):
+        root_item = self.invisibleRootItem()
+        root_item.removeRows(0, root_item.rowCount())
+        if report is None:
+            return
+
+        for profile_item in report.profile_items:
+            row_items = []
+            for _, key, formatter in self.columns:
+                value = profile_item.get(key)
+                text = value
+                if formatter is not None:
+                    text = formatter(value)
+                item = QtGui.QStandardItem(str(text))
+                item.setEditable(False)
+                sort_value = value
+                if sort_value is None:
+                    sort_value = -1 if formatter is not None else ""
+                item.setData(sort_value, SORT_VALUE_ROLE)
+                row_items.append(item)
+            root_item.appendRow(row_items)
+
+
+class ProfileTimelineWidget(QtWidgets.QWidget):
+    """Bars of processed plugins on timeline, one lane per thread."""
+
+    lane_height = 22
+    min_zoom = 1.0
+    max_zoom = 200.0
+
+    def __init__(self, parent):
+        super(ProfileTimelineWidget, self).__init__(parent)
+        self.setMouseTracking(True)
+
+        self._profile_items = []
+        self._lane_by_thread_id = {}
+        self._start = 0.0
+        self._duration = 0.0
+        self._zoom = 1.0
+        self._base_width = 0
+
+    def set_report(self, report):
+        profile_items = []
+        if report is not None:
+            profile_items = report.profile_items
+
+        lane_by_thread_id = {}
+        start = end = 0.0
+        if profile_items:
+            start = min(item["start"] for item in profile_items)
+            end = max(
+                item["start"] + (item["wall_time"] / 1000)
+                for item in profile_items
+            )
+        for item in profile_items:
+            thread_id = item.get("thread_id")
+            if thread_id not in lane_by_thread_id:
+                lane_by_thread_id[thread_id] = len(lane_by_thread_id)
+
+        self._profile_items = profile_items
+        self._lane_by_thread_id = lane_by_thread_id
+        self._start = start
+        self._duration = end - start
+        self._zoom = 1.0
+        self._update_size()
+
+    def set_base_width(self, width):
+        self._base_width = width
+        self._update_size()
+
+    def _update_size(self):
+        lanes = max(1, len(self._lane_by_thread_id))
+        self.setMinimumHeight(lanes * self.lane_height)
+        self.setMinimumWidth(int(self._base_width * self._zoom))
+        self.update()
+
+    def _get_item_rect(self, item):
+        width = self.width()
+        if self._duration <= 0:
+            return QtCore.QRectF()
+        x = (item["start"] - self._start) / self._duration * width
+        item_width = max(
+            1.0, (item["wall_time"] / 1000) / self._duration * width
+        )
+        lane = self._lane_by_thread_id[item.get("thread_id")]
+        return QtCore.QRectF(
+            x, lane * self.lane_height, item_width, self.lane_height - 2
+        )
+
+    def _get_item_at(self, pos):
+        for item in self._profile_items:
+            if self._get_item_rect(item).contains(QtCore.QPointF(pos)):
+                return item
+        return None
+
+    def event(self, event):
+        if event.type() == QtCore.QEvent.ToolTip:
+            item = self._get_item_at(event.pos())
+            if item is None:
+                QtWidgets.QToolTip.hideText()
+            else:
+                QtWidgets.QToolTip.showText(
+                    event.globalPos(),
+                    (
+                        "<b>{}</b><br/>{}<br/>Wall: {} ms<br/>CPU: {} ms"
+                        "<br/>Subprocess: {} ms<br/>Peak RSS: {} MB"
+                    ).format(
+                        item["plugin_label"],
+                        item["instance_label"],
+                        _format_time(item["wall_time"]),
+                        _format_time(item["cpu_time"]),
+                        _format_time(item["subprocess_time"]),
+                        _format_memory(item["peak_rss"]),
+                    ),
+                    self
+                )
+            return True
+        return super(ProfileTimelineWidget, self).event(event)
+
+    def wheelEvent(self, event):
+        if not event.modifiers() & QtCore.Qt.ControlModifier:
+            super(ProfileTimelineWidget, self).wheelEvent(event)
+            return
+
+        if event.angleDelta().y() > 0:
+            zoom = self._zoom * 1.25
+        else:
+            zoom = self._zoom / 1.25
+        self._zoom = min(self.max_zoom, max(self.min_zoom, zoom))
+        self._update_size()
+        event.accept()
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        visible_rect = QtCore.QRectF(event.rect())
+        text_color = self.palette().color(QtGui.QPalette.Text)
+        for item in self._profile_items:
+            rect = self._get_item_rect(item)
+            if not rect.intersects(visible_rect):
+                continue
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.setBrush(
+                STAGE_COLORS.get(item["stage"], STAGE_COLORS["other"])
+            )
+            painter.drawRect(rect)
+            if rect.width() > 30:
+                painter.setPen(text_color)
+                painter.drawText(
+                    rect.adjusted(3, 0, -3, 0),
+                    QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft,
+                    item["plugin_label"]
+                )
+        painter.end()
+
+
+class ProfileTimelineScrollArea(QtWidgets.QScrollArea):
+    def __init__(self, parent):
+        super(ProfileTimelineScrollArea, self).__init__(parent)
+        self.setWidgetResizable(True)
+        timeline_widget = ProfileTimelineWidget(self)
+        self.setWidget(timeline_widget)
+        self._timeline_widget = timeline_widget
+
+    def set_report(self, report):
+        self._timeline_widget.set_report(report)
+        self._timeline_widget.set_base_width(self.viewport().width())
+
+    def resizeEvent(self, event):
+        super(ProfileTimelineScrollArea, self).resizeEvent(event)
+        self._timeline_widget.set_base_width(self.viewport().width())
+
+
+class ProfilingWidget(QtWidgets.QWidget):
+    """Timing profile of processed plugins.
+
+    Timeline can be zoomed with mouse wheel while 'Ctrl' is pressed.
+    """
+
+    def __init__(self, parent):
+        super(ProfilingWidget, self).__init__(parent)
+
+        splitter = QtWidgets.QSplitter(QtCore.Qt.Vertical, self)
+
+        timeline_widget = ProfileTimelineScrollArea(splitter)
+
+        model = ProfileTableModel()
+        proxy_model = QtCore.QSortFilterProxyModel()
+        proxy_model.setSourceModel(model)
+        proxy_model.setSortRole(SORT_VALUE_ROLE)
+
+        view = QtWidgets.QTreeView(splitter)
+        view.setModel(proxy_model)
+        view.setRootIsDecorated(False)
+        view.setAlternatingRowColors(True)
+        view.setSortingEnabled(True)
+        view.sortByColumn(3, QtCore.Qt.DescendingOrder)
+
+        splitter.addWidget(timeline_widget)
+        splitter.addWidget(view)
+        splitter.setStretchFactor(0, 1)
+        splitter.setStretchFactor(1, 2)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(splitter, 1)
+
+        self._timeline_widget = timeline_widget
+        self._model = model
+        self._proxy_model = proxy_model
+        self._view = view
+
+    def set_report(self, report):
+        self._model.set_report(report)
+        self._timeline_widget.set_report(report)
+        self._view.resizeColumnToContents(0)
@@ -2,6 +2,8 @@ import uuid
 import collections
 import copy
 
+from ayon_core.pipeline.publish.profiling import get_report_profile_items
+
 
 class PluginItem:
     def __init__(self, plugin_data):
@@ -128,5 +130,6 @@ class PublishReport:
         self.plugins_items_by_id = plugins_items_by_id
 
         self.logs = logs
+        self.profile_items = get_report_profile_items(data)
 
         self.crashed_plugin_paths = report_data["crashed_file_paths"]
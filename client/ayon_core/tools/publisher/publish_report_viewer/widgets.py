@@ -16,6 +16,7 @@ from .model import (
     PluginProxyModel
 )
 from .report_items import PublishReport
+from .profiling_widgets import ProfilingWidget
 
 FILEPATH_ROLE = QtCore.Qt.UserRole + 1
 TRACEBACK_ROLE = QtCore.Qt.UserRole + 2
@@ -421,9 +422,11 @@ class PublishReportViewerWidget(QtWidgets.QFrame):
 
         logs_text_widget = DetailsWidget(details_tab_widget)
         plugin_load_report_widget = PluginLoadReportWidget(details_tab_widget)
+        profiling_widget = ProfilingWidget(details_tab_widget)
 
         details_tab_widget.addTab(logs_text_widget, "Logs")
         details_tab_widget.addTab(plugin_load_report_widget, "Crashed plugins")
+        details_tab_widget.addTab(profiling_widget, "Profiling")
 
         middle_widget = QtWidgets.QWidget(self)
         middle_layout = QtWidgets.QGridLayout(middle_widget)
@@ -462,6 +465,7 @@ class PublishReportViewerWidget(QtWidgets.QFrame):
         self._report_item = None
         self._logs_text_widget = logs_text_widget
         self._plugin_load_report_widget = plugin_load_report_widget
+        self._profiling_widget = profiling_widget
 
         self._removed_instances_check = removed_instances_check
         self._instances_view = instances_view
@@ -511,6 +515,7 @@ class PublishReportViewerWidget(QtWidgets.QFrame):
         self._plugins_model.set_report(report)
         self._logs_text_widget.set_report(report)
         self._plugin_load_report_widget.set_report(report)
+        self._profiling_widget.set_report(report)
 
         self._ignore_selection_changes = False
 
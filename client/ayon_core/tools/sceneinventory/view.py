@@ -1,7 +1,7 @@
 import uuid
 import collections
 import logging
-import itertools
+import traceback
 from functools import partial
 
 import ayon_api
@@ -11,7 +11,7 @@ import qtawesome
 from ayon_core import style
 from ayon_core.pipeline import (
     HeroVersionType,
-    update_container,
+    update_containers,
     remove_container,
     discover_inventory_actions,
 )
@@ -810,19 +810,78 @@ class SceneInventoryView(QtWidgets.QTreeView):
                 "Number of items mismatches number of versions: "
                 "{} items - {} versions".format(len(items), len(version))
             )
-            versions = version
+            versions = list(version)
         else:
-            # Repeat the same version infinitely
-            versions = itertools.repeat(version)
+            versions = [version] * len(items)
 
         # Trigger update to latest
         try:
-            for item, item_version in zip(items, versions):
-                try:
-                    update_container(item, item_version)
-                except AssertionError:
-                    self._show_version_error_dialog(item_version, [item])
-                    log.warning("Update failed", exc_info=True)
+            results = update_containers(
+                items, versions, raise_on_error=False
+            )
         finally:
             # Always update the scene inventory view, even if errors occurred
             self.data_changed.emit()
+
+        # Show dialog only for items which failed, per requested version
+        failed_groups = []
+        errors = []
+        for item, item_version, result in zip(items, versions, results):
+            if not isinstance(result, Exception):
+                continue
+
+            if not isinstance(result, AssertionError):
+                log.error(
+                    "Update of container '{}' failed".format(
+                        item.get("objectName")
+                    ),
+                    exc_info=result
+                )
+                errors.append((item, result))
+                continue
+
+            log.warning("Update failed", exc_info=result)
+            for group_version, group_items in failed_groups:
+                if group_version == item_version:
+                    group_items.append(item)
+                    break
+            else:
+                failed_groups.append((item_version, [item]))
+
+        for group_version, group_items in failed_groups:
+            self._show_version_error_dialog(group_version, group_items)
+
+        if errors:
+            self._show_update_errors_dialog(errors)
+
+    def _show_update_errors_dialog(self, errors):
+        """Show errors of containers which failed to update.
+
+        Args:
+            errors (list[tuple[dict, Exception]]): Container items with
+                error which happened during their update.
+        """
+        lines = []
+        details = []
+        for item, error in errors:
+            name = item.get("objectName") or item.get("name") or "<unknown>"
+            lines.append("- {}: {}".format(name, error))
+            details.append("{}\n{}".format(
+                name,
+                "".join(traceback.format_exception(
+                    type(error), error, error.__traceback__
+                ))
+            ))
+
+        dialog = QtWidgets.QMessageBox(self)
+        dialog.setIcon(QtWidgets.QMessageBox.Critical)
+        dialog.setStyleSheet(style.load_stylesheet())
+        dialog.setWindowTitle("Update failed")
+        dialog.setText(
+            "Failed to update {} container(s):\n\n{}".format(
+                len(errors), "\n".join(lines)
+            )
+        )
+        dialog.setDetailedText("\n".join(details))
+        dialog.addButton(QtWidgets.QMessageBox.Ok)
+        dialog.exec_()
@@ -317,6 +317,8 @@ class BaseWorkfileController(
         return self._selection_model.get_selected_folder_id()
 
     def set_selected_folder(self, folder_id):
+        if folder_id:
+            self._workfiles_model.prefetch_folders([folder_id])
         self._selection_model.set_selected_folder(folder_id)
 
     def get_selected_task_id(self):
@@ -486,6 +488,7 @@ class BaseWorkfileController(
 
         self._projects_model.reset()
         self._hierarchy_model.reset()
+        self._workfiles_model.reset()
 
         if not expected_folder_id:
             expected_folder_id = folder_id
@@ -1,6 +1,8 @@
 import os
 import re
 import copy
+import logging
+import threading
 
 import arrow
 import ayon_api
@@ -15,14 +17,20 @@ from ayon_core.pipeline.workfile import (
     get_workdir_with_workdir_data,
     get_workfile_template_key,
     get_last_workfile_with_version,
+    get_workdir_filenames,
+    get_workdir_file_items,
+    clear_workdir_listing_cache,
 )
 from ayon_core.pipeline.version_start import get_versioning_start
+from ayon_core.tools.common_models import NestedCacheItem
 from ayon_core.tools.workfiles.abstract import (
     WorkareaFilepathResult,
     FileItem,
     WorkfileInfo,
 )
 
+log = logging.getLogger(__name__)
+
 
 class CommentMatcher(object):
     """Use anatomy and work file data to parse comments from filenames.
@@ -106,6 +114,8 @@ class WorkareaModel:
         self._base_data = None
         self._fill_data_by_folder_id = {}
         self._task_data_by_folder_id = {}
+        self._workdir_by_context = {}
+        clear_workdir_listing_cache()
 
     def _get_base_data(self):
         if self._base_data is None:
@@ -176,21 +186,9 @@ class WorkareaModel:
             return items
 
         workdir = self.get_workarea_dir_by_context(folder_id, task_id)
-        if not os.path.exists(workdir):
-            return items
-
-        for filename in os.listdir(workdir):
-            filepath = os.path.join(workdir, filename)
-            if not os.path.isfile(filepath):
-                continue
-
-            ext = os.path.splitext(filename)[1].lower()
-            if ext not in self._extensions:
-                continue
-
-            modified = os.path.getmtime(filepath)
+        for file_item in get_workdir_file_items(workdir, self._extensions):
             items.append(
-                FileItem(workdir, filename, modified)
+                FileItem(workdir, file_item.filename, file_item.modified)
             )
         return items
 
@@ -264,12 +262,8 @@ class WorkareaModel:
         """
         current_comment = None
         filenames = []
-        if root and os.path.exists(root):
-            for filename in os.listdir(root):
-                path = os.path.join(root, filename)
-                if not os.path.isfile(path):
-                    continue
-
+        if root:
+            for filename in get_workdir_filenames(root):
                 ext = os.path.splitext(filename)[-1].lower()
                 if ext in extensions:
                     filenames.append(filename)
@@ -435,15 +429,96 @@ class WorkfileEntitiesModel:
         control (AbstractWorkfileController): Controller object.
     """
 
-    def __init__(self, controller):
+    cache_lifetime = 60
+
+    def __init__(self, controller, refresher):
         self._controller = controller
-        self._cache = {}
+        self._refresher = refresher
+        self._lock = threading.Lock()
+        # Workfile infos by rootless path for each task of project
+        self._cache = NestedCacheItem(
+            levels=2,
+            lifetime=self.cache_lifetime
+        )
+        # Changed on reset and local change of cache, results of queries
+        #   started before the change are outdated
+        self._cache_generation = 0
         self._items = {}
 
+    def reset(self):
+        with self._lock:
+            self._cache.reset()
+            self._cache_generation += 1
+            self._items = {}
+
     def _get_workfile_info_identifier(
         self, folder_id, task_id, rootless_path
     ):
-        return "_".join([folder_id, task_id, rootless_path])
+        return (task_id, rootless_path)
+
+    def refresh_workfile_infos(self, project_name, task_ids, force=False):
+        """Query workfile infos of multiple tasks at once.
+
+        Args:
+            project_name (str): Project name.
+            task_ids (Iterable[str]): Task ids.
+            force (Optional[bool]): Query also tasks with valid cache.
+        """
+
+        task_ids = set(task_ids)
+        with self._lock:
+            generation = self._cache_generation
+            if not force:
+                project_cache = self._cache[project_name]
+                task_ids = {
+                    task_id
+                    for task_id in task_ids
+                    if not project_cache[task_id].is_valid
+                }
+        if not task_ids:
+            return
+
+        infos_by_task_id = {task_id: {} for task_id in task_ids}
+        for workfile_info in ayon_api.get_workfiles_info(
+            project_name,
+            task_ids=task_ids,
+            fields=["id", "path", "attrib", "taskId"],
+        ):
+            task_infos = infos_by_task_id.get(workfile_info["taskId"])
+            if task_infos is not None:
+                task_infos[workfile_info["path"]] = workfile_info
+
+        with self._lock:
+            if generation != self._cache_generation:
+                return
+            project_cache = self._cache[project_name]
+            for task_id, task_infos in infos_by_task_id.items():
+                project_cache[task_id] = task_infos
+            # Items with notes have to be recreated
+            for identifier in tuple(self._items):
+                if identifier[0] in infos_by_task_id:
+                    self._items.pop(identifier)
+
+    def _get_task_workfile_infos(self, project_name, task_id):
+        with self._lock:
+            cache = self._cache[project_name][task_id]
+            task_infos = cache.get_data()
+            is_valid = cache.is_valid
+
+        if task_infos is None:
+            self.refresh_workfile_infos(project_name, [task_id], force=True)
+            with self._lock:
+                task_infos = self._cache[project_name][task_id].get_data()
+
+        elif not is_valid:
+            # Use outdated data and refresh them in background
+            self._refresher.refresh(
+                ("workfile_infos", project_name, task_id),
+                self.refresh_workfile_infos,
+                project_name,
+                [task_id],
+            )
+        return task_infos or {}
 
     def _get_rootless_path(self, filepath):
         anatomy = self._controller.project_anatomy
@@ -474,20 +549,20 @@ class WorkfileEntitiesModel:
         )
 
     def _get_workfile_info(self, folder_id, task_id, identifier):
-        workfile_info = self._cache.get(identifier)
-        if workfile_info is not None:
-            return workfile_info
+        task_infos = self._get_task_workfile_infos(
+            self._controller.get_current_project_name(), task_id
+        )
+        return task_infos.get(identifier[1])
 
-        for workfile_info in ayon_api.get_workfiles_info(
-            self._controller.get_current_project_name(),
-            task_ids=[task_id],
-            fields=["id", "path", "attrib"],
-        ):
-            workfile_identifier = self._get_workfile_info_identifier(
-                folder_id, task_id, workfile_info["path"]
-            )
-            self._cache[workfile_identifier] = workfile_info
-        return self._cache.get(identifier)
+    def _set_workfile_info(self, task_id, rootless_path, workfile_info):
+        project_name = self._controller.get_current_project_name()
+        with self._lock:
+            cache = self._cache[project_name][task_id]
+            task_infos = dict(cache.get_data() or {})
+            task_infos[rootless_path] = workfile_info
+            cache.update_data(task_infos)
+            self._cache_generation += 1
+            self._items.pop((task_id, rootless_path), None)
 
     def get_workfile_info(
         self, folder_id, task_id, filepath, rootless_path=None
@@ -520,9 +595,13 @@ class WorkfileEntitiesModel:
             folder_id, task_id, identifier
         )
         if not workfile_info:
-            self._cache[identifier] = self._create_workfile_info_entity(
-                task_id, rootless_path, note or "")
-            self._items.pop(identifier, None)
+            self._set_workfile_info(
+                task_id,
+                rootless_path,
+                self._create_workfile_info_entity(
+                    task_id, rootless_path, note or ""
+                )
+            )
             return
 
         if note is None:
@@ -533,8 +612,7 @@ class WorkfileEntitiesModel:
         new_workfile_info = copy.deepcopy(workfile_info)
         attrib = new_workfile_info.setdefault("attrib", {})
         attrib["description"] = note
-        self._cache[identifier] = new_workfile_info
-        self._items.pop(identifier, None)
+        self._set_workfile_info(task_id, rootless_path, new_workfile_info)
         if old_note == note:
             return
 
@@ -572,16 +650,30 @@ class WorkfileEntitiesModel:
 class PublishWorkfilesModel:
     """Model for handling of published workfiles.
 
-    Todos:
-        Cache workfiles products and representations for some time.
-            Note Representations won't change. Only what can change are
-                versions.
+    Representations of workfile products are cached per folder for some
+    time. Outdated cache is used and refreshed in background.
     """
 
-    def __init__(self, controller):
+    cache_lifetime = 60
+
+    def __init__(self, controller, refresher):
         self._controller = controller
+        self._refresher = refresher
         self._cached_extensions = None
         self._cached_repre_extensions = None
+        self._lock = threading.Lock()
+        # Workfile representations for each folder of project
+        self._repres_cache = NestedCacheItem(
+            levels=2,
+            lifetime=self.cache_lifetime
+        )
+        # Changed on reset, results of queries started before are outdated
+        self._cache_generation = 0
+
+    def reset(self):
+        with self._lock:
+            self._repres_cache.reset()
+            self._cache_generation += 1
 
     @property
     def _extensions(self):
@@ -637,38 +729,92 @@ class PublishWorkfilesModel:
             repre_entity["id"]
         )
 
-    def get_file_items(self, folder_id, task_name):
-        # TODO refactor to use less server API calls
-        project_name = self._controller.get_current_project_name()
-        # Get subset docs of folder
-        product_entities = ayon_api.get_products(
-            project_name,
-            folder_ids=[folder_id],
-            product_types=["workfile"],
-            fields=["id", "name"]
-        )
+    def refresh_representations(self, project_name, folder_ids, force=False):
+        """Query workfile representations of multiple folders at once.
 
-        output = []
-        product_ids = {product["id"] for product in product_entities}
-        if not product_ids:
-            return output
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+            force (Optional[bool]): Query also folders with valid cache.
+        """
 
-        # Get version docs of products with their families
-        version_entities = ayon_api.get_versions(
-            project_name,
-            product_ids=product_ids,
-            fields=["id", "productId"]
-        )
-        version_ids = {version["id"] for version in version_entities}
-        if not version_ids:
-            return output
+        folder_ids = set(folder_ids)
+        with self._lock:
+            generation = self._cache_generation
+            if not force:
+                project_cache = self._repres_cache[project_name]
+                folder_ids = {
+                    folder_id
+                    for folder_id in folder_ids
+                    if not project_cache[folder_id].is_valid
+                }
+        if not folder_ids:
+            return
 
-        # Query representations of filtered versions and add filter for
-        #   extension
-        repre_entities = ayon_api.get_representations(
-            project_name,
-            version_ids=version_ids
-        )
+        repres_by_folder_id = {folder_id: [] for folder_id in folder_ids}
+        folder_id_by_product_id = {
+            product["id"]: product["folderId"]
+            for product in ayon_api.get_products(
+                project_name,
+                folder_ids=folder_ids,
+                product_types=["workfile"],
+                fields=["id", "folderId"]
+            )
+        }
+        folder_id_by_version_id = {}
+        if folder_id_by_product_id:
+            folder_id_by_version_id = {
+                version["id"]: folder_id_by_product_id[version["productId"]]
+                for version in ayon_api.get_versions(
+                    project_name,
+                    product_ids=folder_id_by_product_id.keys(),
+                    fields=["id", "productId"]
+                )
+            }
+
+        if folder_id_by_version_id:
+            for repre_entity in ayon_api.get_representations(
+                project_name,
+                version_ids=folder_id_by_version_id.keys()
+            ):
+                folder_id = folder_id_by_version_id[repre_entity["versionId"]]
+                repres_by_folder_id[folder_id].append(repre_entity)
+
+        with self._lock:
+            if generation != self._cache_generation:
+                return
+            project_cache = self._repres_cache[project_name]
+            for folder_id, repre_entities in repres_by_folder_id.items():
+                project_cache[folder_id] = repre_entities
+
+    def _get_repre_entities(self, project_name, folder_id):
+        with self._lock:
+            cache = self._repres_cache[project_name][folder_id]
+            repre_entities = cache.get_data()
+            is_valid = cache.is_valid
+
+        if repre_entities is None:
+            self.refresh_representations(
+                project_name, [folder_id], force=True
+            )
+            with self._lock:
+                repre_entities = (
+                    self._repres_cache[project_name][folder_id].get_data()
+                )
+
+        elif not is_valid:
+            # Use outdated data and refresh them in background
+            self._refresher.refresh(
+                ("representations", project_name, folder_id),
+                self.refresh_representations,
+                project_name,
+                [folder_id],
+            )
+        return repre_entities or []
+
+    def get_file_items(self, folder_id, task_name):
+        project_name = self._controller.get_current_project_name()
+        repre_entities = self._get_repre_entities(project_name, folder_id)
         project_anatomy = self._controller.project_anatomy
 
         # Filter queried representations by task name if task is set
@@ -683,15 +829,90 @@ class PublishWorkfilesModel:
         return file_items
 
 
+class _BackgroundRefresher:
+    """Run refresh functions in background threads.
+
+    Function with same key is not started again until it finishes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running_keys = set()
+
+    def refresh(self, key, func, *args, **kwargs):
+        with self._lock:
+            if key in self._running_keys:
+                return
+            self._running_keys.add(key)
+
+        thread = threading.Thread(
+            target=self._run, args=(key, func, args, kwargs)
+        )
+        thread.daemon = True
+        thread.start()
+
+    def _run(self, key, func, args, kwargs):
+        try:
+            func(*args, **kwargs)
+        except Exception:
+            log.warning("Background refresh failed", exc_info=True)
+        finally:
+            with self._lock:
+                self._running_keys.discard(key)
+
+
 class WorkfilesModel:
     """Workfiles model."""
 
     def __init__(self, controller):
         self._controller = controller
 
-        self._entities_model = WorkfileEntitiesModel(controller)
+        self._refresher = _BackgroundRefresher()
+        self._entities_model = WorkfileEntitiesModel(
+            controller, self._refresher
+        )
         self._workarea_model = WorkareaModel(controller)
-        self._published_model = PublishWorkfilesModel(controller)
+        self._published_model = PublishWorkfilesModel(
+            controller, self._refresher
+        )
+
+    def reset(self):
+        self._workarea_model.reset()
+        self._entities_model.reset()
+        self._published_model.reset()
+
+    def prefetch_folders(self, folder_ids):
+        """Load workfile data of folders and their tasks in background.
+
+        Workfile infos of all tasks and published workfiles are queried
+        with batched requests, so selection of task is instant.
+
+        Args:
+            folder_ids (Iterable[str]): Folder ids.
+        """
+
+        folder_ids = {folder_id for folder_id in folder_ids if folder_id}
+        if not folder_ids:
+            return
+        project_name = self._controller.get_current_project_name()
+        self._refresher.refresh(
+            ("prefetch", project_name, tuple(sorted(folder_ids))),
+            self._prefetch_folders,
+            project_name,
+            folder_ids,
+        )
+
+    def _prefetch_folders(self, project_name, folder_ids):
+        task_ids = {
+            task["id"]
+            for task in ayon_api.get_tasks(
+                project_name, folder_ids=folder_ids, fields=["id"]
+            )
+        }
+        self._entities_model.refresh_workfile_infos(project_name, task_ids)
+        self._published_model.refresh_representations(
+            project_name, folder_ids
+        )
 
     def get_workfile_info(self, folder_id, task_id, filepath):
         return self._entities_model.get_workfile_info(
@@ -209,6 +209,13 @@ class HarmonySubmitDeadlineModel(BaseSettingsModel):
     chunk_size: int = SettingsField(title="Chunk Size")
     group: str = SettingsField(title="Group")
     department: str = SettingsField(title="Department")
+    batch_submission: bool = SettingsField(
+        title="Batch submission",
+        description=(
+            "Jobs are submitted together with jobs of other instances"
+            " after all instances are processed."
+        )
+    )
 
 
 class HoudiniSubmitDeadlineModel(BaseSettingsModel):
@@ -224,6 +231,13 @@ class HoudiniSubmitDeadlineModel(BaseSettingsModel):
     export_priority: int = SettingsField(title="Export Priority")
     export_chunk_size: int = SettingsField(title="Export Chunk Size")
     export_group: str = SettingsField(title="Export Group")
+    batch_submission: bool = SettingsField(
+        title="Batch submission",
+        description=(
+            "Jobs are submitted together with jobs of other instances"
+            " after all instances are processed."
+        )
+    )
 
 
 class HoudiniCacheSubmitDeadlineModel(BaseSettingsModel):
@@ -235,6 +249,13 @@ class HoudiniCacheSubmitDeadlineModel(BaseSettingsModel):
     priority: int = SettingsField(title="Priority")
     chunk_size: int = SettingsField(title="Chunk Size")
     group: str = SettingsField(title="Group")
+    batch_submission: bool = SettingsField(
+        title="Batch submission",
+        description=(
+            "Jobs are submitted together with jobs of other instances"
+            " after all instances are processed."
+        )
+    )
 
 
 class AfterEffectsSubmitDeadlineModel(BaseSettingsModel):
@@ -249,6 +270,13 @@ class AfterEffectsSubmitDeadlineModel(BaseSettingsModel):
     group: str = SettingsField(title="Group")
     department: str = SettingsField(title="Department")
     multiprocess: bool = SettingsField(title="Optional")
+    batch_submission: bool = SettingsField(
+        title="Batch submission",
+        description=(
+            "Jobs are submitted together with jobs of other instances"
+            " after all instances are processed."
+        )
+    )
 
 
 class CelactionSubmitDeadlineModel(BaseSettingsModel):
@@ -407,7 +435,8 @@ DEFAULT_DEADLINE_PLUGINS_SETTINGS = {
         "chunk_size": 10000,
         "group": "",
         "department": "",
-        "multiprocess": True
+        "multiprocess": True,
+        "batch_submission": False
     },
     "BlenderSubmitDeadline": {
         "enabled": True,
@@ -446,7 +475,8 @@ DEFAULT_DEADLINE_PLUGINS_SETTINGS = {
         "priority": 50,
         "chunk_size": 10000,
         "group": "",
-        "department": ""
+        "department": "",
+        "batch_submission": False
     },
     "HoudiniCacheSubmitDeadline": {
         "enabled": True,
@@ -454,7 +484,8 @@ DEFAULT_DEADLINE_PLUGINS_SETTINGS = {
         "active": True,
         "priority": 50,
         "chunk_size": 999999,
-        "group": ""
+        "group": "",
+        "batch_submission": False
     },
     "HoudiniSubmitDeadline": {
         "enabled": True,
@@ -465,7 +496,8 @@ DEFAULT_DEADLINE_PLUGINS_SETTINGS = {
         "group": "",
         "export_priority": 50,
         "export_chunk_size": 10,
-        "export_group": ""
+        "export_group": "",
+        "batch_submission": False
     },
     "MaxSubmitDeadline": {
         "enabled": True,
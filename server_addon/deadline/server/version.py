@@ -1 +1 @@
-__version__ = "0.1.10"
+__version__ = "0.1.11"
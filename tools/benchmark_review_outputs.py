@@ -0,0 +1,174 @@
+"""Benchmark rendering of review outputs sharing the same input.
+
+Compares rendering of multiple review outputs with one ffmpeg command per
+output against one ffmpeg command rendering all outputs from single decoded
+input, as 'ExtractReview' does for outputs which can share the input.
+
+Input image sequence is generated with ffmpeg 'testsrc' source into
+temporary directory.
+
+Example:
+    python tools/benchmark_review_outputs.py --frames 200 --outputs 3
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+CLIENT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "client"
+)
+if CLIENT_DIR not in sys.path:
+    sys.path.insert(0, CLIENT_DIR)
+
+from ayon_core.lib import get_ffmpeg_tool_args  # noqa: E402
+from ayon_core.plugins.publish.extract_review import (  # noqa: E402
+    ExtractReview
+)
+
+
+def _run(cmd):
+    subprocess.check_call(
+        cmd,
+        shell=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+
+def generate_frames(dirpath, frames, width, height, fps):
+    """Render 'testsrc' PNG image sequence.
+
+    Args:
+        dirpath (str): Output directory.
+        frames (int): Number of frames.
+        width (int): Frame width.
+        height (int): Frame height.
+        fps (int): Frame rate of test source.
+
+    Returns:
+        str: Path to sequence with '%04d' frame pattern.
+    """
+
+    sequence_path = os.path.join(dirpath, "testsrc.%04d.png")
+    cmd = get_ffmpeg_tool_args(
+        "ffmpeg",
+        "-y",
+        "-f", "lavfi",
+        "-i", "testsrc=size={}x{}:rate={}".format(width, height, fps),
+        "-frames:v", str(frames),
+        "-start_number", "1",
+        sequence_path
+    )
+    subprocess.check_call(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return sequence_path
+
+
+def prepare_outputs(output_dir, outputs_count, width, height):
+    """Video filters and output arguments of review outputs.
+
+    Each output is scaled down to different resolution.
+
+    Returns:
+        list[tuple[list[str], list[str]]]: Video filters and output
+            arguments of each output.
+    """
+
+    outputs = []
+    for idx in range(outputs_count):
+        divider = 2 ** idx
+        output_path = os.path.join(output_dir, "output_{}.mp4".format(idx))
+        video_filters = ["scale={}:{}".format(
+            max(2, (width // divider) // 2 * 2),
+            max(2, (height // divider) // 2 * 2)
+        )]
+        output_args = [
+            "-c:v libx264",
+            "-pix_fmt yuv420p",
+            "-y",
+            "\"{}\"".format(output_path),
+        ]
+        outputs.append((video_filters, output_args))
+    return outputs
+
+
+def benchmark_separate(plugin, input_args, outputs):
+    start = time.time()
+    for video_filters, output_args in outputs:
+        cmd = " ".join(plugin.ffmpeg_full_args(
+            list(input_args), list(video_filters), [], list(output_args)
+        ))
+        _run(cmd)
+    return time.time() - start
+
+
+def benchmark_merged(plugin, input_args, outputs):
+    start = time.time()
+    cmd = " ".join(plugin.ffmpeg_multi_output_args(
+        list(input_args),
+        [
+            (list(video_filters), list(output_args), False)
+            for video_filters, output_args in outputs
+        ]
+    ))
+    _run(cmd)
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--fps", type=int, default=25)
+    parser.add_argument("--outputs", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="ayon_review_benchmark_")
+    try:
+        sequence_path = generate_frames(
+            tmp_dir, args.frames, args.width, args.height, args.fps
+        )
+        input_args = [
+            "-start_number 1",
+            "-framerate {}".format(args.fps),
+            "-i \"{}\"".format(sequence_path),
+        ]
+        outputs = prepare_outputs(
+            tmp_dir, args.outputs, args.width, args.height
+        )
+        plugin = ExtractReview()
+
+        separate_times = []
+        merged_times = []
+        for _ in range(args.repeats):
+            separate_times.append(
+                benchmark_separate(plugin, input_args, outputs)
+            )
+            merged_times.append(
+                benchmark_merged(plugin, input_args, outputs)
+            )
+
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    separate_time = min(separate_times)
+    merged_time = min(merged_times)
+    print("Frames: {} ({}x{}), outputs: {}, repeats: {}".format(
+        args.frames, args.width, args.height, args.outputs, args.repeats
+    ))
+    print("Separate commands: {:.3f}s".format(separate_time))
+    print("Merged command:    {:.3f}s".format(merged_time))
+    print("Speedup:           {:.2f}x".format(separate_time / merged_time))
+
+
+if __name__ == "__main__":
+    main()